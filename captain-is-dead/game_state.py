@@ -2,6 +2,9 @@ from typing import List, Dict, Tuple, Optional
 from models import SystemStatus, Location, SkillType, CharacterRole, AlertLevel, Threat, Character, CrisisCard
 import time
 import random
+import bisect
+import io
+import sys
 
 # ANSI color codes for terminal output
 class Colors:
@@ -15,6 +18,199 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# All game output goes through _log so it can be silenced by rebinding it (e.g. to a no-op)
+_log = print
+
+# Pre-colored templates for the per-action lines printed by play_turn
+_TURN_TMPL = f"\n{Colors.BOLD}{Colors.GREEN}🎮 %s's turn:{Colors.ENDC}"
+_THINK_TMPL = f"{Colors.CYAN}⏳ %s is thinking... (%d AP remaining){Colors.ENDC}"
+_END_TURN_TMPL = f"{Colors.YELLOW}Ending turn: %s{Colors.ENDC}"
+_ACTION_TMPL = f"{Colors.BOLD}ACTION:{Colors.ENDC} {Colors.YELLOW}%s{Colors.ENDC}"
+_REASON_TMPL = f"{Colors.BOLD}REASON:{Colors.ENDC} %s"
+_NOT_EXECUTED_TMPL = f"{Colors.YELLOW}Could not execute action: '%s'{Colors.ENDC}"
+_RESULT_TMPL = f"\n{Colors.CYAN}📝 RESULT: %s{Colors.ENDC}"
+_AP_REMAINING_TMPL = f"{Colors.CYAN}► %s has %d action points remaining.{Colors.ENDC}"
+_AP_SPENT_TMPL = f"{Colors.CYAN}► %s has used all action points.{Colors.ENDC}"
+
+# Fixed banners printed by run_game, each emitted with a single write
+_WELCOME_BANNER = "\n".join([
+    f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}",
+    f"{Colors.HEADER}{Colors.BOLD}{'THE CAPTAIN IS DEAD - SIMULATION':^60}{Colors.ENDC}",
+    f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}",
+    "\nThe captain is dead... Can you and your crew repair the Jump Core",
+    "and escape before the alien threats overwhelm your ship?\n",
+    "\nGame follows the board game turn structure:",
+    "1. Player spends their Action Points (AP)",
+    "2. Draw and resolve a Crisis Card",
+    "3. Next player's turn begins\n",
+])
+_TURN_RULE_OPEN = f"\n{Colors.BOLD}{Colors.BLUE}{'=' * 60}{Colors.ENDC}\n{Colors.BOLD}{Colors.BLUE}"
+_TURN_RULE_CLOSE = f"{Colors.ENDC}\n{Colors.BOLD}{Colors.BLUE}{'=' * 60}{Colors.ENDC}"
+_GAME_OVER_BANNER = "\n".join([
+    f"\n{Colors.BOLD}{Colors.RED}{'=' * 60}{Colors.ENDC}",
+    f"{Colors.BOLD}{Colors.RED}{'GAME OVER':^60}{Colors.ENDC}",
+    f"{Colors.BOLD}{Colors.RED}{'=' * 60}{Colors.ENDC}",
+])
+
+# Ship status display tables
+_ALERT_COLOR = {
+    AlertLevel.YELLOW: Colors.YELLOW,
+    AlertLevel.ORANGE: Colors.YELLOW,
+    AlertLevel.RED: Colors.RED,
+}
+_STATUS_COLOR = {
+    SystemStatus.ONLINE: Colors.GREEN,
+    SystemStatus.DAMAGED: Colors.YELLOW,
+    SystemStatus.OFFLINE: Colors.RED,
+}
+# Jump core progress bar for each progress level 0-5
+_PROGRESS_BARS = tuple(f"{Colors.CYAN}[{'█' * i}{'░' * (5 - i)}] {i}/5{Colors.ENDC}" for i in range(6))
+
+# Enum lookup tables, built once instead of scanning/sorting the enums on every action
+_LOC_BY_VALUE = {loc.value: loc for loc in Location}
+# Sorted by value to ensure deterministic selection when seed is set
+_LOCATIONS_SORTED = sorted(Location, key=lambda loc: loc.value)
+_SKILLS_SORTED = sorted(SkillType, key=lambda skill: skill.label)
+
+# Static lines of the game state description
+_SYSTEMS_HEADER = "Ship Systems:"
+_THREATS_HEADER = "Active Threats:"
+_NO_THREATS_LINE = "No active threats."
+_CHARACTERS_HEADER = "Characters:"
+
+def _threat_name(threat: Threat) -> str:
+    return threat.name
+
+# Alert level reached by one escalation step (Red is the ceiling)
+_NEXT_ALERT = {
+    AlertLevel.YELLOW: AlertLevel.ORANGE,
+    AlertLevel.ORANGE: AlertLevel.RED,
+    AlertLevel.RED: AlertLevel.RED,
+}
+
+# Systems whose loss ends the game, in the order they are reported
+_CRITICAL_SYSTEMS = ("Life Support", "Shields")
+
+# Available character templates, shared by every Game instance
+_CHARACTER_TEMPLATES = [
+    {
+        "name": "Alex Chen", 
+        "role": CharacterRole.ENGINEER,
+        "skills": {
+            SkillType.ENGINEERING: 3,
+            SkillType.TACTICAL: 1,
+            SkillType.SCIENCE: 2,
+            SkillType.MEDICAL: 0,
+            SkillType.LEADERSHIP: 1
+        },
+        "special_ability": "Can repair systems more efficiently",
+        "location": Location.ENGINEERING
+    },
+    {
+        "name": "Dr. Maya Patel", 
+        "role": CharacterRole.SCIENCE_OFFICER,
+        "skills": {
+            SkillType.ENGINEERING: 1,
+            SkillType.TACTICAL: 0,
+            SkillType.SCIENCE: 3,
+            SkillType.MEDICAL: 2,
+            SkillType.LEADERSHIP: 1
+        },
+        "special_ability": "Can analyze threats to find weaknesses",
+        "location": Location.SCIENCE_LAB
+    },
+    {
+        "name": "Commander Riz Jackson", 
+        "role": CharacterRole.TACTICAL_OFFICER,
+        "skills": {
+            SkillType.ENGINEERING: 0,
+            SkillType.TACTICAL: 3,
+            SkillType.SCIENCE: 1,
+            SkillType.MEDICAL: 0,
+            SkillType.LEADERSHIP: 2
+        },
+        "special_ability": "Can deal with threats more effectively",
+        "location": Location.WEAPONS_BAY
+    },
+    {
+        "name": "Dr. James Wilson", 
+        "role": CharacterRole.MEDICAL_OFFICER,
+        "skills": {
+            SkillType.ENGINEERING: 0,
+            SkillType.TACTICAL: 0,
+            SkillType.SCIENCE: 2,
+            SkillType.MEDICAL: 3,
+            SkillType.LEADERSHIP: 1
+        },
+        "special_ability": "Can heal and boost crew effectiveness",
+        "location": Location.SICK_BAY
+    },
+    {
+        "name": "Lt. Olivia Chen", 
+        "role": CharacterRole.COMMUNICATIONS_OFFICER,
+        "skills": {
+            SkillType.ENGINEERING: 1,
+            SkillType.TACTICAL: 1,
+            SkillType.SCIENCE: 1,
+            SkillType.MEDICAL: 0,
+            SkillType.LEADERSHIP: 3
+        },
+        "special_ability": "Can coordinate crew actions efficiently",
+        "location": Location.COMM_CENTER
+    },
+    {
+        "name": "Acting Captain Mira Novak", 
+        "role": CharacterRole.CAPTAIN,
+        "skills": {
+            SkillType.ENGINEERING: 1,
+            SkillType.TACTICAL: 2,
+            SkillType.SCIENCE: 1,
+            SkillType.MEDICAL: 0,
+            SkillType.LEADERSHIP: 3
+        },
+        "special_ability": "Can inspire crew to perform beyond their limits",
+        "location": Location.BRIDGE
+    },
+]
+
+# Available threat templates as Threat(name, description, difficulty) arguments;
+# instantiated per game since difficulty changes during play
+_THREAT_SPECS = (
+    ("System Cascade Failure", "Ship systems are failing one after another", 3),
+    ("Alien Boarding Party", "Hostile aliens have teleported aboard", 4),
+    ("Energy Drain", "Something is draining the ship's power reserves", 2),
+    ("Computer Malfunction", "Ship's computer is behaving erratically", 3),
+)
+
+# Crisis cards as CrisisCard(name, description, effect_type, severity) arguments
+_CRISIS_SPECS = (
+    ("System Failure", "A critical system has malfunctioned.", "system_damage", 2),
+    ("Alien Boarding", "Hostile aliens have boarded the ship.", "new_threat", 3),
+    ("Power Surge", "A power surge has affected ship systems.", "system_damage", 1),
+    ("Communications Interference", "Communications are being jammed.", "action_restriction", 2),
+    ("Hull Breach", "The ship's hull has been breached.", "system_damage", 3),
+    ("Navigation Error", "The ship's navigation is malfunctioning.", "system_damage", 2),
+    ("Alien Attack", "The ship is under attack from alien forces.", "new_threat", 3),
+    ("Life Support Failure", "Life support systems are failing.", "system_damage", 3),
+    ("Computer Virus", "Ship's computer has been infected with a virus.", "action_restriction", 2),
+    ("Sensor Malfunction", "Sensors are providing incorrect readings.", "system_damage", 1),
+)
+
+# Threats a crisis can spawn, as Threat arguments. Sorted by name to ensure
+# deterministic selection when seed is set.
+_CRISIS_THREAT_SPECS = tuple(sorted([
+    ("Alien Saboteur", "An alien has infiltrated the ship", 3),
+    ("Power Fluctuation", "Ship's power is unstable", 2),
+    ("Hull Breach", "The ship's hull has been breached", 4),
+    ("Navigation Error", "Ship's navigation is malfunctioning", 2),
+], key=lambda spec: spec[0]))
+
+
+def _spawn_threat() -> Threat:
+    """Pick a crisis threat at random and return a fresh instance of it"""
+    return Threat(*random.choice(_CRISIS_THREAT_SPECS))
+
+
 class GameState:
     def __init__(self):
         # Ship systems
@@ -30,13 +226,69 @@ class GameState:
         
         self.alert_level = AlertLevel.YELLOW
         self.jump_core_progress = 0  # 0-5 levels of progress
-        self.active_threats: List[Threat] = []
+        self.active_threats: List[Threat] = []  # Kept sorted by name, see add_threat
         self.characters: List[Character] = []
         self.current_character_index = 0
         self.crisis_deck: List[CrisisCard] = []
-        self.crisis_discard: List[CrisisCard] = []
+        self.crisis_cursor = 0  # Index of the next card to draw; cards before it are the discard pile
         self.last_crisis: Optional[CrisisCard] = None
         
+        # Number of critical systems currently OFFLINE, kept up to date by set_system_status
+        self._critical_offline = 0
+        # Systems by status, sorted by name; kept up to date by set_system_status so
+        # agents can read them without scanning the systems dict
+        self.usable_systems: List[str] = sorted(
+            system for system, status in self.systems.items() if status != SystemStatus.OFFLINE
+        )
+        self.damaged_systems: List[str] = sorted(
+            system for system, status in self.systems.items() if status == SystemStatus.DAMAGED
+        )
+        # Systems a crisis can damage (not OFFLINE, never the Jump Core), sorted to ensure
+        # deterministic selection when seed is set; kept up to date by set_system_status
+        self.damageable_systems: List[str] = sorted(
+            system for system, status in self.systems.items()
+            if status != SystemStatus.OFFLINE and system != "Jump Core"
+        )
+        
+        # Cached (fingerprint, description) pair for game_state_description
+        self._desc_cache: Tuple[Optional[tuple], Optional[str]] = (None, None)
+        
+    def set_system_status(self, system: str, status: SystemStatus):
+        """Change a system's status, keeping the critical-offline count and per-status lists in sync"""
+        previous = self.systems[system]
+        self.systems[system] = status
+        went_offline = status == SystemStatus.OFFLINE and previous != SystemStatus.OFFLINE
+        came_back = previous == SystemStatus.OFFLINE and status != SystemStatus.OFFLINE
+        if system in _CRITICAL_SYSTEMS:
+            self._critical_offline += went_offline - came_back
+        if went_offline:
+            self.usable_systems.remove(system)
+        elif came_back:
+            bisect.insort(self.usable_systems, system)
+        if system != "Jump Core":
+            if went_offline:
+                self.damageable_systems.remove(system)
+            elif came_back:
+                bisect.insort(self.damageable_systems, system)
+        if previous == SystemStatus.DAMAGED and status != SystemStatus.DAMAGED:
+            self.damaged_systems.remove(system)
+        elif status == SystemStatus.DAMAGED and previous != SystemStatus.DAMAGED:
+            bisect.insort(self.damaged_systems, system)
+    
+    def escalate_alert(self) -> bool:
+        """Raise the alert level one step, returns whether it changed"""
+        new_level = _NEXT_ALERT[self.alert_level]
+        changed = new_level is not self.alert_level
+        self.alert_level = new_level
+        return changed
+    
+    def add_threat(self, threat: Threat):
+        """Add a threat, keeping active_threats sorted by name for deterministic selection"""
+        bisect.insort(self.active_threats, threat, key=_threat_name)
+    
+    def remove_threat(self, threat: Threat):
+        self.active_threats.remove(threat)
+    
     def get_current_character(self) -> Character:
         return self.characters[self.current_character_index]
     
@@ -46,57 +298,71 @@ class GameState:
     
     def game_state_description(self) -> str:
         """Generate a text description of the current game state for LLM consumption"""
-        description = []
-        
-        # Alert level
-        description.append(f"Alert Level: {self.alert_level.value}")
-        
-        # Jump core progress
-        description.append(f"Jump Core Progress: {self.jump_core_progress}/5")
+        # The description is requested once per agent decision, often several times
+        # without any state change in between. The fingerprint covers every field the
+        # description renders, so a mutation anywhere automatically misses the cache.
+        key = (
+            self.alert_level,
+            self.jump_core_progress,
+            tuple(self.systems.values()),
+            tuple((t.name, t.difficulty) for t in self.active_threats),
+            tuple((c.name, c.location, c.action_points) for c in self.characters),
+            self.current_character_index,
+        )
+        if key == self._desc_cache[0]:
+            return self._desc_cache[1]
+        
+        # Header lines
+        description = [
+            f"Alert Level: {self.alert_level.value}",
+            f"Jump Core Progress: {self.jump_core_progress}/5",
+            _SYSTEMS_HEADER,
+        ]
         
         # Systems status
-        description.append("Ship Systems:")
-        for system, status in self.systems.items():
-            description.append(f"  - {system}: {status.value}")
+        description.extend(f"  - {system}: {status.label}" for system, status in self.systems.items())
         
         # Active threats
         if self.active_threats:
-            description.append("Active Threats:")
-            for threat in self.active_threats:
-                description.append(f"  - {threat}")
+            description.append(_THREATS_HEADER)
+            description.extend(f"  - {threat}" for threat in self.active_threats)
         else:
-            description.append("No active threats.")
+            description.append(_NO_THREATS_LINE)
         
         # Characters
-        description.append("Characters:")
-        for i, character in enumerate(self.characters):
-            if i == self.current_character_index:
-                description.append(f"  -> {character} (CURRENT TURN - {character.action_points} action points)")
-            else:
-                description.append(f"  - {character}")
-        
-        return "\n".join(description)
+        description.append(_CHARACTERS_HEADER)
+        current = self.current_character_index
+        description.extend(
+            f"  -> {character} (CURRENT TURN - {character.action_points} action points)" if i == current
+            else f"  - {character}"
+            for i, character in enumerate(self.characters)
+        )
+        
+        result = "\n".join(description)
+        self._desc_cache = (key, result)
+        return result
     
     def is_game_over(self) -> Tuple[bool, str]:
         """Check if the game is over, returns (is_over, result_message)"""
+        # Counter check first; the game ends as soon as either a critical system
+        # is lost or the jump core finishes, so they never need tie-breaking
+        if self._critical_offline:
+            for system in _CRITICAL_SYSTEMS:
+                if self.systems[system] is SystemStatus.OFFLINE:
+                    return True, f"Defeat! {system} has gone offline."
+        
         # Win condition
         if self.jump_core_progress >= 5:
             return True, "Victory! The jump core has been fully repaired and the ship has escaped."
         
-        # Lose conditions
-        critical_systems = ["Life Support", "Shields"]
-        for system in critical_systems:
-            if self.systems[system] == SystemStatus.OFFLINE:
-                return True, f"Defeat! {system} has gone offline."
-        
-        if self.alert_level == AlertLevel.RED and len(self.active_threats) > 3:
+        if self.alert_level is AlertLevel.RED and len(self.active_threats) > 3:
             return True, "Defeat! The ship has been overwhelmed by threats during Red Alert."
         
         return False, ""
 
 
 class Game:
-    def __init__(self, num_characters=2, num_threats=2, difficulty="normal", seed=None):
+    def __init__(self, num_characters=2, num_threats=2, difficulty="normal", seed=None, render=None):
         """
         Initialize the game with configurable complexity
         
@@ -105,7 +371,10 @@ class Game:
         - num_threats: int - Number of initial threats (0-4)
         - difficulty: str - Game difficulty level ("easy", "normal", "hard")
         - seed: int - Optional random seed for deterministic behavior (None for random)
+        - render: bool - Print the ship status, turn and crisis output and pause between
+          turns (None to render only when stdout is a terminal)
         """
+        self.render = sys.stdout.isatty() if render is None else render
         self.num_characters = max(1, min(6, num_characters))  # Clamp between 1-6
         self.num_threats = max(0, min(4, num_threats))  # Clamp between 0-4
         self.difficulty = difficulty
@@ -114,136 +383,52 @@ class Game:
         # Set random seed if provided
         if seed is not None:
             random.seed(seed)
-            print(f"Using deterministic mode with seed: {seed}")
+            self._print(f"Using deterministic mode with seed: {seed}")
         
         self.game_state = GameState()
         self.setup_game()
         
-    def setup_game(self):
-        """Initialize the game with characters, threats, etc."""
-        # Available character templates
-        character_templates = [
-            {
-                "name": "Alex Chen", 
-                "role": CharacterRole.ENGINEER,
-                "skills": {
-                    SkillType.ENGINEERING: 3,
-                    SkillType.TACTICAL: 1,
-                    SkillType.SCIENCE: 2,
-                    SkillType.MEDICAL: 0,
-                    SkillType.LEADERSHIP: 1
-                },
-                "special_ability": "Can repair systems more efficiently",
-                "location": Location.ENGINEERING
-            },
-            {
-                "name": "Dr. Maya Patel", 
-                "role": CharacterRole.SCIENCE_OFFICER,
-                "skills": {
-                    SkillType.ENGINEERING: 1,
-                    SkillType.TACTICAL: 0,
-                    SkillType.SCIENCE: 3,
-                    SkillType.MEDICAL: 2,
-                    SkillType.LEADERSHIP: 1
-                },
-                "special_ability": "Can analyze threats to find weaknesses",
-                "location": Location.SCIENCE_LAB
-            },
-            {
-                "name": "Commander Riz Jackson", 
-                "role": CharacterRole.TACTICAL_OFFICER,
-                "skills": {
-                    SkillType.ENGINEERING: 0,
-                    SkillType.TACTICAL: 3,
-                    SkillType.SCIENCE: 1,
-                    SkillType.MEDICAL: 0,
-                    SkillType.LEADERSHIP: 2
-                },
-                "special_ability": "Can deal with threats more effectively",
-                "location": Location.WEAPONS_BAY
-            },
-            {
-                "name": "Dr. James Wilson", 
-                "role": CharacterRole.MEDICAL_OFFICER,
-                "skills": {
-                    SkillType.ENGINEERING: 0,
-                    SkillType.TACTICAL: 0,
-                    SkillType.SCIENCE: 2,
-                    SkillType.MEDICAL: 3,
-                    SkillType.LEADERSHIP: 1
-                },
-                "special_ability": "Can heal and boost crew effectiveness",
-                "location": Location.SICK_BAY
-            },
-            {
-                "name": "Lt. Olivia Chen", 
-                "role": CharacterRole.COMMUNICATIONS_OFFICER,
-                "skills": {
-                    SkillType.ENGINEERING: 1,
-                    SkillType.TACTICAL: 1,
-                    SkillType.SCIENCE: 1,
-                    SkillType.MEDICAL: 0,
-                    SkillType.LEADERSHIP: 3
-                },
-                "special_ability": "Can coordinate crew actions efficiently",
-                "location": Location.COMM_CENTER
-            },
-            {
-                "name": "Acting Captain Mira Novak", 
-                "role": CharacterRole.CAPTAIN,
-                "skills": {
-                    SkillType.ENGINEERING: 1,
-                    SkillType.TACTICAL: 2,
-                    SkillType.SCIENCE: 1,
-                    SkillType.MEDICAL: 0,
-                    SkillType.LEADERSHIP: 3
-                },
-                "special_ability": "Can inspire crew to perform beyond their limits",
-                "location": Location.BRIDGE
-            },
-        ]
+        # Output of the turn in progress, see _log_turn
+        self._turn_log: List[str] = []
         
-        # Available threat templates
-        threat_templates = [
-            Threat("System Cascade Failure", "Ship systems are failing one after another", 3),
-            Threat("Alien Boarding Party", "Hostile aliens have teleported aboard", 4),
-            Threat("Energy Drain", "Something is draining the ship's power reserves", 2),
-            Threat("Computer Malfunction", "Ship's computer is behaving erratically", 3)
-        ]
+        # Action type -> handler(character, params) returning (executed, result)
+        self._action_handlers = {
+            "move": self._handle_move,
+            "repair": self._handle_repair,
+            "use_system": self._handle_use_system,
+            "battle": self._handle_battle,
+        }
+        
+        # Crisis effect type -> handler(amplified)
+        self._crisis_handlers = {
+            "system_damage": self._apply_system_damage,
+            "new_threat": self._apply_new_threat,
+            "action_restriction": self._apply_action_restriction,
+        }
         
+    def setup_game(self):
+        """Initialize the game with characters, threats, etc."""
         # Initialize characters based on the requested number
-        selected_templates = character_templates[:self.num_characters]
+        selected_templates = _CHARACTER_TEMPLATES[:self.num_characters]
         self.game_state.characters = []
         
         for template in selected_templates:
             char = Character(
                 name=template["name"],
                 role=template["role"],
-                skills=template["skills"],
+                skills=[template["skills"].get(skill, 0) for skill in SkillType],
                 special_ability=template["special_ability"],
                 location=template["location"]
             )
             self.game_state.characters.append(char)
         
         # Initialize threats based on the requested number
-        selected_threats = threat_templates[:self.num_threats]
-        self.game_state.active_threats = selected_threats.copy()
-        
-        # Initialize crisis cards
-        crisis_templates = [
-            CrisisCard("System Failure", "A critical system has malfunctioned.", "system_damage", 2),
-            CrisisCard("Alien Boarding", "Hostile aliens have boarded the ship.", "new_threat", 3),
-            CrisisCard("Power Surge", "A power surge has affected ship systems.", "system_damage", 1),
-            CrisisCard("Communications Interference", "Communications are being jammed.", "action_restriction", 2),
-            CrisisCard("Hull Breach", "The ship's hull has been breached.", "system_damage", 3),
-            CrisisCard("Navigation Error", "The ship's navigation is malfunctioning.", "system_damage", 2),
-            CrisisCard("Alien Attack", "The ship is under attack from alien forces.", "new_threat", 3),
-            CrisisCard("Life Support Failure", "Life support systems are failing.", "system_damage", 3),
-            CrisisCard("Computer Virus", "Ship's computer has been infected with a virus.", "action_restriction", 2),
-            CrisisCard("Sensor Malfunction", "Sensors are providing incorrect readings.", "system_damage", 1),
-        ]
+        # Threats carry a mutable difficulty, so each game gets fresh instances
+        for spec in _THREAT_SPECS[:self.num_threats]:
+            self.game_state.add_threat(Threat(*spec))
         
-        self.game_state.crisis_deck = crisis_templates.copy()
+        # Initialize crisis cards (fresh instances built from the immutable specs)
+        self.game_state.crisis_deck = [CrisisCard(*spec) for spec in _CRISIS_SPECS]
         
         # Shuffle the crisis deck (will be deterministic if seed was set)
         random.shuffle(self.game_state.crisis_deck)
@@ -261,18 +446,36 @@ class Game:
             for threat in self.game_state.active_threats:
                 threat.difficulty += 1
             # Reduce the initial status of some systems
-            self.game_state.systems["Shields"] = SystemStatus.DAMAGED
+            self.game_state.set_system_status("Shields", SystemStatus.DAMAGED)
             # Set a higher alert level
             self.game_state.alert_level = AlertLevel.ORANGE
             # Reduce action points
             for char in self.game_state.characters:
                 char.action_points = 3  # One less action point in hard mode
         
-    def create_agents(self, model="gemini-2.0-flash-lite"):
+    def create_agents(self, model="gemini-2.0-flash-lite", use_native_tools=True, cache=False):
         """Create LLM agents for all characters"""
         from llm_agent import LLMAgent
-        self.agents = [LLMAgent(character, model) for character in self.game_state.characters]
-        
+        self.agents = [LLMAgent(character, model, use_native_tools, cache) for character in self.game_state.characters]
+        # Map each character (by identity) to its agent for O(1) lookup in play_turn
+        self._agent_by_char = {id(agent.character): agent for agent in self.agents}
+        
+    def _print(self, *args, **kwargs):
+        """Print through _log, unless rendering is turned off"""
+        if self.render:
+            _log(*args, **kwargs)
+    
+    def _log_turn(self, line: str):
+        """Queue a line of turn output; written out by _flush_turn_log"""
+        if self.render:
+            self._turn_log.append(line)
+    
+    def _flush_turn_log(self):
+        """Write all queued turn output in a single call"""
+        if self._turn_log:
+            _log("\n".join(self._turn_log))
+            self._turn_log.clear()
+    
     def play_turn(self):
         """
         Play a single character's turn following the board game structure:
@@ -283,272 +486,97 @@ class Game:
         current_character = self.game_state.get_current_character()
         
         # Find the agent for the current character
-        current_agent = next(agent for agent in self.agents if agent.character == current_character)
+        current_agent = self._agent_by_char[id(current_character)]
+        
+        # Output lines are only formatted when rendering
+        render = self.render
         
         # Display turn header for this character
-        print(f"\n{Colors.BOLD}{Colors.GREEN}🎮 {current_character.name}'s turn:{Colors.ENDC}")
+        self._log_turn(_TURN_TMPL % current_character.name)
         
         # Step 1: Player spends their Action Points
-        action_points_remaining = current_character.action_points
-        while action_points_remaining > 0:
+        # The character's action_points double as the turn counter, so handlers
+        # (e.g. Life Support) can grant extra points mid-turn
+        while current_character.action_points > 0:
             # Get the agent's action
-            print(f"{Colors.CYAN}⏳ {current_character.name} is thinking... ({action_points_remaining} AP remaining){Colors.ENDC}")
+            if render:
+                self._log_turn(_THINK_TMPL % (current_character.name, current_character.action_points))
+                self._flush_turn_log()  # Show everything so far before the agent blocks on its LLM call
             action_data = current_agent.get_action(self.game_state)
             
             action_type = action_data.get("action_type", "unknown")
+            params = action_data.get("parameters") or {}
             action_executed = False
             action_result = ""
             action_cost = 1  # Default action cost
             
             # Skip turn if it's not this character's turn or if they choose to end their turn
             if action_type == "skip" or action_type == "end_turn":
-                print(f"{Colors.YELLOW}Ending turn: {action_data.get('reason', 'Character chose to end their turn')}{Colors.ENDC}")
+                if render:
+                    self._log_turn(_END_TURN_TMPL % (action_data.get('reason', 'Character chose to end their turn'),))
                 break
                 
             # Handle text_response (fallback to old method)
             if action_type == "text_response":
                 content = action_data.get("content", "")
-                print(content)
+                self._log_turn(str(content))
                 
                 # Basic fallback parsing (minimal support for old method)
                 if "MOVE" in content.upper():
-                    print(f"{Colors.YELLOW}Using fallback parsing for text response.{Colors.ENDC}")
-                    action_points_remaining -= 1
+                    self._log_turn(f"{Colors.YELLOW}Using fallback parsing for text response.{Colors.ENDC}")
+                    current_character.action_points -= 1
                     continue
                     
             # Display the action and reason
-            if action_type != "text_response":
+            if render and action_type != "text_response":
                 action_display = f"{action_type.upper()}"
                 if "parameters" in action_data:
-                    params = action_data["parameters"]
-                    param_str = ", ".join([f"{k}='{v}'" for k, v in params.items()])
+                    param_str = ", ".join(f"{k}='{v}'" for k, v in params.items())
                     action_display += f"({param_str})"
                     
-                print(f"{Colors.BOLD}ACTION:{Colors.ENDC} {Colors.YELLOW}{action_display}{Colors.ENDC}")
+                self._log_turn(_ACTION_TMPL % action_display)
                 
                 if "reason" in action_data:
-                    print(f"{Colors.BOLD}REASON:{Colors.ENDC} {action_data['reason']}")
+                    self._log_turn(_REASON_TMPL % (action_data['reason'],))
             
-            # Process each action type
-            if action_type == "move":
-                # Extract destination from parameters
-                if "destination" in action_data.get("parameters", {}):
-                    destination_str = action_data["parameters"]["destination"]
-                    destination = None
-                    
-                    # Find the matching Location enum
-                    for loc in Location:
-                        if loc.value == destination_str:
-                            destination = loc
-                            break
-                    
-                    if destination:
-                        # Update character location
-                        old_location = current_character.location
-                        current_character.location = destination
-                        action_executed = True
-                        action_result = f"{current_character.name} moved from {old_location.value} to {destination.value}."
-                    else:
-                        action_result = f"Invalid location: {destination_str}"
-                else:
-                    action_result = "No destination specified for movement."
-                    
-            elif action_type == "repair":
-                # Extract system to repair from parameters
-                if "system" in action_data.get("parameters", {}):
-                    system_to_repair = action_data["parameters"]["system"]
-                    
-                    if system_to_repair in self.game_state.systems:
-                        system_status = self.game_state.systems[system_to_repair]
-                        
-                        if system_status == SystemStatus.ONLINE:
-                            action_result = f"{system_to_repair} is already online and functioning correctly."
-                        else:
-                            # Check if character has sufficient engineering skill
-                            engineering_skill = current_character.skills.get(SkillType.ENGINEERING, 0)
-                            
-                            if system_to_repair == "Jump Core":
-                                # Jump Core requires special handling
-                                if engineering_skill >= 2:
-                                    # Progress the jump core by 1 step
-                                    self.game_state.jump_core_progress += 1
-                                    action_executed = True
-                                    action_result = f"{current_character.name} made progress on the Jump Core! Progress: {self.game_state.jump_core_progress}/5"
-                                    
-                                    # If fully repaired, set system status to online
-                                    if self.game_state.jump_core_progress >= 5:
-                                        self.game_state.systems["Jump Core"] = SystemStatus.ONLINE
-                                        action_result += " Jump Core is now fully repaired and ONLINE!"
-                                else:
-                                    action_result = f"Insufficient Engineering skill to repair Jump Core. Required: 2, Current: {engineering_skill}"
-                            else:
-                                # Regular system repair
-                                if engineering_skill >= 1:
-                                    if system_status == SystemStatus.DAMAGED:
-                                        self.game_state.systems[system_to_repair] = SystemStatus.ONLINE
-                                        action_executed = True
-                                        action_result = f"{current_character.name} repaired {system_to_repair}! It is now ONLINE."
-                                    elif system_status == SystemStatus.OFFLINE:
-                                        self.game_state.systems[system_to_repair] = SystemStatus.DAMAGED
-                                        action_executed = True
-                                        action_result = f"{current_character.name} partially repaired {system_to_repair}. It is now DAMAGED but functional."
-                                else:
-                                    action_result = f"Insufficient Engineering skill to repair {system_to_repair}. Required: 1, Current: {engineering_skill}"
-                    else:
-                        action_result = f"Unknown system: {system_to_repair}"
-                else:
-                    action_result = "No system specified for repair."
-                    
-            elif action_type == "use_system":
-                # Extract system to use from parameters
-                if "system" in action_data.get("parameters", {}):
-                    system_to_use = action_data["parameters"]["system"]
-                    
-                    if system_to_use in self.game_state.systems:
-                        # Check if system is online or damaged
-                        system_status = self.game_state.systems[system_to_use]
-                        
-                        if system_status == SystemStatus.OFFLINE:
-                            action_result = f"Cannot use {system_to_use} because it is OFFLINE."
-                        else:
-                            # System is either ONLINE or DAMAGED
-                            action_executed = True
-                            
-                            # Handle specific system effects
-                            if system_to_use == "Shields":
-                                # Improve shields - reduce threat level
-                                if self.game_state.active_threats:
-                                    # Sort threats to ensure deterministic selection when seed is set
-                                    sorted_threats = sorted(self.game_state.active_threats, key=lambda t: t.name)
-                                    threat = random.choice(sorted_threats)
-                                    threat.difficulty = max(1, threat.difficulty - 1)
-                                    action_result = f"{current_character.name} reinforced the Shields! Reduced threat level of {threat.name} to {threat.difficulty}."
-                                else:
-                                    action_result = f"{current_character.name} reinforced the Shields, but there are no active threats."
-                            
-                            elif system_to_use == "Sensors":
-                                # Scan for threats - provide info
-                                if self.game_state.active_threats:
-                                    threats_info = "\n".join([f"  • {t.name}: {t.description} (Difficulty: {t.difficulty})" for t in self.game_state.active_threats])
-                                    action_result = f"{current_character.name} used the Sensors to scan active threats:\n{threats_info}"
-                                else:
-                                    action_result = f"{current_character.name} used the Sensors but detected no active threats."
-                            
-                            elif system_to_use == "Teleporter":
-                                # Teleport to another location
-                                possible_locations = list(Location)
-                                # Sort locations to ensure deterministic selection when seed is set
-                                possible_locations.sort(key=lambda loc: loc.value)
-                                new_location = random.choice(possible_locations)
-                                old_location = current_character.location
-                                current_character.location = new_location
-                                action_result = f"{current_character.name} used the Teleporter to move from {old_location.value} to {new_location.value}."
-                            
-                            elif system_to_use == "Targeting Computer":
-                                # Reduce a threat's difficulty
-                                if self.game_state.active_threats:
-                                    # Sort threats to ensure deterministic selection when seed is set
-                                    sorted_threats = sorted(self.game_state.active_threats, key=lambda t: t.name)
-                                    threat = random.choice(sorted_threats)
-                                    threat.difficulty = max(1, threat.difficulty - 1)
-                                    action_result = f"{current_character.name} used the Targeting Computer to analyze {threat.name}! Reduced its difficulty to {threat.difficulty}."
-                                else:
-                                    action_result = f"{current_character.name} used the Targeting Computer, but there are no active threats."
-                            
-                            elif system_to_use == "Holodeck":
-                                # Generate a simulation to practice - boost a random skill
-                                skill_types = list(SkillType)
-                                # Sort skills to ensure deterministic selection when seed is set
-                                skill_types.sort(key=lambda skill: skill.value)
-                                skill_to_boost = random.choice(skill_types)
-                                current_skill = current_character.skills.get(skill_to_boost, 0)
-                                current_character.skills[skill_to_boost] = min(5, current_skill + 1)  # Cap at 5
-                                action_result = f"{current_character.name} used the Holodeck to practice! {skill_to_boost.value} skill increased to {current_character.skills[skill_to_boost]}."
-                            
-                            elif system_to_use == "Life Support":
-                                # Improve life support - give extra action point
-                                current_character.action_points += 1
-                                action_points_remaining += 1
-                                action_result = f"{current_character.name} optimized Life Support systems! Gained 1 extra action point (total: {action_points_remaining})."
-                            
-                            else:
-                                action_result = f"{current_character.name} used {system_to_use}, but it had no specific effect."
-                    else:
-                        action_result = f"Unknown system: {system_to_use}"
-                else:
-                    action_result = "No system specified to use."
-                    
-            elif action_type == "battle":
-                # Extract threat to battle from parameters
-                if "threat" in action_data.get("parameters", {}):
-                    threat_name = action_data["parameters"]["threat"]
-                    
-                    # Find the matching threat
-                    threat_to_battle = None
-                    for threat in self.game_state.active_threats:
-                        if threat.name == threat_name:
-                            threat_to_battle = threat
-                            break
-                    
-                    if threat_to_battle:
-                        # Check if character has sufficient tactical skill
-                        tactical_skill = current_character.skills.get(SkillType.TACTICAL, 0)
-                        
-                        if tactical_skill >= (threat_to_battle.difficulty - 1):  # Allow for some chance of success
-                            # Success chance based on skill vs difficulty
-                            success_chance = min(0.9, 0.5 + (tactical_skill - threat_to_battle.difficulty) * 0.2)
-                            
-                            # Use a deterministic approach for battle outcomes when seed is set
-                            battle_roll = random.random()  # Will be deterministic if seed was set
-                            if battle_roll < success_chance:
-                                # Successfully defeated the threat
-                                self.game_state.active_threats.remove(threat_to_battle)
-                                action_executed = True
-                                action_result = f"{current_character.name} successfully defeated the {threat_to_battle.name} threat!"
-                            else:
-                                # Failed to defeat the threat
-                                action_executed = True
-                                # The threat gets stronger
-                                threat_to_battle.difficulty += 1
-                                action_result = f"{current_character.name} failed to defeat {threat_to_battle.name}! The threat has grown stronger (Difficulty: {threat_to_battle.difficulty})."
-                        else:
-                            action_result = f"Insufficient Tactical skill to battle {threat_to_battle.name}. Required: {threat_to_battle.difficulty - 1}, Current: {tactical_skill}"
-                    else:
-                        action_result = f"Unknown threat: {threat_name}"
-                else:
-                    action_result = "No threat specified for battle."
+            # Dispatch to the handler for this action type
+            handler = self._action_handlers.get(action_type)
+            if handler:
+                action_executed, action_result = handler(current_character, params)
             
             # If no specific action was recognized or executed
             if not action_executed and action_type not in ["skip", "text_response", "end_turn"]:
-                print(f"{Colors.YELLOW}Could not execute action: '{action_type}'{Colors.ENDC}")
-                action_points_remaining -= 1  # Still consume an action point
+                if render:
+                    self._log_turn(_NOT_EXECUTED_TMPL % (action_type,))
+                current_character.action_points -= 1  # Still consume an action point
                 action_result = "Action could not be executed. Lost 1 action point."
             elif action_executed:
                 # Consume action points for the executed action
-                action_points_remaining -= action_cost
+                current_character.action_points -= action_cost
             
-            # Display the result of the action
-            if action_result:
-                print(f"\n{Colors.CYAN}📝 RESULT: {action_result}{Colors.ENDC}")
-            
-            # Show remaining action points
-            print(f"{Colors.CYAN}► {current_character.name} has {action_points_remaining} action points remaining.{Colors.ENDC}")
+            if render:
+                # Display the result of the action
+                if action_result:
+                    self._log_turn(_RESULT_TMPL % action_result)
+                
+                # Show remaining action points
+                self._log_turn(_AP_REMAINING_TMPL % (current_character.name, current_character.action_points))
             
             # Check if game is over after this action
             game_over, message = self.game_state.is_game_over()
             if game_over:
+                self._flush_turn_log()
                 return True, message
                 
             # If no more action points, break the loop
-            if action_points_remaining <= 0:
-                print(f"{Colors.CYAN}► {current_character.name} has used all action points.{Colors.ENDC}")
+            if current_character.action_points <= 0:
+                if render:
+                    self._log_turn(_AP_SPENT_TMPL % current_character.name)
                 break
         
-        # Update the character's action points
-        current_character.action_points = action_points_remaining
-        
         # Step 2: Draw and resolve a Crisis Card
-        print(f"\n{Colors.BOLD}{Colors.RED}🚨 CRISIS PHASE{Colors.ENDC}")
+        self._log_turn(f"\n{Colors.BOLD}{Colors.RED}🚨 CRISIS PHASE{Colors.ENDC}")
+        self._flush_turn_log()
         self.draw_crisis_card()
         
         # Check if game is over after crisis
@@ -558,142 +586,283 @@ class Game:
             
         # Step 3: Next player's turn begins
         self.game_state.next_character_turn()
-        print(f"\n{Colors.CYAN}► Next character's turn will begin.{Colors.ENDC}")
+        self._log_turn(f"\n{Colors.CYAN}► Next character's turn will begin.{Colors.ENDC}")
+        self._flush_turn_log()
         
         return False, ""
         
+    def _handle_move(self, character: Character, params: dict) -> Tuple[bool, str]:
+        """Move the character to the requested location"""
+        if "destination" not in params:
+            return False, "No destination specified for movement."
+        destination_str = params["destination"]
+        
+        # Find the matching Location enum
+        destination = _LOC_BY_VALUE.get(destination_str)
+        if not destination:
+            return False, f"Invalid location: {destination_str}"
+        
+        # Update character location
+        old_location = character.location
+        character.location = destination
+        return True, f"{character.name} moved from {old_location.value} to {destination.value}."
+    
+    def _handle_repair(self, character: Character, params: dict) -> Tuple[bool, str]:
+        """Repair a damaged/offline system or progress the Jump Core"""
+        if "system" not in params:
+            return False, "No system specified for repair."
+        system_to_repair = params["system"]
+        
+        if system_to_repair not in self.game_state.systems:
+            return False, f"Unknown system: {system_to_repair}"
+        system_status = self.game_state.systems[system_to_repair]
+        
+        if system_status == SystemStatus.ONLINE:
+            return False, f"{system_to_repair} is already online and functioning correctly."
+        
+        # Check if character has sufficient engineering skill
+        engineering_skill = character.skills[SkillType.ENGINEERING]
+        
+        if system_to_repair == "Jump Core":
+            # Jump Core requires special handling
+            if engineering_skill < 2:
+                return False, f"Insufficient Engineering skill to repair Jump Core. Required: 2, Current: {engineering_skill}"
+            
+            # Progress the jump core by 1 step
+            self.game_state.jump_core_progress += 1
+            action_result = f"{character.name} made progress on the Jump Core! Progress: {self.game_state.jump_core_progress}/5"
+            
+            # If fully repaired, set system status to online
+            if self.game_state.jump_core_progress >= 5:
+                self.game_state.set_system_status("Jump Core", SystemStatus.ONLINE)
+                action_result += " Jump Core is now fully repaired and ONLINE!"
+            return True, action_result
+        
+        # Regular system repair
+        if engineering_skill < 1:
+            return False, f"Insufficient Engineering skill to repair {system_to_repair}. Required: 1, Current: {engineering_skill}"
+        if system_status == SystemStatus.DAMAGED:
+            self.game_state.set_system_status(system_to_repair, SystemStatus.ONLINE)
+            return True, f"{character.name} repaired {system_to_repair}! It is now ONLINE."
+        self.game_state.set_system_status(system_to_repair, SystemStatus.DAMAGED)
+        return True, f"{character.name} partially repaired {system_to_repair}. It is now DAMAGED but functional."
+    
+    def _handle_use_system(self, character: Character, params: dict) -> Tuple[bool, str]:
+        """Use a ship system for its special effect"""
+        if "system" not in params:
+            return False, "No system specified to use."
+        system_to_use = params["system"]
+        
+        if system_to_use not in self.game_state.systems:
+            return False, f"Unknown system: {system_to_use}"
+        
+        # Check if system is online or damaged
+        if self.game_state.systems[system_to_use] == SystemStatus.OFFLINE:
+            return False, f"Cannot use {system_to_use} because it is OFFLINE."
+        
+        # System is either ONLINE or DAMAGED - handle specific system effects
+        if system_to_use == "Shields":
+            # Improve shields - reduce threat level
+            if not self.game_state.active_threats:
+                return True, f"{character.name} reinforced the Shields, but there are no active threats."
+            # active_threats is kept sorted by name, so the selection is deterministic when seed is set
+            threat = random.choice(self.game_state.active_threats)
+            threat.difficulty = max(1, threat.difficulty - 1)
+            return True, f"{character.name} reinforced the Shields! Reduced threat level of {threat.name} to {threat.difficulty}."
+        
+        if system_to_use == "Sensors":
+            # Scan for threats - provide info
+            if not self.game_state.active_threats:
+                return True, f"{character.name} used the Sensors but detected no active threats."
+            threats_info = "\n".join(f"  • {t.name}: {t.description} (Difficulty: {t.difficulty})" for t in self.game_state.active_threats)
+            return True, f"{character.name} used the Sensors to scan active threats:\n{threats_info}"
+        
+        if system_to_use == "Teleporter":
+            # Teleport to another location
+            new_location = random.choice(_LOCATIONS_SORTED)
+            old_location = character.location
+            character.location = new_location
+            return True, f"{character.name} used the Teleporter to move from {old_location.value} to {new_location.value}."
+        
+        if system_to_use == "Targeting Computer":
+            # Reduce a threat's difficulty
+            if not self.game_state.active_threats:
+                return True, f"{character.name} used the Targeting Computer, but there are no active threats."
+            # active_threats is kept sorted by name, so the selection is deterministic when seed is set
+            threat = random.choice(self.game_state.active_threats)
+            threat.difficulty = max(1, threat.difficulty - 1)
+            return True, f"{character.name} used the Targeting Computer to analyze {threat.name}! Reduced its difficulty to {threat.difficulty}."
+        
+        if system_to_use == "Holodeck":
+            # Generate a simulation to practice - boost a random skill
+            skill_to_boost = random.choice(_SKILLS_SORTED)
+            boosted = min(5, character.skills[skill_to_boost] + 1)  # Cap at 5
+            character.set_skill(skill_to_boost, boosted)
+            return True, f"{character.name} used the Holodeck to practice! {skill_to_boost.label} skill increased to {boosted}."
+        
+        if system_to_use == "Life Support":
+            # Improve life support - give extra action point
+            character.action_points += 1
+            return True, f"{character.name} optimized Life Support systems! Gained 1 extra action point (total: {character.action_points})."
+        
+        return True, f"{character.name} used {system_to_use}, but it had no specific effect."
+    
+    def _handle_battle(self, character: Character, params: dict) -> Tuple[bool, str]:
+        """Battle an active threat"""
+        if "threat" not in params:
+            return False, "No threat specified for battle."
+        threat_name = params["threat"]
+        
+        # Find the matching threat
+        threat_to_battle = None
+        for threat in self.game_state.active_threats:
+            if threat.name == threat_name:
+                threat_to_battle = threat
+                break
+        
+        if not threat_to_battle:
+            return False, f"Unknown threat: {threat_name}"
+        
+        # Check if character has sufficient tactical skill
+        tactical_skill = character.skills[SkillType.TACTICAL]
+        if tactical_skill < (threat_to_battle.difficulty - 1):  # Allow for some chance of success
+            return False, f"Insufficient Tactical skill to battle {threat_to_battle.name}. Required: {threat_to_battle.difficulty - 1}, Current: {tactical_skill}"
+        
+        # Success chance based on skill vs difficulty
+        success_chance = min(0.9, 0.5 + (tactical_skill - threat_to_battle.difficulty) * 0.2)
+        
+        # Use a deterministic approach for battle outcomes when seed is set
+        battle_roll = random.random()  # Will be deterministic if seed was set
+        if battle_roll < success_chance:
+            # Successfully defeated the threat
+            self.game_state.remove_threat(threat_to_battle)
+            return True, f"{character.name} successfully defeated the {threat_to_battle.name} threat!"
+        
+        # Failed to defeat the threat - the threat gets stronger
+        threat_to_battle.difficulty += 1
+        return True, f"{character.name} failed to defeat {threat_to_battle.name}! The threat has grown stronger (Difficulty: {threat_to_battle.difficulty})."
+        
     def display_ship_status(self):
         """Display the ship's current status in a visually appealing way"""
+        if not self.render:
+            return
+        
+        # Render the whole frame first and write it out in one go
+        buf = io.StringIO()
+        self._render_ship_status(buf)
+        _log(buf.getvalue(), end="")
+        sys.stdout.flush()
+        
+    def _render_ship_status(self, buf: io.StringIO):
+        """Write the ship status frame shown by display_ship_status into buf"""
         gs = self.game_state
+        # Local aliases for the colors used throughout this method
+        bold, endc, red, green, blue = Colors.BOLD, Colors.ENDC, Colors.RED, Colors.GREEN, Colors.BLUE
         
         # Show alert level with appropriate color
-        alert_color = Colors.YELLOW
-        if gs.alert_level == AlertLevel.ORANGE:
-            alert_color = Colors.YELLOW
-        elif gs.alert_level == AlertLevel.RED:
-            alert_color = Colors.RED
-            
-        print(f"\n{Colors.BOLD}🚨 ALERT STATUS:{Colors.ENDC} {alert_color}{gs.alert_level.value}{Colors.ENDC}")
+        buf.write(f"\n{bold}🚨 ALERT STATUS:{endc} {_ALERT_COLOR[gs.alert_level]}{gs.alert_level.value}{endc}\n")
         
         # Jump core progress
-        progress_bar = "█" * gs.jump_core_progress + "░" * (5 - gs.jump_core_progress)
-        print(f"{Colors.BOLD}🚀 JUMP CORE PROGRESS:{Colors.ENDC} {Colors.CYAN}[{progress_bar}] {gs.jump_core_progress}/5{Colors.ENDC}")
+        buf.write(f"{bold}🚀 JUMP CORE PROGRESS:{endc} {_PROGRESS_BARS[gs.jump_core_progress]}\n")
         
         # Last crisis card
         if gs.last_crisis:
-            print(f"\n{Colors.BOLD}🚨 LAST CRISIS:{Colors.ENDC} {Colors.RED}{gs.last_crisis.name}{Colors.ENDC}")
-            print(f"  {gs.last_crisis.description} (Severity: {gs.last_crisis.severity})")
+            buf.write(f"\n{bold}🚨 LAST CRISIS:{endc} {red}{gs.last_crisis.name}{endc}\n")
+            buf.write(f"  {gs.last_crisis.description} (Severity: {gs.last_crisis.severity})\n")
         
         # Systems status with appropriate colors
-        print(f"\n{Colors.BOLD}📊 SHIP SYSTEMS:{Colors.ENDC}")
+        buf.write(f"\n{bold}📊 SHIP SYSTEMS:{endc}\n")
         for system, status in gs.systems.items():
-            if status == SystemStatus.ONLINE:
-                status_color = Colors.GREEN
-            elif status == SystemStatus.DAMAGED:
-                status_color = Colors.YELLOW
-            else:  # OFFLINE
-                status_color = Colors.RED
-                
-            print(f"  • {system}: {status_color}{status.value}{Colors.ENDC}")
+            buf.write(f"  • {system}: {_STATUS_COLOR[status]}{status.label}{endc}\n")
         
         # Active threats
         if gs.active_threats:
-            print(f"\n{Colors.BOLD}⚠️ ACTIVE THREATS:{Colors.ENDC}")
+            buf.write(f"\n{bold}⚠️ ACTIVE THREATS:{endc}\n")
             for threat in gs.active_threats:
-                print(f"  • {Colors.RED}{threat.name}{Colors.ENDC} (Difficulty: {threat.difficulty})")
-                print(f"    {threat.description}")
+                buf.write(f"  • {red}{threat.name}{endc} (Difficulty: {threat.difficulty})\n")
+                buf.write(f"    {threat.description}\n")
         else:
-            print(f"\n{Colors.BOLD}⚠️ ACTIVE THREATS:{Colors.ENDC} {Colors.GREEN}None{Colors.ENDC}")
+            buf.write(f"\n{bold}⚠️ ACTIVE THREATS:{endc} {green}None{endc}\n")
         
         # Characters
-        print(f"\n{Colors.BOLD}👥 CREW STATUS:{Colors.ENDC}")
+        buf.write(f"\n{bold}👥 CREW STATUS:{endc}\n")
         for i, character in enumerate(gs.characters):
             if i == gs.current_character_index:
-                char_color = Colors.GREEN
-                active = f" {Colors.BOLD}[ACTIVE - {character.action_points} AP]{Colors.ENDC}"
+                char_color = green
+                active = f" {bold}[ACTIVE - {character.action_points} AP]{endc}"
             else:
-                char_color = Colors.BLUE
+                char_color = blue
                 active = ""
                 
-            print(f"  • {char_color}{character.name}{Colors.ENDC} ({character.role.value}) at {character.location.value}{active}")
-            skills_str = ", ".join([f"{skill.value}: {level}" for skill, level in character.skills.items() if level > 0])
-            print(f"    Skills: {skills_str}")
-            print(f"    Special: {character.special_ability}")
+            buf.write(f"  • {char_color}{character.name}{endc} ({character.role.value}) at {character.location.value}{active}\n")
+            skills_str = ", ".join(f"{skill.label}: {level}" for skill, level in zip(SkillType, character.skills) if level > 0)
+            buf.write(f"    Skills: {skills_str}\n")
+            buf.write(f"    Special: {character.special_ability}\n")
             
-    def run_game(self, max_turns=10):
+    def run_game(self, max_turns=10, use_native_tools=True, cache=False):
         """Run the game for a specified number of turns or until game over"""
-        self.create_agents()
+        self.create_agents(use_native_tools=use_native_tools, cache=cache)
         
         # Display welcome message
-        print(f"\n{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{'THE CAPTAIN IS DEAD - SIMULATION':^60}{Colors.ENDC}")
-        print(f"{Colors.HEADER}{Colors.BOLD}{'=' * 60}{Colors.ENDC}")
-        print("\nThe captain is dead... Can you and your crew repair the Jump Core")
-        print("and escape before the alien threats overwhelm your ship?\n")
-        print("\nGame follows the board game turn structure:")
-        print("1. Player spends their Action Points (AP)")
-        print("2. Draw and resolve a Crisis Card")
-        print("3. Next player's turn begins\n")
-        
-        time.sleep(1)  # Dramatic pause
+        if self.render:
+            _log(_WELCOME_BANNER)
+            time.sleep(1)  # Dramatic pause
         
         turn_count = 0
         while turn_count < max_turns:
             # Display turn header
-            print(f"\n{Colors.BOLD}{Colors.BLUE}{'=' * 60}{Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.BLUE}{f' TURN {turn_count + 1} ':=^60}{Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.BLUE}{'=' * 60}{Colors.ENDC}")
+            self._print(f"{_TURN_RULE_OPEN}{f' TURN {turn_count + 1} ':=^60}{_TURN_RULE_CLOSE}")
             
             # Display current ship status
             self.display_ship_status()
             
             # Add a separator before the action
-            print(f"\n{Colors.BOLD}{'-' * 60}{Colors.ENDC}")
+            self._print(f"\n{Colors.BOLD}{'-' * 60}{Colors.ENDC}")
             
             # Play the turn (returns game_over, message)
             game_over, message = self.play_turn()
             if game_over:
-                print(f"\n{Colors.BOLD}{Colors.RED}{'=' * 60}{Colors.ENDC}")
-                print(f"{Colors.BOLD}{Colors.RED}{'GAME OVER':^60}{Colors.ENDC}")
-                print(f"{Colors.BOLD}{Colors.RED}{'=' * 60}{Colors.ENDC}")
-                print(f"\n{message}")
+                _log(f"{_GAME_OVER_BANNER}\n\n{message}")
                 break
                 
             turn_count += 1
             
-            # Ask if user wants to continue (optional)
-            if turn_count < max_turns and not game_over:
-                print(f"\n{Colors.CYAN}Press Enter to continue to next turn...{Colors.ENDC}")
+            # Ask if user wants to continue (optional, only when rendering)
+            if self.render and turn_count < max_turns and not game_over:
+                _log(f"\n{Colors.CYAN}Press Enter to continue to next turn...{Colors.ENDC}")
                 input()
         
         # End of game summary
         if not game_over:
-            print(f"\n{Colors.YELLOW}Simulation completed after {turn_count} turns.{Colors.ENDC}")
-            print(f"Jump Core Progress: {self.game_state.jump_core_progress}/5")
+            _log(f"\n{Colors.YELLOW}Simulation completed after {turn_count} turns.{Colors.ENDC}\n"
+                 f"Jump Core Progress: {self.game_state.jump_core_progress}/5")
             
     def draw_crisis_card(self) -> CrisisCard:
         """Draw a crisis card from the deck and resolve its effects"""
-        # If deck is empty, shuffle discard pile back in
-        if not self.game_state.crisis_deck and self.game_state.crisis_discard:
-            print(f"{Colors.YELLOW}Crisis deck empty. Reshuffling discard pile.{Colors.ENDC}")
-            self.game_state.crisis_deck = self.game_state.crisis_discard
-            self.game_state.crisis_discard = []
+        gs = self.game_state
+        deck = gs.crisis_deck
+        
+        # If every card has been drawn, shuffle the discard pile (the whole deck) back in
+        if gs.crisis_cursor >= len(deck) and deck:
+            self._print(f"{Colors.YELLOW}Crisis deck empty. Reshuffling discard pile.{Colors.ENDC}")
             
-            # Shuffle the deck (will be deterministic if seed was set)
-            random.shuffle(self.game_state.crisis_deck)
+            # Shuffle the deck in place (will be deterministic if seed was set)
+            random.shuffle(deck)
+            gs.crisis_cursor = 0
             
         # If still empty (no cards at all), create a default crisis
-        if not self.game_state.crisis_deck:
+        if not deck:
             default_crisis = CrisisCard("Emergency Alert", "Ship systems are failing.", "system_damage", 2)
-            self.game_state.crisis_deck.append(default_crisis)
+            deck.append(default_crisis)
             
         # Draw the top card
-        crisis = self.game_state.crisis_deck.pop(0)
-        self.game_state.last_crisis = crisis
-        self.game_state.crisis_discard.append(crisis)
+        crisis = deck[gs.crisis_cursor]
+        gs.crisis_cursor += 1
+        gs.last_crisis = crisis
         
-        print(f"\n{Colors.BOLD}{Colors.RED}🚨 CRISIS CARD: {crisis.name}{Colors.ENDC}")
-        print(f"{Colors.RED}{crisis.description} (Severity: {crisis.severity}){Colors.ENDC}")
+        if self.render:
+            _log(f"\n{Colors.BOLD}{Colors.RED}🚨 CRISIS CARD: {crisis.name}{Colors.ENDC}\n"
+                 f"{Colors.RED}{crisis.description} (Severity: {crisis.severity}){Colors.ENDC}")
         
         # Resolve crisis effects
         self.resolve_crisis(crisis)
@@ -702,117 +871,81 @@ class Game:
         
     def resolve_crisis(self, crisis: CrisisCard):
         """Resolve the effects of a crisis card"""
-        if crisis.effect_type == "system_damage":
-            # Damage a random system
-            available_systems = [sys for sys, status in self.game_state.systems.items() 
-                               if status != SystemStatus.OFFLINE and sys != "Jump Core"]
-            
-            if available_systems:
-                # Sort systems to ensure deterministic selection when seed is set
-                available_systems.sort()
-                
-                # Select a system to damage (deterministic if seed was set)
-                system_to_damage = random.choice(available_systems)
-                current_status = self.game_state.systems[system_to_damage]
-                
-                if current_status == SystemStatus.ONLINE:
-                    self.game_state.systems[system_to_damage] = SystemStatus.DAMAGED
-                    print(f"{Colors.YELLOW}System {system_to_damage} has been DAMAGED!{Colors.ENDC}")
-                elif current_status == SystemStatus.DAMAGED:
-                    self.game_state.systems[system_to_damage] = SystemStatus.OFFLINE
-                    print(f"{Colors.RED}System {system_to_damage} is now OFFLINE!{Colors.ENDC}")
-                    
-                    # If shields go offline, increase alert level
-                    if system_to_damage == "Shields" and self.game_state.alert_level != AlertLevel.RED:
-                        if self.game_state.alert_level == AlertLevel.YELLOW:
-                            self.game_state.alert_level = AlertLevel.ORANGE
-                        elif self.game_state.alert_level == AlertLevel.ORANGE:
-                            self.game_state.alert_level = AlertLevel.RED
-                        print(f"{Colors.RED}Alert level increased to {self.game_state.alert_level.value}!{Colors.ENDC}")
-            else:
-                print(f"{Colors.YELLOW}No systems available to damage. Crisis effect mitigated.{Colors.ENDC}")
-                
-        elif crisis.effect_type == "new_threat":
-            # Add a new threat
-            potential_threats = [
-                Threat("Alien Saboteur", "An alien has infiltrated the ship", 3),
-                Threat("Power Fluctuation", "Ship's power is unstable", 2),
-                Threat("Hull Breach", "The ship's hull has been breached", 4),
-                Threat("Navigation Error", "Ship's navigation is malfunctioning", 2)
-            ]
-            
-            # Sort threats by name to ensure deterministic selection when seed is set
-            potential_threats.sort(key=lambda t: t.name)
-            
-            if len(self.game_state.active_threats) < 4:  # Cap the number of threats
-                new_threat = random.choice(potential_threats)
-                self.game_state.active_threats.append(new_threat)
-                print(f"{Colors.RED}New threat: {new_threat.name} - {new_threat.description} (Difficulty: {new_threat.difficulty}){Colors.ENDC}")
-            else:
-                print(f"{Colors.YELLOW}Too many active threats. Increasing alert level instead.{Colors.ENDC}")
-                if self.game_state.alert_level == AlertLevel.YELLOW:
-                    self.game_state.alert_level = AlertLevel.ORANGE
-                elif self.game_state.alert_level == AlertLevel.ORANGE:
-                    self.game_state.alert_level = AlertLevel.RED
-                print(f"{Colors.RED}Alert level increased to {self.game_state.alert_level.value}!{Colors.ENDC}")
-                
-        elif crisis.effect_type == "action_restriction":
-            # Reduce action points for all characters
-            for character in self.game_state.characters:
-                character.action_points = max(1, character.action_points - 1)
-            print(f"{Colors.YELLOW}All characters lose 1 action point due to the crisis!{Colors.ENDC}")
-            
-        # If shields are offline, make crisis effects worse
-        if self.game_state.systems["Shields"] == SystemStatus.OFFLINE:
-            print(f"{Colors.RED}Shields are OFFLINE! Crisis effects are amplified!{Colors.ENDC}")
-            
-            # Add an additional effect
-            if crisis.effect_type == "system_damage":
-                # Damage another system
-                available_systems = [sys for sys, status in self.game_state.systems.items() 
-                                  if status != SystemStatus.OFFLINE and sys != "Jump Core"]
-                
-                # Sort systems to ensure deterministic selection when seed is set
-                available_systems.sort()
-                
-                if available_systems:
-                    system_to_damage = random.choice(available_systems)
-                    current_status = self.game_state.systems[system_to_damage]
-                    
-                    if current_status == SystemStatus.ONLINE:
-                        self.game_state.systems[system_to_damage] = SystemStatus.DAMAGED
-                        print(f"{Colors.YELLOW}Additional system {system_to_damage} has been DAMAGED!{Colors.ENDC}")
-                    elif current_status == SystemStatus.DAMAGED:
-                        self.game_state.systems[system_to_damage] = SystemStatus.OFFLINE
-                        print(f"{Colors.RED}Additional system {system_to_damage} is now OFFLINE!{Colors.ENDC}")
+        red, endc = Colors.RED, Colors.ENDC
+        
+        handler = self._crisis_handlers.get(crisis.effect_type)
+        if handler:
+            handler(False)
             
-            elif crisis.effect_type == "new_threat" and len(self.game_state.active_threats) < 4:
-                # Add another threat
-                potential_threats = [
-                    Threat("Alien Saboteur", "An alien has infiltrated the ship", 3),
-                    Threat("Power Fluctuation", "Ship's power is unstable", 2),
-                    Threat("Hull Breach", "The ship's hull has been breached", 4),
-                    Threat("Navigation Error", "Ship's navigation is malfunctioning", 2)
-                ]
-                
-                # Sort threats by name to ensure deterministic selection when seed is set
-                potential_threats.sort(key=lambda t: t.name)
-                
-                new_threat = random.choice(potential_threats)
-                self.game_state.active_threats.append(new_threat)
-                print(f"{Colors.RED}Additional threat: {new_threat.name} - {new_threat.description} (Difficulty: {new_threat.difficulty}){Colors.ENDC}")
-                
-            elif crisis.effect_type == "action_restriction":
-                # Further reduce action points
-                for character in self.game_state.characters:
-                    character.action_points = max(1, character.action_points - 1)
-                print(f"{Colors.YELLOW}All characters lose an additional action point!{Colors.ENDC}")
+        # If shields are offline, make crisis effects worse by applying the effect again
+        if self.game_state.systems["Shields"] is SystemStatus.OFFLINE:
+            self._print(f"{red}Shields are OFFLINE! Crisis effects are amplified!{endc}")
+            if handler:
+                handler(True)
                 
         # If at red alert, make crisis even worse
-        if self.game_state.alert_level == AlertLevel.RED:
-            print(f"{Colors.RED}RED ALERT! Crisis effects are catastrophic!{Colors.ENDC}")
+        if self.game_state.alert_level is AlertLevel.RED:
+            self._print(f"{red}RED ALERT! Crisis effects are catastrophic!{endc}")
             
             # Increase difficulty of all threats
-            for threat in self.game_state.active_threats:
+            threats = self.game_state.active_threats
+            for threat in threats:
                 threat.difficulty += 1
-                print(f"{Colors.RED}Threat {threat.name} difficulty increased to {threat.difficulty}!{Colors.ENDC}") 
\ No newline at end of file
+            if self.render and threats:
+                _log("\n".join(f"{red}Threat {threat.name} difficulty increased to {threat.difficulty}!{endc}" for threat in threats))
+    
+    # Crisis effect handlers; amplified is True for the extra application while Shields are offline
+    
+    def _apply_system_damage(self, amplified: bool):
+        """Damage a random system"""
+        red, yellow, endc = Colors.RED, Colors.YELLOW, Colors.ENDC
+        available_systems = self.game_state.damageable_systems
+        
+        if not available_systems:
+            if not amplified:
+                self._print(f"{yellow}No systems available to damage. Crisis effect mitigated.{endc}")
+            return
+        
+        # Select a system to damage (deterministic if seed was set)
+        system_to_damage = random.choice(available_systems)
+        current_status = self.game_state.systems[system_to_damage]
+        render = self.render
+        label = "Additional system" if amplified else "System"
+        
+        if current_status is SystemStatus.ONLINE:
+            self.game_state.set_system_status(system_to_damage, SystemStatus.DAMAGED)
+            if render:
+                _log(f"{yellow}{label} {system_to_damage} has been DAMAGED!{endc}")
+        elif current_status is SystemStatus.DAMAGED:
+            self.game_state.set_system_status(system_to_damage, SystemStatus.OFFLINE)
+            if render:
+                _log(f"{red}{label} {system_to_damage} is now OFFLINE!{endc}")
+            
+            # If shields go offline, increase alert level
+            if not amplified and system_to_damage == "Shields" and self.game_state.escalate_alert() and render:
+                _log(f"{red}Alert level increased to {self.game_state.alert_level.value}!{endc}")
+    
+    def _apply_new_threat(self, amplified: bool):
+        """Add a new threat, or raise the alert level if there are too many already"""
+        red, yellow, endc = Colors.RED, Colors.YELLOW, Colors.ENDC
+        
+        if len(self.game_state.active_threats) < 4:  # Cap the number of threats
+            new_threat = _spawn_threat()
+            self.game_state.add_threat(new_threat)
+            if self.render:
+                label = "Additional threat" if amplified else "New threat"
+                _log(f"{red}{label}: {new_threat.name} - {new_threat.description} (Difficulty: {new_threat.difficulty}){endc}")
+        elif not amplified:
+            self.game_state.escalate_alert()
+            if self.render:
+                _log(f"{yellow}Too many active threats. Increasing alert level instead.{endc}\n"
+                     f"{red}Alert level increased to {self.game_state.alert_level.value}!{endc}")
+    
+    def _apply_action_restriction(self, amplified: bool):
+        """Reduce action points for all characters"""
+        for character in self.game_state.characters:
+            character.action_points = max(1, character.action_points - 1)
+        if amplified:
+            self._print(f"{Colors.YELLOW}All characters lose an additional action point!{Colors.ENDC}")
+        else:
+            self._print(f"{Colors.YELLOW}All characters lose 1 action point due to the crisis!{Colors.ENDC}")
@@ -1,46 +1,84 @@
 import os
+import re
+from functools import lru_cache
 from openai import OpenAI
 from game_state import GameState
-from models import Location, SkillType, SystemStatus
+from models import Location, SkillType
+from response_cache import ResponseCache
 import json
-import time
-import random
 
 client = OpenAI(
     api_key=os.getenv("GEMINI_API_KEY"),
-    base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
+    base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
+    max_retries=3,  # Exponential backoff on rate limits / server errors instead of fixed sleeps
+    timeout=20.0  # Fail a stuck request quickly rather than after the SDK's 10 minute default
 )
 
-class LLMAgent:
-    def __init__(self, character, model: str = "gemini-2.0-flash-lite"):
-        self.character = character
-        self.model = model
-        self.conversation_history = []
-        self.retry_count = 0
-        self.max_retries = 3
-        
-    def get_action(self, game_state: GameState) -> dict:
-        """Use LLM to determine the next action for this character using tools API"""
-        if self.character != game_state.get_current_character():
-            return {"action_type": "skip", "reason": "Not my turn"}
-            
-        # Reset retry count for each new action request
-        self.retry_count = 0
-        
-        # Create system prompt
-        system_prompt = f"""
-        You are playing as {self.character.name}, the {self.character.role.value} in the cooperative board game 'The Captain Is Dead'.
-        Your special ability is: {self.character.special_ability}
-        
-        You are currently at the {self.character.location.value}.
-        
-        You have the following skills:
-        {', '.join([f"{skill.value}: {level}" for skill, level in self.character.skills.items()])}
-        
-        Your goal is to help repair the Jump Core to level 5 so the ship can escape.
-        You have {self.character.action_points} action points to spend on your turn.
-        
-        IMPORTANT: You MUST use one of the following tools to take your action:
+def _choice_tool(name: str, description: str, param: str, param_description: str, options: list) -> dict:
+    """Build a tool schema taking a single parameter restricted to the given options"""
+    return {
+        "type": "function",
+        "function": {
+            "name": name,
+            "description": description,
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    param: {
+                        "type": "string",
+                        "enum": options,
+                        "description": param_description
+                    }
+                },
+                "required": [param]
+            }
+        }
+    }
+
+# Location names never change, so the list and the pattern matching them are built once
+_LOCATION_VALUES = tuple(loc.value for loc in Location)
+_LOCATION_RE = re.compile("|".join(map(re.escape, _LOCATION_VALUES)))
+
+# Response cache shared by all agents, opened on first use
+_response_cache = None
+
+def _get_response_cache() -> ResponseCache:
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
+
+# Shared decoder for pulling a JSON object out of free text
+_JSON_DECODER = json.JSONDecoder()
+
+@lru_cache(maxsize=64)
+def _names_re(names: tuple) -> re.Pattern:
+    """Compiled pattern matching any of the given names (systems and threats change rarely)"""
+    if not names:
+        return re.compile(r"(?!)")  # Never matches
+    # Longest first so a name that is a prefix of another does not win
+    return re.compile("|".join(map(re.escape, sorted(names, key=len, reverse=True))))
+
+# Tools whose schema never changes, built once
+_MOVE_TOOL = _choice_tool("move", "Move to a different location on the ship", "destination",
+                          "The location to move to", list(_LOCATION_VALUES))
+_END_TURN_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "end_turn",
+        "description": "End your turn without taking any more actions",
+        "parameters": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    }
+}
+
+# How to answer, for agents using native tool calls
+_TOOL_INSTRUCTIONS = """
+        IMPORTANT: You MUST use one of the following tools to take your action.
+        Do not respond with text - you must use a tool.
         
         1. move - Move to a different location on the ship
            Example: Use this tool to move to Engineering if you need to repair the Jump Core
@@ -56,416 +94,289 @@ class LLMAgent:
         
         5. end_turn - End your turn without taking any more actions
            Example: Use this tool when you've completed all desired actions
+"""
+
+# How to answer without tool schemas: one short action code between <a> tags. Decoding
+# stops at the closing tag, so the reply is only a few tokens long.
+_TEXT_PROTOCOL_INSTRUCTIONS = f"""
+        IMPORTANT: Reply with exactly one action between <a> and </a>, in this format:
         
+        ACTIONS: M<location>|R<system>|U<system>|B<threat>|E
+        
+        1. M = move, 2. R = repair, 3. U = use a system, 4. B = battle a threat, 5. E = end turn
+        Locations: {', '.join(_LOCATION_VALUES)}
+        Example: <a>MEngineering</a> moves you to Engineering.
+"""
+
+# Action code -> (action_type, parameter name) for the text protocol
+_TEXT_ACTION_CODES = {
+    "M": ("move", "destination"),
+    "R": ("repair", "system"),
+    "U": ("use_system", "system"),
+    "B": ("battle", "threat"),
+    "E": ("end_turn", None),
+}
+_TEXT_ACTION_RE = re.compile(r"<a>\s*([MRUBE])([^<]*)")
+
+class LLMAgent:
+    def __init__(self, character, model: str = "gemini-2.0-flash-lite", use_native_tools: bool = True,
+                 cache: bool = False):
+        self.character = character
+        self.model = model
+        self.use_native_tools = use_native_tools  # False: compact text protocol instead of tool schemas
+        # Optional on-disk cache of chosen actions. Sampling is made greedy when caching so a
+        # cached answer is the one the model would give again.
+        self.cache = _get_response_cache() if cache else None
+        self._sampling_args = {"temperature": 0} if cache else {}
+        
+        # The part of the system prompt that never changes for this character. It is
+        # sent first so the prompt prefix stays byte-identical across turns, and it
+        # carries the answer instructions so they are sent exactly once.
+        answer_instructions = _TOOL_INSTRUCTIONS if use_native_tools else _TEXT_PROTOCOL_INSTRUCTIONS
+        self._static_system_prompt = f"""
+        You are playing as {character.name}, the {character.role.value} in the cooperative board game 'The Captain Is Dead'.
+        Your special ability is: {character.special_ability}
+        
+        Your goal is to help repair the Jump Core to level 5 so the ship can escape.
+        {answer_instructions}        
         Choose the most strategically valuable action based on your skills and the current game state.
         """
         
+    def get_action(self, game_state: GameState) -> dict:
+        """Use LLM to determine the next action for this character using tools API"""
+        if self.character != game_state.get_current_character():
+            return {"action_type": "skip", "reason": "Not my turn"}
+        
+        # Character-invariant prefix first, per-turn details last
+        system_prompt = self._static_system_prompt + f"""
+        You are currently at the {self.character.location.value}.
+        
+        You have the following skills:
+        {self.character.skills_text}
+        
+        You have {self.character.action_points} action points to spend on your turn.
+        """
+        
         # Current game state
         user_prompt = f"Current Game State:\n{game_state.game_state_description()}\n\nWhat action will you take?"
         
-        # Define tools based on character skills and location
-        tools = [
-            {
-                "type": "function",
-                "function": {
-                    "name": "move",
-                    "description": "Move to a different location on the ship",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "destination": {
-                                "type": "string",
-                                "enum": [loc.value for loc in Location],
-                                "description": "The location to move to"
-                            }
-                        },
-                        "required": ["destination"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "repair",
-                    "description": "Attempt to repair a damaged system",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "system": {
-                                "type": "string",
-                                "enum": list(game_state.systems.keys()),
-                                "description": "The system to repair"
-                            }
-                        },
-                        "required": ["system"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "use_system",
-                    "description": "Use a ship system that is online or damaged",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "system": {
-                                "type": "string",
-                                "enum": [sys for sys, status in game_state.systems.items() 
-                                        if status != SystemStatus.OFFLINE],
-                                "description": "The system to use"
-                            }
-                        },
-                        "required": ["system"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "end_turn",
-                    "description": "End your turn without taking any more actions",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                }
-            }
-        ]
-        
-        # Add battle option if there are active threats
-        if game_state.active_threats:
-            tools.append({
-                "type": "function",
-                "function": {
-                    "name": "battle",
-                    "description": "Attempt to defeat a threat using tactical skills",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "threat": {
-                                "type": "string",
-                                "enum": [threat.name for threat in game_state.active_threats],
-                                "description": "The threat to battle"
-                            }
-                        },
-                        "required": ["threat"]
-                    }
-                }
-            })
+        if not self.use_native_tools:
+            # The options that change between turns go in the tail of the system prompt
+            system_prompt += f"""
+        Systems: {', '.join(game_state.systems)}
+        Threats: {', '.join(threat.name for threat in game_state.active_threats) or 'None'}
+        """
         
-        # Update conversation history
-        self.conversation_history = []  # Reset conversation history for each new action
-        self.conversation_history.append({"role": "system", "content": system_prompt})
-        self.conversation_history.append({"role": "user", "content": user_prompt})
+        # Each decision stands alone: only this turn's system and user messages are sent
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
         
-        # Try the tool-based approach first
-        action = self._try_tool_based_approach(tools, game_state)
-        if action:
-            return action
+        if self.use_native_tools:
+            # Tools: only the enums of the state-dependent ones change between turns
+            tools = [
+                _MOVE_TOOL,
+                _choice_tool("repair", "Attempt to repair a damaged system", "system",
+                             "The system to repair", list(game_state.systems.keys())),
+                _choice_tool("use_system", "Use a ship system that is online or damaged", "system",
+                             "The system to use", list(game_state.usable_systems)),
+                _END_TURN_TOOL,
+            ]
             
-        # If tool-based approach fails, try structured prompting
-        action = self._try_structured_prompting(game_state)
-        if action:
-            return action
+            # Add battle option if there are active threats
+            if game_state.active_threats:
+                tools.append(_choice_tool("battle", "Attempt to defeat a threat using tactical skills", "threat",
+                                          "The threat to battle", [threat.name for threat in game_state.active_threats]))
             
-        # If structured prompting fails, try basic parsing
-        action = self._try_basic_parsing(game_state)
+            # Single tool call; a text reply is parsed from the same response
+            action = self._cached_action((self.model, system_prompt, user_prompt, json.dumps(tools)),
+                                         self._try_tool_based_approach, messages, tools, game_state)
+        else:
+            action = self._cached_action((self.model, system_prompt, user_prompt),
+                                         self._try_text_protocol, messages, game_state)
         if action:
             return action
             
         # Last resort: return a default action based on character skills
         return self._get_default_action(game_state)
         
-    def _try_tool_based_approach(self, tools, game_state):
-        """Try to get an action using the tools API"""
-        max_retries = 2
-        retry_count = 0
+    def _cached_action(self, request_parts, get_action, *args):
+        """Return get_action(*args), through the response cache when it is enabled"""
+        if self.cache is None:
+            return get_action(*args)
         
-        while retry_count <= max_retries:
-            try:
-                # Add a small delay to avoid rate limiting
-                time.sleep(0.5 + retry_count * 0.5)  # Increase delay with each retry
-                
-                # Add explicit instructions about tool usage
-                tool_instructions = """
-                IMPORTANT: You must select one of the available tools to take your action.
-                Do not respond with text - you must use a tool.
-                
-                Available tools:
-                - move: Use this to move to a different location
-                - repair: Use this to repair a damaged system
-                - use_system: Use this to activate a ship system
-                - battle: Use this to fight a threat
-                - end_turn: Use this to end your turn
-                
-                Select the most appropriate tool based on your character's skills and the current situation.
-                """
-                
-                # Add tool instructions to the conversation
-                self.conversation_history.append({"role": "system", "content": tool_instructions})
-                
-                # Get response from OpenAI with tools
-                response = client.chat.completions.create(
-                    model=self.model,
-                    messages=self.conversation_history,
-                    tools=tools,
-                    tool_choice="required",  # Force the model to use a tool
-                    max_tokens=250
-                )
-                
-                # Extract the action from the response
-                message = response.choices[0].message
-                
-                # Process the response
-                if hasattr(message, 'tool_calls') and message.tool_calls:
-                    # Get the first tool call (there should only be one)
-                    tool_call = message.tool_calls[0]
-                    
-                    # Extract function name and arguments
-                    function_name = tool_call.function.name
-                    function_args = json.loads(tool_call.function.arguments)
-                    
-                    # Add the assistant's response to conversation history
-                    self.conversation_history.append({
-                        "role": "assistant",
-                        "content": message.content,
-                        "tool_calls": [
-                            {
-                                "id": tool_call.id,
-                                "type": "function",
-                                "function": {
-                                    "name": function_name,
-                                    "arguments": tool_call.function.arguments
-                                }
-                            }
-                        ]
-                    })
-                    
-                    # Format the action for return
-                    action = {
-                        "action_type": function_name,
-                        "parameters": function_args,
-                        "reason": message.content or "Strategic decision based on current game state."
-                    }
-                    
+        key = ResponseCache.make_key(*request_parts)
+        action = self.cache.get(key)
+        if action is None:
+            action = get_action(*args)
+            if action:
+                self.cache.put(key, action)
+        return action
+    
+    def _try_tool_based_approach(self, messages, tools, game_state):
+        """Get an action with one tools API call, falling back to parsing the reply text"""
+        try:
+            # Stream the response so we can stop as soon as the tool call is complete
+            content, function_name, function_args = self._stream_tool_call(messages, tools)
+            
+            # Process the response
+            if function_name:
+                # Format the action for return
+                return {
+                    "action_type": function_name,
+                    "parameters": function_args,
+                    "reason": content or "Strategic decision based on current game state."
+                }
+            
+            # No tool was called: try to read an action from the text instead of asking again
+            if content:
+                action = self._parse_text_action(content, game_state)
+                if action:
                     return action
-                else:
-                    # If no tool was called, try again or fall back to structured prompting
-                    print(f"No tool call in response for {self.character.name} (attempt {retry_count+1}/{max_retries+1}). Retrying...")
-                    retry_count += 1
-                    if retry_count > max_retries:
-                        print(f"All tool call attempts failed for {self.character.name}. Falling back to structured prompting.")
-                        return None
                     
-            except Exception as e:
-                # Fall back to structured prompting if tool calling fails
-                print(f"Tool calling failed for {self.character.name} (attempt {retry_count+1}/{max_retries+1}): {e}")
-                retry_count += 1
-                if retry_count > max_retries:
-                    print(f"All tool call attempts failed for {self.character.name}. Falling back to structured prompting.")
-                    return None
+            print(f"No usable action in response for {self.character.name}.")
+            
+        except Exception as e:
+            print(f"Tool calling failed for {self.character.name}: {e}")
         
         return None
+    
+    def _try_text_protocol(self, messages, game_state):
+        """Get an action with one call using the <a>CODE</a> text protocol instead of tools"""
+        try:
+            response = client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=50,
+                stop=["</a>"],  # Stop decoding as soon as the action is complete
+                **self._sampling_args
+            )
+            content = response.choices[0].message.content or ""
             
-    def _try_structured_prompting(self, game_state):
-        """Try to get an action using structured prompting"""
-        max_retries = 2
-        retry_count = 0
-        
-        while retry_count <= max_retries:
-            try:
-                # Add a small delay to avoid rate limiting
-                time.sleep(0.5 + retry_count * 0.5)  # Increase delay with each retry
-                
-                # Create a structured prompt as fallback
-                fallback_prompt = f"""
-                You are playing as {self.character.name}, the {self.character.role.value} in 'The Captain Is Dead'.
-                Your special ability is: {self.character.special_ability}
-                
-                You are currently at the {self.character.location.value}.
-                
-                You have the following skills:
-                {', '.join([f"{skill.value}: {level}" for skill, level in self.character.skills.items()])}
-                
-                Your goal is to help repair the Jump Core to level 5 so the ship can escape.
-                You have {self.character.action_points} action points to spend on your turn.
-                
-                Current Game State:
-                {game_state.game_state_description()}
-                
-                AVAILABLE ACTIONS - YOU MUST CHOOSE EXACTLY ONE:
-                
-                1. MOVE - Move to a different location on the ship
-                   Available locations: {", ".join([loc.value for loc in Location])}
-                   Example: Move to Engineering to repair the Jump Core
-                   
-                2. REPAIR - Repair a damaged system (requires Engineering skill)
-                   Available systems: {", ".join(game_state.systems.keys())}
-                   Example: Repair the Jump Core or Shields
-                   
-                3. USE - Use a ship system that is online or damaged
-                   Available systems: {", ".join([sys for sys, status in game_state.systems.items() if status != SystemStatus.OFFLINE])}
-                   Example: Use Sensors to scan for threats
-                """
-                
-                if game_state.active_threats:
-                    fallback_prompt += f"""
-                4. BATTLE - Attempt to defeat a threat (requires Tactical skill)
-                   Active threats: {", ".join([threat.name for threat in game_state.active_threats])}
-                   Example: Battle the "Alien Boarding Party" threat
-                    """
-                    
-                fallback_prompt += """
-                5. END TURN - End your turn without taking any more actions
-                   Example: End your turn when you've completed all desired actions
-                
-                YOU MUST RESPOND WITH EXACTLY ONE ACTION IN THIS FORMAT:
-                {
-                    "action_type": "move",  // Choose one of: move, repair, use_system, battle, end_turn
-                    "parameters": {
-                        // For move: "destination": "Location Name"
-                        // For repair: "system": "System Name"
-                        // For use_system: "system": "System Name"
-                        // For battle: "threat": "Threat Name"
-                        // For end_turn: no parameters needed
-                    },
-                    "reason": "Brief explanation of strategic reasoning"
+            match = _TEXT_ACTION_RE.search(content)
+            if match:
+                action_type, param = _TEXT_ACTION_CODES[match.group(1)]
+                value = match.group(2).strip()
+                return {
+                    "action_type": action_type,
+                    "parameters": {param: value} if param and value else {},
+                    "reason": "Strategic decision based on current game state."
                 }
+            
+            # Not in the expected format: fall back to reading the text
+            action = self._parse_text_action(content, game_state) if content else None
+            if action:
+                return action
                 
-                DO NOT INCLUDE ANY OTHER TEXT IN YOUR RESPONSE.
-                ONLY RESPOND WITH THE JSON OBJECT.
-                """
-                
-                # Try with structured prompting
-                response = client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": fallback_prompt}],
-                    max_tokens=250
-                )
-                
-                message_content = response.choices[0].message.content
-                
-                # Try to parse JSON from the response
-                json_start = message_content.find('{')
-                json_end = message_content.rfind('}') + 1
-                
-                if json_start >= 0 and json_end > json_start:
-                    json_str = message_content[json_start:json_end]
-                    try:
-                        action_data = json.loads(json_str)
-                        
-                        # Validate required fields
-                        if "action_type" in action_data:
-                            return action_data
-                    except json.JSONDecodeError:
-                        print(f"Failed to parse JSON response for {self.character.name} (attempt {retry_count+1}/{max_retries+1})")
-                
-                # If we get here, parsing failed, try again
-                retry_count += 1
-                if retry_count > max_retries:
-                    print(f"All structured prompting attempts failed for {self.character.name}. Falling back to basic parsing.")
-                    return None
-                
-            except Exception as e:
-                print(f"Structured prompting failed for {self.character.name} (attempt {retry_count+1}/{max_retries+1}): {e}")
-                retry_count += 1
-                if retry_count > max_retries:
-                    print(f"All structured prompting attempts failed for {self.character.name}. Falling back to basic parsing.")
-                    return None
+            print(f"No usable action in response for {self.character.name}.")
+            
+        except Exception as e:
+            print(f"Text protocol call failed for {self.character.name}: {e}")
         
         return None
-            
-    def _try_basic_parsing(self, game_state):
-        """Try to get an action using basic text parsing"""
-        max_retries = 2
-        retry_count = 0
+    
+    def _stream_tool_call(self, messages, tools):
+        """
+        Request a tool call with streaming and return (content, function_name, parsed arguments).
         
-        while retry_count <= max_retries:
+        Reading stops as soon as the first tool call's arguments form complete JSON; only
+        one tool call is used, so the rest of the generation is not waited for.
+        """
+        # Rate limits are retried with backoff by the client
+        stream = client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            tools=tools,
+            tool_choice="required",  # Force the model to use a tool
+            max_tokens=250,
+            stream=True,
+            **self._sampling_args
+        )
+        
+        content_parts = []
+        function_name = None
+        arguments = ""
+        function_args = None
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta.content:
+                    content_parts.append(delta.content)
+                if not delta.tool_calls:
+                    continue
+                
+                tool_call = delta.tool_calls[0]
+                if tool_call.index:  # A second tool call started, the first one is done
+                    break
+                if tool_call.function:
+                    if tool_call.function.name:
+                        function_name = tool_call.function.name
+                    if tool_call.function.arguments:
+                        arguments += tool_call.function.arguments
+                
+                # Stop once the arguments are a complete JSON object
+                if function_name and arguments.rstrip().endswith("}"):
+                    try:
+                        function_args = json.loads(arguments)
+                        break
+                    except json.JSONDecodeError:
+                        pass
+        finally:
+            stream.close()
+        
+        if function_name and function_args is None:
+            function_args = json.loads(arguments or "{}")
+        return "".join(content_parts) or None, function_name, function_args
+    
+    def _parse_text_action(self, message_content, game_state):
+        """Extract an action from a text reply: a JSON object if present, otherwise keywords"""
+        # Try to parse a JSON action from the response: decode from each '{' in turn, so
+        # text around the object (or braces in it) does not get in the way
+        json_start = message_content.find('{')
+        while json_start >= 0:
             try:
-                # Add a small delay to avoid rate limiting
-                time.sleep(0.5 + retry_count * 0.5)  # Increase delay with each retry
-                
-                final_prompt = f"""
-                You are {self.character.name}. You MUST choose ONE action from the following options:
-                
-                1. MOVE to a specific location (e.g., "I MOVE to Engineering")
-                2. REPAIR a specific system (e.g., "I REPAIR Jump Core")
-                3. USE a specific system (e.g., "I USE Sensors")
-                4. BATTLE a specific threat (e.g., "I BATTLE Alien Boarding Party")
-                5. END TURN (e.g., "I END my TURN")
-                
-                Your response must start with "I MOVE", "I REPAIR", "I USE", "I BATTLE", or "I END TURN".
-                Be very specific about what location, system, or threat.
-                
-                Current Game State:
-                {game_state.game_state_description()}
-                """
-                
-                response = client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": final_prompt}],
-                    max_tokens=150
-                )
-                
-                message_content = response.choices[0].message.content
-                
-                # Very basic fallback parsing
-                action_type = None
-                parameters = {}
-                
-                if "MOVE" in message_content.upper():
-                    action_type = "move"
-                    # Try to extract destination
-                    for loc in Location:
-                        if loc.value in message_content:
-                            parameters["destination"] = loc.value
-                            break
-                elif "REPAIR" in message_content.upper():
-                    action_type = "repair"
-                    # Try to extract system
-                    for system in game_state.systems:
-                        if system in message_content:
-                            parameters["system"] = system
-                            break
-                elif "USE" in message_content.upper():
-                    action_type = "use_system"
-                    # Try to extract system
-                    for system in game_state.systems:
-                        if system in message_content:
-                            parameters["system"] = system
-                            break
-                elif "BATTLE" in message_content.upper():
-                    action_type = "battle"
-                    # Try to extract threat
-                    for threat in game_state.active_threats:
-                        if threat.name in message_content:
-                            parameters["threat"] = threat.name
-                            break
-                elif "END" in message_content.upper() and "TURN" in message_content.upper():
-                    action_type = "end_turn"
-                
-                if action_type:
-                    return {
-                        "action_type": action_type,
-                        "parameters": parameters,
-                        "content": message_content,
-                        "reason": "Parsed from text response"
-                    }
-                
-                # If we get here, parsing failed, try again
-                retry_count += 1
-                if retry_count > max_retries:
-                    print(f"All basic parsing attempts failed for {self.character.name}. Using default action.")
-                    return None
-                    
-            except Exception as e:
-                print(f"Basic parsing failed for {self.character.name} (attempt {retry_count+1}/{max_retries+1}): {e}")
-                retry_count += 1
-                if retry_count > max_retries:
-                    print(f"All basic parsing attempts failed for {self.character.name}. Using default action.")
-                    return None
+                action_data, _ = _JSON_DECODER.raw_decode(message_content, json_start)
+            except json.JSONDecodeError:
+                pass
+            else:
+                # Validate required fields
+                if isinstance(action_data, dict) and "action_type" in action_data:
+                    return action_data
+            json_start = message_content.find('{', json_start + 1)
+        
+        # Very basic fallback parsing: pick the action from its keyword, then the first
+        # entity of the matching kind mentioned, found in a single regex pass
+        action_type = pattern = None
+        parameters = {}
+        upper_content = message_content.upper()
+        
+        if "MOVE" in upper_content:
+            action_type, param, pattern = "move", "destination", _LOCATION_RE
+        elif "REPAIR" in upper_content:
+            action_type, param, pattern = "repair", "system", _names_re(tuple(game_state.systems))
+        elif "USE" in upper_content:
+            action_type, param, pattern = "use_system", "system", _names_re(tuple(game_state.systems))
+        elif "BATTLE" in upper_content:
+            action_type, param, pattern = "battle", "threat", _names_re(
+                tuple(threat.name for threat in game_state.active_threats))
+        elif "END" in upper_content and "TURN" in upper_content:
+            action_type, param, pattern = "end_turn", None, None
+        
+        if pattern is not None:
+            match = pattern.search(message_content)
+            if match:
+                parameters[param] = match.group()
+        
+        if action_type:
+            return {
+                "action_type": action_type,
+                "parameters": parameters,
+                "content": message_content,
+                "reason": "Parsed from text response"
+            }
         
         return None
             
@@ -473,61 +384,44 @@ class LLMAgent:
         """Get a default action based on character skills and location"""
         print(f"All LLM approaches failed for {self.character.name}. Using default action.")
         
-        # Check if character has engineering skill and there are systems to repair
-        engineering_skill = self.character.skills.get(SkillType.ENGINEERING, 0)
-        if engineering_skill > 0:
-            # Try to repair Jump Core if possible
-            if self.character.location.value == "Engineering" and engineering_skill >= 2:
-                return {
-                    "action_type": "repair",
-                    "parameters": {"system": "Jump Core"},
-                    "reason": "Default action: Repairing Jump Core"
-                }
-            
-            # Try to repair any damaged system
-            damaged_systems = [system for system, status in game_state.systems.items() 
-                              if status == SystemStatus.DAMAGED]
-            # Sort systems to ensure deterministic selection
-            damaged_systems.sort()
-            if damaged_systems:
-                return {
-                    "action_type": "repair",
-                    "parameters": {"system": damaged_systems[0]},
-                    "reason": f"Default action: Repairing damaged {damaged_systems[0]}"
-                }
+        character = self.character
+        engineering_skill = character.skills[SkillType.ENGINEERING]
+        tactical_skill = character.skills[SkillType.TACTICAL]
+        at_engineering = character.location is Location.ENGINEERING
         
-        # Check if character has tactical skill and there are threats
-        tactical_skill = self.character.skills.get(SkillType.TACTICAL, 0)
-        if tactical_skill > 0 and game_state.active_threats:
-            # Find the easiest threat to battle
-            sorted_threats = sorted(game_state.active_threats, key=lambda t: (t.difficulty, t.name))
-            easiest_threat = sorted_threats[0]
-            if tactical_skill >= (easiest_threat.difficulty - 1):
-                return {
-                    "action_type": "battle",
-                    "parameters": {"threat": easiest_threat.name},
-                    "reason": f"Default action: Battling {easiest_threat.name}"
-                }
+        # Systems by status, kept sorted by name by GameState for deterministic selection
+        damaged_systems = game_state.damaged_systems
+        usable_systems = game_state.usable_systems
         
-        # If no better option, move to Engineering to help with Jump Core
-        if self.character.location.value != "Engineering":
-            return {
-                "action_type": "move",
-                "parameters": {"destination": "Engineering"},
-                "reason": "Default action: Moving to Engineering to help with Jump Core"
-            }
+        # The easiest threat to battle
+        easiest_threat = min(game_state.active_threats, key=lambda t: (t.difficulty, t.name), default=None)
         
-        # If already at Engineering, use a system
-        online_systems = [sys for sys, status in game_state.systems.items() 
-                         if status != SystemStatus.OFFLINE]
-        # Sort systems to ensure deterministic selection
-        online_systems.sort()
-        if online_systems:
-            return {
-                "action_type": "use_system",
-                "parameters": {"system": online_systems[0]},
-                "reason": f"Default action: Using {online_systems[0]}"
-            }
+        # (applies, build action) in priority order; the first rule that applies is used
+        rules = (
+            # Repair the Jump Core when able to
+            (engineering_skill >= 2 and at_engineering,
+             lambda: {"action_type": "repair", "parameters": {"system": "Jump Core"},
+                      "reason": "Default action: Repairing Jump Core"}),
+            # Repair any damaged system
+            (engineering_skill > 0 and bool(damaged_systems),
+             lambda: {"action_type": "repair", "parameters": {"system": damaged_systems[0]},
+                      "reason": f"Default action: Repairing damaged {damaged_systems[0]}"}),
+            # Battle the easiest threat if it can be beaten
+            (tactical_skill > 0 and easiest_threat is not None and tactical_skill >= easiest_threat.difficulty - 1,
+             lambda: {"action_type": "battle", "parameters": {"threat": easiest_threat.name},
+                      "reason": f"Default action: Battling {easiest_threat.name}"}),
+            # Move to Engineering to help with the Jump Core
+            (not at_engineering,
+             lambda: {"action_type": "move", "parameters": {"destination": "Engineering"},
+                      "reason": "Default action: Moving to Engineering to help with Jump Core"}),
+            # Already at Engineering: use a system
+            (bool(usable_systems),
+             lambda: {"action_type": "use_system", "parameters": {"system": usable_systems[0]},
+                      "reason": f"Default action: Using {usable_systems[0]}"}),
+        )
+        for applies, build_action in rules:
+            if applies:
+                return build_action()
         
         # Last resort: end turn
         return {
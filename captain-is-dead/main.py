@@ -11,6 +11,9 @@ if __name__ == "__main__":
     parser.add_argument('--turns', type=int, default=10, help='Maximum number of turns')
     parser.add_argument('--seed', type=int, default=None, help='Random seed for deterministic behavior (default: random)')
     parser.add_argument('--deterministic', action='store_true', default=True, help='Use deterministic mode with default seed 42')
+    parser.add_argument('--quiet', action='store_true', help='Only print the final result (no status display or pauses between turns)')
+    parser.add_argument('--text-protocol', action='store_true', help='Have agents answer with a compact text action code instead of native tool calls')
+    parser.add_argument('--cache', action='store_true', help='Reuse LLM answers for identical prompts from an on-disk cache (llm_response_cache.sqlite)')
     
     args = parser.parse_args()
     
@@ -23,8 +26,9 @@ if __name__ == "__main__":
         num_characters=args.characters,
         num_threats=args.threats,
         difficulty=args.difficulty,
-        seed=args.seed
+        seed=args.seed,
+        render=False if args.quiet else None
     )
     
     # Run the game with the specified number of turns
-    game.run_game(max_turns=args.turns) 
\ No newline at end of file
+    game.run_game(max_turns=args.turns, use_native_tools=not args.text_protocol, cache=args.cache) 
\ No newline at end of file
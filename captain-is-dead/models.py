@@ -1,12 +1,19 @@
 import os
 import random
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import List, Dict, Tuple, Optional
 
-class SystemStatus(Enum):
-    ONLINE = "Online"
-    OFFLINE = "Offline"
-    DAMAGED = "Damaged"
+class SystemStatus(IntEnum):
+    # Integer tags for cheap comparisons; .label is the display name
+    ONLINE = 0, "Online"
+    OFFLINE = 1, "Offline"
+    DAMAGED = 2, "Damaged"
+    
+    def __new__(cls, value: int, label: str):
+        obj = int.__new__(cls, value)
+        obj._value_ = value
+        obj.label = label
+        return obj
 
 class Location(Enum):
     BRIDGE = "Bridge"
@@ -18,12 +25,19 @@ class Location(Enum):
     COMM_CENTER = "Communications Center"
     HOLODECK = "Holodeck"
 
-class SkillType(Enum):
-    TACTICAL = "Tactical"
-    ENGINEERING = "Engineering"
-    SCIENCE = "Science"
-    MEDICAL = "Medical"
-    LEADERSHIP = "Leadership"
+class SkillType(IntEnum):
+    # Dense 0..N-1 values so a character's skills can be a plain list indexed by skill
+    ENGINEERING = 0, "Engineering"
+    TACTICAL = 1, "Tactical"
+    SCIENCE = 2, "Science"
+    MEDICAL = 3, "Medical"
+    LEADERSHIP = 4, "Leadership"
+    
+    def __new__(cls, value: int, label: str):
+        obj = int.__new__(cls, value)
+        obj._value_ = value
+        obj.label = label
+        return obj
 
 class CharacterRole(Enum):
     CAPTAIN = "Captain"
@@ -39,6 +53,8 @@ class AlertLevel(Enum):
     RED = "Red Alert"
 
 class Threat:
+    __slots__ = ("name", "description", "difficulty", "active")
+    
     def __init__(self, name: str, description: str, difficulty: int):
         self.name = name
         self.description = description
@@ -49,23 +65,39 @@ class Threat:
         return f"{self.name} ({self.difficulty}): {self.description}"
 
 class Character:
+    __slots__ = ("name", "role", "skills", "special_ability", "location", "action_points", "_skills_text")
+    
     def __init__(self, 
                  name: str, 
                  role: CharacterRole, 
-                 skills: Dict[SkillType, int],
+                 skills: List[int],
                  special_ability: str,
                  location: Location):
         self.name = name
         self.role = role
-        self.skills = skills
+        self.skills = skills  # Skill levels indexed by SkillType
         self.special_ability = special_ability
         self.location = location
         self.action_points = 4  # Standard action points per turn (board game standard)
+        self._skills_text: Optional[str] = None  # Cached skills_text, cleared by set_skill
+        
+    @property
+    def skills_text(self) -> str:
+        """Skills as "Engineering: 3, Tactical: 1, ...", built once until a skill changes"""
+        if self._skills_text is None:
+            self._skills_text = ', '.join(f"{skill.label}: {level}" for skill, level in zip(SkillType, self.skills))
+        return self._skills_text
+    
+    def set_skill(self, skill: SkillType, level: int):
+        self.skills[skill] = level
+        self._skills_text = None
         
     def __str__(self):
         return f"{self.name} ({self.role.value}) at {self.location.value}"
 
 class CrisisCard:
+    __slots__ = ("name", "description", "effect_type", "severity")
+    
     def __init__(self, name: str, description: str, effect_type: str, severity: int):
         self.name = name
         self.description = description
@@ -1,5 +1,9 @@
-from typing import List, Dict, Tuple, Optional, Set
-from models import DiseaseStatus, DiseaseColor, PlayerRole, City, Player, InfectionCard, PlayerCard, EventCard
+from collections import Counter, deque
+from typing import List, Dict, Tuple, Optional, Set, Deque
+from models import DiseaseStatus, DiseaseColor, PlayerRole, City, Player, InfectionCard, PlayerCard, EventCard, Message
+import heapq
+import io
+import sys
 import time
 import random
 
@@ -16,18 +20,42 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Disease colors by the spellings agents use ("BLUE", "blue", "Blue"); other casings fall back to upper()
+_COLOR_BY_NAME: Dict[str, DiseaseColor] = {
+    spelling: color for color in DiseaseColor for spelling in (color.name, color.name.lower(), color.label)
+}
+
+def _parse_disease_color(value) -> Optional[DiseaseColor]:
+    if not isinstance(value, str):
+        return None
+    color = _COLOR_BY_NAME.get(value)
+    if color is None:
+        color = _COLOR_BY_NAME.get(value.upper())
+    return color
+
+def _board_position(city: City) -> int:
+    return city.board_index
+
+def _infection_rank(city: City) -> Tuple[int, int]:
+    # Most cubes first; ties go to the city earlier in board order
+    return city.total_cubes, -city.board_index
+
 class GameState:
     def __init__(self):
         # Game board
         self.cities: Dict[str, City] = {}
         
         # Disease status
-        self.disease_status = {
-            DiseaseColor.BLUE: DiseaseStatus.ACTIVE,
-            DiseaseColor.YELLOW: DiseaseStatus.ACTIVE,
-            DiseaseColor.BLACK: DiseaseStatus.ACTIVE,
-            DiseaseColor.RED: DiseaseStatus.ACTIVE
-        }
+        self.disease_status = [DiseaseStatus.ACTIVE] * len(DiseaseColor)  # Indexed by DiseaseColor
+        
+        # Colors whose status is CURED, in disease_status order; kept up to date by set_disease_status
+        self.cured_colors: List[DiseaseColor] = []
+        
+        # Diseases still ACTIVE; kept up to date by set_disease_status, the game is won at 0
+        self.active_diseases = len(DiseaseColor)
+        
+        # The "Diseases:" block of the description, rebuilt by set_disease_status
+        self._diseases_text = self._build_diseases_text()
         
         # Counters
         self.outbreak_counter = 0
@@ -35,32 +63,77 @@ class GameState:
         self.infection_rates = [2, 2, 2, 3, 3, 4, 4]  # Number of infection cards drawn per turn
         
         # Cubes supply
-        self.disease_cubes = {
-            DiseaseColor.BLUE: 24,
-            DiseaseColor.YELLOW: 24,
-            DiseaseColor.BLACK: 24,
-            DiseaseColor.RED: 24
-        }
+        self.disease_cubes = [24] * len(DiseaseColor)  # Cubes left in supply, indexed by DiseaseColor
         
         # Research stations
         self.total_research_stations = 6
         self.placed_research_stations = 0
+        self.research_station_cities: List[City] = []  # In board order; kept up to date by add_research_station
         
         # Players
         self.players: List[Player] = []
+        self.players_by_name: Dict[str, Player] = {}  # Same players, for lookups by name
         self.current_player_index = 0
         
         # Card decks
         self.player_deck: List[PlayerCard] = []
         self.player_discard: List[PlayerCard] = []
-        self.infection_deck: List[InfectionCard] = []
+        self.player_cards: Dict[str, PlayerCard] = {}  # City and event cards by name, filled when the deck is built
+        self.infection_deck: Deque[InfectionCard] = deque()  # Top of the deck is the right end
         self.infection_discard: List[InfectionCard] = []
         
         # Game state flags
         self.quiet_night_active = False  # One Quiet Night event
         
         # Message history for communication between players
-        self.message_history: List[Dict] = []
+        self.message_history: List[Message] = []
+        
+        # Cities holding at least one cube, kept up to date by note_cubes_changed
+        self.infected_cities: Set[City] = set()
+        
+        # Last game_state_description result, cleared by mark_changed
+        self._desc_cache: Optional[str] = None
+    
+    def discard_from_hand(self, player: Player, name: str):
+        """Move a card from a player's hand to the discard pile, reusing the deck's card object"""
+        player.remove_card(name)
+        card = self.player_cards.get(name)
+        if card is None:
+            card = PlayerCard(name)
+        self.player_discard.append(card)
+    
+    def add_research_station(self, city: City):
+        """Build a research station in a city; callers check the city and the station limit first"""
+        self.mark_changed()
+        city.has_research_station = True
+        self.placed_research_stations += 1
+        self.research_station_cities.append(city)
+        self.research_station_cities.sort(key=_board_position)
+    
+    def mark_changed(self):
+        """Note that described state (cubes, cards, players, counters) changed since the last description"""
+        self._desc_cache = None
+    
+    def note_cubes_changed(self, city: City):
+        """Add or drop a city from infected_cities after its cube count changed"""
+        if city.total_cubes:
+            self.infected_cities.add(city)
+        else:
+            self.infected_cities.discard(city)
+    
+    def set_disease_status(self, color: DiseaseColor, status: DiseaseStatus):
+        if self.disease_status[color] is DiseaseStatus.ACTIVE and status is not DiseaseStatus.ACTIVE:
+            self.active_diseases -= 1
+        elif self.disease_status[color] is not DiseaseStatus.ACTIVE and status is DiseaseStatus.ACTIVE:
+            self.active_diseases += 1
+        self.disease_status[color] = status
+        self.cured_colors = [c for c, s in zip(DiseaseColor, self.disease_status) if s is DiseaseStatus.CURED]
+        self._diseases_text = self._build_diseases_text()
+    
+    def _build_diseases_text(self) -> str:
+        return "Diseases:\n" + "".join(
+            f"- {color.label}: {status.value}\n" for color, status in zip(DiseaseColor, self.disease_status)
+        )
     
     def get_current_player(self) -> Player:
         """Get the player whose turn it currently is"""
@@ -70,65 +143,68 @@ class GameState:
         """Advance to the next player's turn"""
         self.current_player_index = (self.current_player_index + 1) % len(self.players)
         self.players[self.current_player_index].action_points = 4  # Reset action points
+        self.mark_changed()
     
     def game_state_description(self) -> str:
         """Generate a text description of the current game state"""
-        description = []
+        # The description is requested for display and again by the agent with nothing
+        # changing in between, so reuse it until mark_changed is called
+        if self._desc_cache is not None:
+            return self._desc_cache
+        
+        buf = io.StringIO()
+        write = buf.write
         
         # Disease status
-        diseases_desc = []
-        for color, status in self.disease_status.items():
-            diseases_desc.append(f"{color.value}: {status.value}")
-        description.append("Diseases:\n" + "\n".join(f"- {d}" for d in diseases_desc))
+        write(self._diseases_text)
         
         # Outbreak counter
-        description.append(f"Outbreak Counter: {self.outbreak_counter}/8")
+        write(f"Outbreak Counter: {self.outbreak_counter}/8\n")
         
         # Infection rate
-        description.append(f"Infection Rate: {self.infection_rates[self.infection_rate_index]} (index: {self.infection_rate_index})")
+        write(f"Infection Rate: {self.infection_rates[self.infection_rate_index]} (index: {self.infection_rate_index})\n")
         
         # Research stations
-        stations = [city for city in self.cities.values() if city.has_research_station]
-        description.append(f"Research Stations ({len(stations)}/{self.total_research_stations}):")
+        stations = self.research_station_cities
+        write(f"Research Stations ({len(stations)}/{self.total_research_stations}):\n")
         for city in stations:
-            description.append(f"- {city.name}")
+            write(f"- {city.name}\n")
         
         # Current player
         current_player = self.get_current_player()
-        description.append(f"Current Player: {current_player.name} ({current_player.role.value})")
-        description.append(f"Location: {current_player.location}")
-        description.append(f"Actions Remaining: {current_player.action_points}")
-        description.append(f"Hand: {', '.join(current_player.hand)}")
+        write(f"Current Player: {current_player.display_label}\n")
+        write(f"Location: {current_player.location}\n")
+        write(f"Actions Remaining: {current_player.action_points}\n")
+        write(f"Hand: {', '.join(current_player.hand)}\n")
         
         # Most infected cities (top 5)
-        infected_cities = sorted(
-            [city for city in self.cities.values() if city.get_total_disease_cubes() > 0],
-            key=lambda c: c.get_total_disease_cubes(),
-            reverse=True
-        )[:5]
+        # Only cities with cubes are considered, and ties keep board order
+        infected_cities = heapq.nlargest(5, self.infected_cities, key=_infection_rank)
         
         if infected_cities:
-            description.append("Top Infected Cities:")
+            write("Top Infected Cities:\n")
             for city in infected_cities:
-                cubes_desc = ", ".join([f"{color.value}: {count}" for color, count in city.disease_cubes.items() if count > 0])
-                description.append(f"- {city.name}: {cubes_desc}")
+                cubes_desc = ", ".join(f"{color.label}: {count}" for color, count in zip(DiseaseColor, city.disease_cubes) if count > 0)
+                write(f"- {city.name}: {cubes_desc}\n")
         
-        return "\n".join(description)
+        self._desc_cache = buf.getvalue()[:-1]  # Drop the final newline
+        return self._desc_cache
     
     def is_game_over(self) -> Tuple[bool, str]:
         """Check if the game is over. Returns (is_over, reason)"""
         # Win condition: all diseases cured
-        if all(status != DiseaseStatus.ACTIVE for status in self.disease_status.values()):
+        if not self.active_diseases:
             return True, "Victory! All diseases have been cured."
         
         # Lose condition 1: Too many outbreaks
         if self.outbreak_counter >= 8:
             return True, "Defeat! Too many outbreaks occurred."
         
-        # Lose condition 2: Ran out of disease cubes
-        for color, count in self.disease_cubes.items():
-            if count <= 0:
-                return True, f"Defeat! Ran out of {color.value} disease cubes."
+        # Lose condition 2: Ran out of disease cubes (one min() over the four counts, then find which)
+        if min(self.disease_cubes) <= 0:
+            for color, count in zip(DiseaseColor, self.disease_cubes):
+                if count <= 0:
+                    return True, f"Defeat! Ran out of {color.label} disease cubes."
         
         # Lose condition 3: Ran out of player cards
         if not self.player_deck:
@@ -147,20 +223,10 @@ class GameState:
         if not self.can_players_communicate(sender, receiver):
             return False
         
-        # Add message to receiver's message queue
-        receiver.messages.append({
-            "sender": f"{sender.name} ({sender.role.value})",
-            "content": message,
-            "timestamp": time.time()
-        })
-        
-        # Add to message history
-        self.message_history.append({
-            "sender": f"{sender.name} ({sender.role.value})",
-            "receiver": f"{receiver.name} ({receiver.role.value})",
-            "content": message,
-            "timestamp": time.time()
-        })
+        # The receiver's queue and the history share one Message
+        msg = Message(sender.display_label, receiver.display_label, message, time.time())
+        receiver.messages.append(msg)
+        self.message_history.append(msg)
         
         return True
     
@@ -176,7 +242,7 @@ class GameState:
 
 
 class Game:
-    def __init__(self, num_players=2, difficulty="normal", seed=None):
+    def __init__(self, num_players=2, difficulty="normal", seed=None, verbose=True, cache=False, fast_path=False):
         """
         Initialize a new Pandemic game
         
@@ -184,9 +250,42 @@ class Game:
             num_players: Number of players (2-4)
             difficulty: Game difficulty (easy, normal, hard)
             seed: Random seed for deterministic behavior
+            verbose: Print the game's progress (turns, states, actions, infections)
+            cache: Let the agents reuse answers to identical prompts from an on-disk cache
+            fast_path: Let the agents take clearly right actions (cures, heavy treatments) without an LLM call
         """
-        if seed is not None:
-            random.seed(seed)
+        # The game's own random source, so separate games don't share (or reseed) the global one
+        self.rng = random.Random(seed)
+        
+        # Progress output is collected here and written in one go by _flush_log. Messages
+        # built with f-strings are guarded by "if self.verbose" so quiet games skip formatting.
+        self.verbose = verbose
+        self._log_lines: List[str] = []
+        
+        # Passed to each player's LLMAgent
+        self.cache = cache
+        self.fast_path = fast_path
+        
+        # Action type -> handler(current_player, action) returning (success, message)
+        self._action_handlers = {
+            "pass_turn": self._handle_pass_turn,
+            "move": self._handle_move,
+            "treat_disease": self._handle_treat_disease,
+            "build_research_station": self._handle_build_research_station,
+            "share_knowledge": self._handle_share_knowledge,
+            "discover_cure": self._handle_discover_cure,
+            "play_event": self._handle_play_event,
+            "communicate": self._handle_communicate,
+        }
+        
+        # Movement type -> check(current_player, current_city, destination) returning (allowed, message)
+        self._movement_handlers = {
+            "regular": self._move_regular,
+            "direct_flight": self._move_direct_flight,
+            "charter_flight": self._move_charter_flight,
+            "shuttle_flight": self._move_shuttle_flight,
+            "operations_expert": self._move_operations_expert,
+        }
         
         self.state = GameState()
         self.num_players = min(max(2, num_players), 4)  # Ensure 2-4 players
@@ -202,6 +301,16 @@ class Game:
         # Setup the game
         self.setup_game()
         
+    def _log(self, message: str):
+        if self.verbose:
+            self._log_lines.append(message)
+    
+    def _flush_log(self):
+        """Write out the collected progress lines"""
+        if self._log_lines:
+            sys.stdout.write("\n".join(self._log_lines) + "\n")
+            self._log_lines.clear()
+    
     def setup_game(self):
         """Setup the game board, players, and initial state"""
         # Initialize cities (simplified version with key cities)
@@ -218,8 +327,7 @@ class Game:
         self._perform_initial_infections()
         
         # Add research station to Atlanta and make it the starting location
-        self.state.cities["Atlanta"].has_research_station = True
-        self.state.placed_research_stations = 1
+        self.state.add_research_station(self.state.cities["Atlanta"])
         
         # Deal initial cards to players
         self._deal_initial_cards()
@@ -274,53 +382,72 @@ class Game:
         self.state.cities["Ho Chi Minh City"] = City("Ho Chi Minh City", DiseaseColor.RED, ["Hong Kong", "Manila", "Jakarta", "Bangkok"])
         self.state.cities["Jakarta"] = City("Jakarta", DiseaseColor.RED, ["Ho Chi Minh City", "Bangkok", "Chennai", "Sydney"])
         
+        # Resolve connection names to City objects once, so outbreaks don't look neighbours up
+        # by name. Some connections name cities that are not on this simplified board; they
+        # are left out instead of failing when an outbreak reaches them.
+        # Names are interned so the board keys, City.name, connections and the card names
+        # built from the keys are all the same string objects, and lookups match by identity.
+        cities = {sys.intern(name): city for name, city in self.state.cities.items()}
+        self.state.cities = cities
+        for index, city in enumerate(cities.values()):
+            city.name = sys.intern(city.name)
+            city.connections = [sys.intern(name) for name in city.connections]
+            city.connections_set = frozenset(city.connections)
+            city.board_index = index
+            city.neighbors = [cities[name] for name in city.connections if name in cities]
+        
+        # City card names of each color, indexed by DiseaseColor, for checking cure cards
+        self._city_names_by_color = [
+            frozenset(name for name, city in cities.items() if city.color == color) for color in DiseaseColor
+        ]
+        
     def _create_infection_deck(self):
         """Create and shuffle the infection deck"""
-        self.state.infection_deck = [InfectionCard(city) for city in self.state.cities.keys()]
-        random.shuffle(self.state.infection_deck)
+        infection_cards = [InfectionCard(city) for city in self.state.cities.keys()]
+        self.rng.shuffle(infection_cards)
+        self.state.infection_deck = deque(infection_cards)
         
     def _create_player_deck(self):
         """Create and shuffle the player deck with epidemic cards"""
-        # Create city cards
-        city_cards = [PlayerCard(city) for city in self.state.cities.keys()]
-        
-        # Add event cards
-        event_cards = [PlayerCard(event.value, is_event=True) for event in EventCard]
-        
-        # Combine and shuffle
-        player_cards = city_cards + event_cards
-        random.shuffle(player_cards)
+        # Create city cards and event cards, and shuffle them
+        player_cards = [PlayerCard(city) for city in self.state.cities.keys()]
+        player_cards.extend(PlayerCard(event.value, is_event=True) for event in EventCard)
+        self.state.player_cards = {card.name: card for card in player_cards}
+        self.rng.shuffle(player_cards)
         
         # Add epidemic cards based on difficulty
-        # In the official game, the deck is divided into equal piles, and one epidemic
-        # card is shuffled into each pile, then the piles are stacked
-        cards_per_pile = len(player_cards) // self.num_epidemic_cards
-        piles = []
-        
+        # In the official game, the deck is divided into piles as equal in size as possible,
+        # one epidemic card is shuffled into each pile, and the piles are stacked with the
+        # larger ones at the bottom. The cards are already shuffled, so inserting the
+        # epidemic card at a random position in its pile is equivalent, and the deck is
+        # built in place. Cards are drawn from the end of the list, so the bottom is the start.
+        cards_per_pile, larger_piles = divmod(len(player_cards), self.num_epidemic_cards)
+        
+        start_idx = 0
         for i in range(self.num_epidemic_cards):
-            start_idx = i * cards_per_pile
-            end_idx = (i + 1) * cards_per_pile if i < self.num_epidemic_cards - 1 else len(player_cards)
-            pile = player_cards[start_idx:end_idx]
-            pile.append(PlayerCard("Epidemic", is_epidemic=True))
-            random.shuffle(pile)
-            piles.append(pile)
-        
-        # Combine the piles to form the final deck
-        self.state.player_deck = []
-        for pile in piles:
-            self.state.player_deck.extend(pile)
+            pile_size = cards_per_pile + 1 if i < larger_piles else cards_per_pile
+            player_cards.insert(self.rng.randint(start_idx, start_idx + pile_size), PlayerCard("Epidemic", is_epidemic=True))
+            start_idx += pile_size + 1  # The pile now includes its epidemic card
+        
+        self.state.player_deck = player_cards
     
     def _create_players(self):
         """Create the players with random roles and place them in Atlanta"""
         # Available roles
         available_roles = list(PlayerRole)
-        random.shuffle(available_roles)
+        self.rng.shuffle(available_roles)
         
         # Create players
         for i in range(self.num_players):
             role = available_roles[i]
             player = Player(f"Player {i+1}", role, "Atlanta")
             self.state.players.append(player)
+            self.state.players_by_name[player.name] = player
+        
+        # Give each player its LLM agent up front (imported here: llm_agent imports this module)
+        from llm_agent import LLMAgent
+        for player in self.state.players:
+            player.agent = LLMAgent(player, cache=self.cache, fast_path=self.fast_path)
     
     def _deal_initial_cards(self):
         """Deal initial cards to players"""
@@ -336,7 +463,7 @@ class Game:
             for _ in range(cards_per_player):
                 if self.state.player_deck:
                     card = self.state.player_deck.pop()
-                    player.hand.append(card.name)
+                    player.add_card(card.name)
     
     def _perform_initial_infections(self):
         """Perform initial infections (3 cities with 3 cubes, 3 with 2, 3 with 1)"""
@@ -347,61 +474,70 @@ class Game:
                     city = self.state.cities[infection_card.city_name]
                     
                     # Add cubes to the city
-                    for _ in range(num_cubes):
-                        self._add_disease_cube(city, city.color)
+                    self._add_disease_cubes(city, city.color, num_cubes)
                     
                     # Add card to discard pile
                     self.state.infection_discard.append(infection_card)
     
-    def _add_disease_cube(self, city: City, color: DiseaseColor) -> bool:
-        """Add a disease cube to a city, handling outbreaks if necessary"""
+    def _add_disease_cubes(self, city: City, color: DiseaseColor, count: int = 1) -> bool:
+        """Add disease cubes to a city; going past 3 causes a single outbreak"""
+        self.state.mark_changed()
+        
         # Check if disease is eradicated
-        if self.state.disease_status[color] == DiseaseStatus.ERADICATED:
+        if self.state.disease_status[color] is DiseaseStatus.ERADICATED:
             return True
         
-        # Check if we have cubes available
-        if self.state.disease_cubes[color] <= 0:
-            return False
-        
-        # Try to add cube to city
-        success = city.add_disease_cube(color)
+        # Place as many cubes as the supply allows, up to the city's limit of 3
+        wanted = min(count, self.state.disease_cubes[color])
+        added = city.add_disease_cubes(color, wanted)
+        if added:
+            self.state.disease_cubes[color] -= added
+            self.state.note_cubes_changed(city)
         
-        if success:
-            # Cube was added, decrease available cubes
-            self.state.disease_cubes[color] -= 1
-            return True
-        else:
-            # Outbreak occurred (4th cube)
+        if added < wanted:
+            # The city was full: outbreak
             return self._handle_outbreak(city, color)
+        # False if the supply ran out before all cubes were placed
+        return wanted == count
     
     def _handle_outbreak(self, city: City, color: DiseaseColor) -> bool:
-        """Handle an outbreak in a city"""
-        # Increment outbreak counter
-        self.state.outbreak_counter += 1
-        
-        print(f"⚠️ Outbreak in {city.name}! ({self.state.outbreak_counter}/8)")
-        
-        # Check for game over
-        if self.state.outbreak_counter >= 8:
-            return False
-        
-        # To avoid chain reactions to the same city, we'll keep track of cities already affected
-        # by this chain of outbreaks
-        outbreak_chain = set([city.name])
-        
-        # Add one cube of matching color to all connected cities
-        for connected_city_name in city.connections:
-            connected_city = self.state.cities[connected_city_name]
+        """Handle an outbreak in a city and any chain reaction it sets off"""
+        # Cities that already had an outbreak in this chain don't get another cube, so
+        # each city outbreaks at most once. The chain is resolved breadth-first from a
+        # worklist rather than by recursing through _add_disease_cubes.
+        outbreak_chain = {city}
+        worklist = deque([city])
+        
+        while worklist:
+            outbreak_city = worklist.popleft()
             
-            # Skip if already in the outbreak chain
-            if connected_city_name in outbreak_chain:
-                continue
-                
-            # Add cube to connected city, potentially triggering more outbreaks
-            success = self._add_disease_cube(connected_city, color)
+            # Increment outbreak counter
+            self.state.outbreak_counter += 1
             
-            if not success:
+            if self.verbose:
+                self._log(f"⚠️ Outbreak in {outbreak_city.name}! ({self.state.outbreak_counter}/8)")
+            
+            # Check for game over
+            if self.state.outbreak_counter >= 8:
                 return False
+            
+            # Add one cube of matching color to all connected cities
+            for connected_city in outbreak_city.neighbors:
+                # Skip if already in the outbreak chain
+                if connected_city in outbreak_chain:
+                    continue
+                
+                # Check if we have cubes available
+                if self.state.disease_cubes[color] <= 0:
+                    return False
+                
+                if connected_city.add_disease_cube(color):
+                    self.state.disease_cubes[color] -= 1
+                    self.state.note_cubes_changed(connected_city)
+                else:
+                    # Already at 3 cubes: this city outbreaks next
+                    outbreak_chain.add(connected_city)
+                    worklist.append(connected_city)
         
         return True
     
@@ -410,15 +546,21 @@ class Game:
         Play a turn for the current player
         
         Args:
-            actions: List of action dictionaries if pre-defined, otherwise LLM will be used
+            actions: List of action dictionaries if pre-defined, otherwise LLM will be used.
+                Pass a deque to have the actions used up by this turn removed from it.
         """
-        current_player = self.state.get_current_player()
-        print(f"\n{Colors.BOLD}🎮 {current_player.name}'s Turn ({current_player.role.value}){Colors.ENDC}")
+        try:
+            return self._play_turn(actions)
+        finally:
+            self._flush_log()
+    
+    def _play_turn(self, actions):
+        if actions and not isinstance(actions, deque):
+            actions = deque(actions)
         
-        # Create LLM agent if needed
-        if not hasattr(current_player, 'agent'):
-            from llm_agent import LLMAgent
-            current_player.agent = LLMAgent(current_player)
+        current_player = self.state.get_current_player()
+        if self.verbose:
+            self._log(f"\n{Colors.BOLD}🎮 {current_player.name}'s Turn ({current_player.role.value}){Colors.ENDC}")
         
         # 1. Do up to 4 actions
         for _ in range(4):
@@ -426,36 +568,47 @@ class Game:
                 break
                 
             # Display current game state
-            print(f"\n{self.state.game_state_description()}")
+            if self.verbose:
+                self._log(f"\n{self.state.game_state_description()}")
             
             # Get action from LLM agent or use predefined actions
-            if actions and len(actions) > 0:
-                action_result = actions.pop(0)
-                print(f"Using predefined action: {action_result['action_type']}")
+            if actions:
+                action_result = actions.popleft()
+                if self.verbose:
+                    self._log(f"Using predefined action: {action_result['action_type']}")
             else:
                 # Get action from LLM agent
                 try:
-                    print(f"\n{Colors.BOLD}Getting action from {current_player.name}...{Colors.ENDC}")
+                    if self.verbose:
+                        self._log(f"\n{Colors.BOLD}Getting action from {current_player.name}...{Colors.ENDC}")
+                    self._flush_log()  # The agent may print too; keep the output in order
                     action_result = current_player.agent.get_action(self.state)
-                    print(f"Action: {action_result['action_type']}")
-                    if 'explanation' in action_result:
-                        print(f"Reasoning: {action_result['explanation']}")
+                    if "action_type" not in action_result:
+                        action_result = {"action_type": "pass_turn", "reason": "Reply had no action_type"}
+                    if self.verbose:
+                        self._log(f"Action: {action_result['action_type']}")
+                        if 'explanation' in action_result:
+                            self._log(f"Reasoning: {action_result['explanation']}")
                 except Exception as e:
-                    print(f"{Colors.RED}Error getting action from LLM agent: {str(e)}{Colors.ENDC}")
+                    if self.verbose:
+                        self._log(f"{Colors.RED}Error getting action from LLM agent: {str(e)}{Colors.ENDC}")
                     action_result = {"action_type": "pass_turn", "reason": f"Error: {str(e)}"}
             
             # Apply the action and update state
             success, message = self._apply_action(action_result)
+            self.state.mark_changed()  # Actions can change any part of the description
             if success:
                 current_player.action_points -= 1
-                print(f"{Colors.GREEN}✓ {message}{Colors.ENDC}")
-            else:
-                print(f"{Colors.RED}✗ {message}{Colors.ENDC}")
+                if self.verbose:
+                    self._log(f"{Colors.GREEN}✓ {message}{Colors.ENDC}")
+            elif self.verbose:
+                self._log(f"{Colors.RED}✗ {message}{Colors.ENDC}")
             
             # Check if game is over after action
             game_over, reason = self.state.is_game_over()
             if game_over:
-                print(f"\n{reason}")
+                if self.verbose:
+                    self._log(f"\n{reason}")
                 return game_over, reason
         
         # 2. Draw 2 player cards
@@ -465,7 +618,7 @@ class Game:
         for _ in range(2):
             # Check if player deck is empty
             if not self.state.player_deck:
-                print("\n🚨 Game over: Player deck is empty!")
+                self._log("\n🚨 Game over: Player deck is empty!")
                 return True, "Defeat! The player deck is empty."
             
             # Draw a card
@@ -474,7 +627,8 @@ class Game:
             if card.is_epidemic:
                 # Handle epidemic
                 epidemics += 1
-                print(f"\n⚠️ {Colors.RED}{Colors.BOLD}EPIDEMIC!{Colors.ENDC}")
+                if self.verbose:
+                    self._log(f"\n⚠️ {Colors.RED}{Colors.BOLD}EPIDEMIC!{Colors.ENDC}")
                 drawn_cards.append("Epidemic")
                 
                 # Resolve epidemic:
@@ -483,45 +637,46 @@ class Game:
                 
                 # 2. Infect: Draw bottom card from infection deck
                 if self.state.infection_deck:
-                    epidemic_city_card = self.state.infection_deck[0]  # Bottom card
-                    self.state.infection_deck.pop(0)
+                    epidemic_city_card = self.state.infection_deck.popleft()  # Bottom card
                     
                     epidemic_city = self.state.cities[epidemic_city_card.city_name]
-                    print(f"Epidemic in {epidemic_city.name}!")
+                    if self.verbose:
+                        self._log(f"Epidemic in {epidemic_city.name}!")
                     
                     # Add 3 cubes of the city's color
-                    for _ in range(3):
-                        self._add_disease_cube(epidemic_city, epidemic_city.color)
+                    self._add_disease_cubes(epidemic_city, epidemic_city.color, 3)
                     
                     # Add card to infection discard
                     self.state.infection_discard.append(epidemic_city_card)
                 
-                # 3. Intensify: Shuffle infection discard and put on top of infection deck
-                random.shuffle(self.state.infection_discard)
-                self.state.infection_deck = self.state.infection_discard + self.state.infection_deck
-                self.state.infection_discard = []
+                # 3. Intensify: Shuffle infection discard and put on top of infection deck (the right end)
+                self.rng.shuffle(self.state.infection_discard)
+                self.state.infection_deck.extend(self.state.infection_discard)
+                self.state.infection_discard.clear()
             else:
                 # Regular card draw
                 drawn_cards.append(card.name)
                 current_player.add_card(card.name)
                 
                 # Check hand limit (7 cards)
-                if len(current_player.hand) > 7:
+                if current_player.hand_size() > 7:
                     # TODO: Ask player which card to discard
                     # For now, just discard the first card
-                    discard_card = current_player.hand[0]
-                    current_player.remove_card(discard_card)
+                    discard_card = current_player.first_card()
+                    self.state.discard_from_hand(current_player, discard_card)
                     
-                    print(f"{current_player.name} discards {discard_card} (hand limit reached)")
-                    self.state.player_discard.append(PlayerCard(discard_card, 
-                                                               is_event="Event:" in discard_card))
+                    if self.verbose:
+                        self._log(f"{current_player.name} discards {discard_card} (hand limit reached)")
         
-        print(f"{current_player.name} drew: {', '.join(drawn_cards)}")
+        if self.verbose:
+            self._log(f"{current_player.name} drew: {', '.join(drawn_cards)}")
+        self.state.mark_changed()  # New cards in hand, and epidemics raise the infection rate
         
         # Check if game is over after drawing cards
         game_over, reason = self.state.is_game_over()
         if game_over:
-            print(f"\n{reason}")
+            if self.verbose:
+                self._log(f"\n{reason}")
             return game_over, reason
         
         # 3. Infect cities
@@ -531,13 +686,14 @@ class Game:
             # Reset quiet night if it was active
             self.state.quiet_night_active = False
         else:
-            print("🌙 One Quiet Night event is active - skipping infection phase!")
+            self._log("🌙 One Quiet Night event is active - skipping infection phase!")
             self.state.quiet_night_active = False
         
         # Check if game is over after infections
         game_over, reason = self.state.is_game_over()
         if game_over:
-            print(f"\n{reason}")
+            if self.verbose:
+                self._log(f"\n{reason}")
             return game_over, reason
         
         # Advance to next player
@@ -545,532 +701,431 @@ class Game:
         
         return False, ""
     
+    def _apply_medic_arrival(self, player: Player, city: City):
+        """Medic ability: arriving in a city removes all cubes of cured diseases there"""
+        if player.role is not PlayerRole.MEDIC:
+            return
+        for color in self.state.cured_colors:
+            cubes_removed = city.clear_disease_cubes(color)
+            if cubes_removed > 0:
+                self.state.disease_cubes[color] += cubes_removed  # Return to supply
+                self.state.note_cubes_changed(city)
+                if self.verbose:
+                    self._log(f"Medic automatically removed {cubes_removed} {color.label} cubes from {city.name}")
+    
     def _apply_action(self, action):
         """Apply a player action to the game state and return (success, message)"""
         action_type = action.get("action_type", "")
-        current_player = self.state.get_current_player()
-        
-        # Pass turn
-        if action_type == "pass_turn":
-            reason = action.get("reason", "No reason provided")
-            return True, f"{current_player.name} passes their action. Reason: {reason}"
-        
-        # Movement actions
-        elif action_type == "move":
-            destination = action.get("destination")
-            movement_type = action.get("movement_type", "regular")
-            
-            if not destination:
-                return False, "No destination specified for movement"
-            
-            # Check if destination exists
-            if destination not in self.state.cities:
-                return False, f"Invalid destination: {destination}"
-            
-            # Handle different movement types
-            if movement_type == "regular":
-                # Check if destination is connected to current location
-                if destination not in self.state.cities[current_player.location].connections:
-                    return False, f"{destination} is not connected to {current_player.location}"
-                
-                # Move player
-                current_player.location = destination
-                
-                # If player is Medic, automatically remove cubes of cured diseases
-                if current_player.role == PlayerRole.MEDIC:
-                    for color, status in self.state.disease_status.items():
-                        if status == DiseaseStatus.CURED:
-                            city = self.state.cities[destination]
-                            cubes_removed = 0
-                            while city.disease_cubes[color] > 0:
-                                city.remove_disease_cube(color)
-                                self.state.disease_cubes[color] += 1  # Return to supply
-                                cubes_removed += 1
-                            if cubes_removed > 0:
-                                print(f"Medic automatically removed {cubes_removed} {color.value} cubes from {destination}")
-                
-                return True, f"{current_player.name} moved to {destination}"
-                
-            elif movement_type == "direct_flight":
-                # Check if player has the destination card
-                if not current_player.has_city_card(destination):
-                    return False, f"{current_player.name} doesn't have the {destination} card for direct flight"
-                
-                # Discard the card and move
-                current_player.remove_card(destination)
-                self.state.player_discard.append(PlayerCard(destination))
-                
-                # Update location
-                current_player.location = destination
-                
-                # Medic special ability for cured diseases
-                if current_player.role == PlayerRole.MEDIC:
-                    for color, status in self.state.disease_status.items():
-                        if status == DiseaseStatus.CURED:
-                            city = self.state.cities[destination]
-                            cubes_removed = 0
-                            while city.disease_cubes[color] > 0:
-                                city.remove_disease_cube(color)
-                                self.state.disease_cubes[color] += 1
-                                cubes_removed += 1
-                            if cubes_removed > 0:
-                                print(f"Medic automatically removed {cubes_removed} {color.value} cubes from {destination}")
-                
-                return True, f"{current_player.name} took a direct flight to {destination}"
-                
-            elif movement_type == "charter_flight":
-                # Check if player has their current location card
-                current_location = current_player.location
-                if not current_player.has_city_card(current_location):
-                    return False, f"{current_player.name} doesn't have the {current_location} card for charter flight"
-                
-                # Discard the card and move
-                current_player.remove_card(current_location)
-                self.state.player_discard.append(PlayerCard(current_location))
-                
-                # Update location
-                current_player.location = destination
-                
-                # Medic special ability
-                if current_player.role == PlayerRole.MEDIC:
-                    for color, status in self.state.disease_status.items():
-                        if status == DiseaseStatus.CURED:
-                            city = self.state.cities[destination]
-                            cubes_removed = 0
-                            while city.disease_cubes[color] > 0:
-                                city.remove_disease_cube(color)
-                                self.state.disease_cubes[color] += 1
-                                cubes_removed += 1
-                            if cubes_removed > 0:
-                                print(f"Medic automatically removed {cubes_removed} {color.value} cubes from {destination}")
-                
-                return True, f"{current_player.name} took a charter flight to {destination}"
-                
-            elif movement_type == "shuttle_flight":
-                # Check if current location has a research station
-                current_location = current_player.location
-                if not self.state.cities[current_location].has_research_station:
-                    return False, f"{current_location} does not have a research station"
-                
-                # Check if destination has a research station
-                if not self.state.cities[destination].has_research_station:
-                    return False, f"{destination} does not have a research station"
-                
-                # Move player
-                current_player.location = destination
-                
-                # Medic special ability
-                if current_player.role == PlayerRole.MEDIC:
-                    for color, status in self.state.disease_status.items():
-                        if status == DiseaseStatus.CURED:
-                            city = self.state.cities[destination]
-                            cubes_removed = 0
-                            while city.disease_cubes[color] > 0:
-                                city.remove_disease_cube(color)
-                                self.state.disease_cubes[color] += 1
-                                cubes_removed += 1
-                            if cubes_removed > 0:
-                                print(f"Medic automatically removed {cubes_removed} {color.value} cubes from {destination}")
-                
-                return True, f"{current_player.name} took a shuttle flight to {destination}"
-                
-            elif movement_type == "operations_expert":
-                # Check if player is Operations Expert
-                if current_player.role != PlayerRole.OPERATIONS_EXPERT:
-                    return False, "Only the Operations Expert can use this movement type"
-                
-                # Check if current location has a research station
-                if not self.state.cities[current_player.location].has_research_station:
-                    return False, "Operations Expert must be at a research station to use this ability"
-                
-                # Check if player has any city card to discard
-                if not current_player.hand:
-                    return False, "Operations Expert needs a city card to discard for this ability"
-                
-                # For simplicity, just discard the first card in hand
-                card_to_discard = current_player.hand[0]
-                current_player.remove_card(card_to_discard)
-                self.state.player_discard.append(PlayerCard(card_to_discard))
-                
-                # Move player
-                current_player.location = destination
-                
-                # Medic special ability
-                if current_player.role == PlayerRole.MEDIC:
-                    for color, status in self.state.disease_status.items():
-                        if status == DiseaseStatus.CURED:
-                            city = self.state.cities[destination]
-                            cubes_removed = 0
-                            while city.disease_cubes[color] > 0:
-                                city.remove_disease_cube(color)
-                                self.state.disease_cubes[color] += 1
-                                cubes_removed += 1
-                            if cubes_removed > 0:
-                                print(f"Medic automatically removed {cubes_removed} {color.value} cubes from {destination}")
-                
-                return True, f"Operations Expert {current_player.name} moved to {destination} by discarding {card_to_discard}"
+        handler = self._action_handlers.get(action_type)
+        if handler is None:
+            return False, f"Unknown action type: {action_type}"
+        return handler(self.state.get_current_player(), action)
+    
+    def _handle_pass_turn(self, current_player: Player, action: dict) -> Tuple[bool, str]:
+        """Give up the action, with the agent's reason"""
+        reason = action.get("reason", "No reason provided")
+        return True, f"{current_player.name} passes their action. Reason: {reason}"
+    
+    def _handle_move(self, current_player: Player, action: dict) -> Tuple[bool, str]:
+        """Move by drive/ferry, direct, charter or shuttle flight, or the Operations Expert ability"""
+        destination = action.get("destination")
+        movement_type = action.get("movement_type", "regular")
+        
+        if not destination:
+            return False, "No destination specified for movement"
+        
+        # Check if destination exists
+        cities = self.state.cities
+        destination_city = cities.get(destination)
+        if destination_city is None:
+            return False, f"Invalid destination: {destination}"
+        
+        current_city = cities[current_player.location]
+        
+        # Check and pay for the movement type, then move
+        move = self._movement_handlers.get(movement_type)
+        if move is None:
+            return False, f"Unknown movement type: {movement_type}"
+        success, message = move(current_player, current_city, destination_city)
+        if success:
+            current_player.location = destination_city.name  # The board's interned name, not the agent's copy
             
-            else:
-                return False, f"Unknown movement type: {movement_type}"
+            # Medic special ability for cured diseases
+            self._apply_medic_arrival(current_player, destination_city)
+        return success, message
+    
+    # Movement types: each checks the move is allowed, discards any card it costs,
+    # and returns (allowed, message); _handle_move does the moving
+    
+    def _move_regular(self, current_player: Player, current_city: City, destination_city: City) -> Tuple[bool, str]:
+        """Drive/ferry to a connected city"""
+        if destination_city.name not in current_city.connections_set:
+            return False, f"{destination_city.name} is not connected to {current_player.location}"
+        return True, f"{current_player.name} moved to {destination_city.name}"
+    
+    def _move_direct_flight(self, current_player: Player, current_city: City, destination_city: City) -> Tuple[bool, str]:
+        """Discard the destination's card to fly there"""
+        if not current_player.has_city_card(destination_city.name):
+            return False, f"{current_player.name} doesn't have the {destination_city.name} card for direct flight"
         
-        # Treat disease
-        elif action_type == "treat_disease":
-            disease_color_str = action.get("disease_color")
-            if not disease_color_str:
-                return False, "No disease color specified for treatment"
-            
-            # Convert string to enum value
-            try:
-                disease_color = getattr(DiseaseColor, disease_color_str.upper())
-            except (AttributeError, ValueError):
-                return False, f"Invalid disease color: {disease_color_str}"
-            
-            # Check if there are cubes to remove
-            city = self.state.cities[current_player.location]
-            if city.disease_cubes[disease_color] <= 0:
-                return False, f"No {disease_color.value} disease cubes in {city.name}"
-            
-            # Check if disease is cured
-            is_cured = self.state.disease_status[disease_color] != DiseaseStatus.ACTIVE
-            
-            # Special handling for Medic (remove all cubes of one color)
-            if current_player.role == PlayerRole.MEDIC:
-                cubes_removed = city.disease_cubes[disease_color]
-                for _ in range(cubes_removed):
-                    city.remove_disease_cube(disease_color)
-                    self.state.disease_cubes[disease_color] += 1  # Return cubes to supply
-                
-                return True, f"Medic {current_player.name} removed all {cubes_removed} {disease_color.value} cubes from {city.name}"
+        self.state.discard_from_hand(current_player, destination_city.name)
+        return True, f"{current_player.name} took a direct flight to {destination_city.name}"
+    
+    def _move_charter_flight(self, current_player: Player, current_city: City, destination_city: City) -> Tuple[bool, str]:
+        """Discard the current city's card to fly anywhere"""
+        current_location = current_player.location
+        if not current_player.has_city_card(current_location):
+            return False, f"{current_player.name} doesn't have the {current_location} card for charter flight"
+        
+        self.state.discard_from_hand(current_player, current_location)
+        return True, f"{current_player.name} took a charter flight to {destination_city.name}"
+    
+    def _move_shuttle_flight(self, current_player: Player, current_city: City, destination_city: City) -> Tuple[bool, str]:
+        """Fly between two research stations"""
+        if not current_city.has_research_station:
+            return False, f"{current_player.location} does not have a research station"
+        if not destination_city.has_research_station:
+            return False, f"{destination_city.name} does not have a research station"
+        return True, f"{current_player.name} took a shuttle flight to {destination_city.name}"
+    
+    def _move_operations_expert(self, current_player: Player, current_city: City, destination_city: City) -> Tuple[bool, str]:
+        """Operations Expert: from a research station, discard any card to move anywhere"""
+        if current_player.role is not PlayerRole.OPERATIONS_EXPERT:
+            return False, "Only the Operations Expert can use this movement type"
+        if not current_city.has_research_station:
+            return False, "Operations Expert must be at a research station to use this ability"
+        if not current_player.hand:
+            return False, "Operations Expert needs a city card to discard for this ability"
+        
+        # For simplicity, just discard the first card in hand
+        card_to_discard = current_player.first_card()
+        self.state.discard_from_hand(current_player, card_to_discard)
+        return True, f"Operations Expert {current_player.name} moved to {destination_city.name} by discarding {card_to_discard}"
+    
+    def _handle_treat_disease(self, current_player: Player, action: dict) -> Tuple[bool, str]:
+        """Remove disease cubes from the current city"""
+        state = self.state
+        disease_color_str = action.get("disease_color")
+        if not disease_color_str:
+            return False, "No disease color specified for treatment"
+        
+        # Convert string to enum value
+        disease_color = _parse_disease_color(disease_color_str)
+        if disease_color is None:
+            return False, f"Invalid disease color: {disease_color_str}"
+        
+        # Check if there are cubes to remove
+        city = state.cities[current_player.location]
+        if city.disease_cubes[disease_color] <= 0:
+            return False, f"No {disease_color.label} disease cubes in {city.name}"
+        
+        # Check if disease is cured
+        is_cured = state.disease_status[disease_color] is not DiseaseStatus.ACTIVE
+        
+        # Special handling for Medic (remove all cubes of one color)
+        if current_player.role is PlayerRole.MEDIC:
+            cubes_removed = city.clear_disease_cubes(disease_color)
+            state.disease_cubes[disease_color] += cubes_removed  # Return cubes to supply
+            state.note_cubes_changed(city)
             
-            # Regular treatment (if cured, remove all cubes)
-            if is_cured:
-                cubes_removed = city.disease_cubes[disease_color]
-                for _ in range(cubes_removed):
-                    city.remove_disease_cube(disease_color)
-                    self.state.disease_cubes[disease_color] += 1
-                
-                return True, f"{current_player.name} removed all {cubes_removed} {disease_color.value} cubes from {city.name} (disease is cured)"
-            else:
-                # Remove just one cube
-                city.remove_disease_cube(disease_color)
-                self.state.disease_cubes[disease_color] += 1
-                
-                return True, f"{current_player.name} removed 1 {disease_color.value} cube from {city.name}"
+            return True, f"Medic {current_player.name} removed all {cubes_removed} {disease_color.label} cubes from {city.name}"
         
-        # Build research station
-        elif action_type == "build_research_station":
-            city = self.state.cities[current_player.location]
-            
-            # Check if research station already exists
-            if city.has_research_station:
-                return False, f"{city.name} already has a research station"
-            
-            # Check if we've reached the maximum number of research stations
-            if self.state.placed_research_stations >= self.state.total_research_stations:
-                return False, f"Maximum number of research stations ({self.state.total_research_stations}) already built"
-            
-            use_ops_expert = action.get("use_operations_expert", False)
+        # Regular treatment (if cured, remove all cubes)
+        if is_cured:
+            cubes_removed = city.clear_disease_cubes(disease_color)
+            state.disease_cubes[disease_color] += cubes_removed
+            state.note_cubes_changed(city)
             
-            # Operations Expert can build without a card
-            if use_ops_expert and current_player.role == PlayerRole.OPERATIONS_EXPERT:
-                city.has_research_station = True
-                self.state.placed_research_stations += 1
-                return True, f"Operations Expert {current_player.name} built a research station in {city.name}"
-            
-            # Regular build requires the matching city card
-            if not current_player.has_city_card(city.name):
-                return False, f"{current_player.name} doesn't have the {city.name} card to build a research station"
-            
-            # Discard the card and build
-            current_player.remove_card(city.name)
-            self.state.player_discard.append(PlayerCard(city.name))
-            
-            city.has_research_station = True
-            self.state.placed_research_stations += 1
+            return True, f"{current_player.name} removed all {cubes_removed} {disease_color.label} cubes from {city.name} (disease is cured)"
+        else:
+            # Remove just one cube
+            city.remove_disease_cube(disease_color)
+            state.disease_cubes[disease_color] += 1
+            state.note_cubes_changed(city)
             
-            return True, f"{current_player.name} built a research station in {city.name}"
+            return True, f"{current_player.name} removed 1 {disease_color.label} cube from {city.name}"
+    
+    def _handle_build_research_station(self, current_player: Player, action: dict) -> Tuple[bool, str]:
+        """Build a research station in the current city"""
+        state = self.state
+        use_ops_expert = action.get("use_operations_expert", False)
+        city = state.cities[current_player.location]
         
-        # Share knowledge
-        elif action_type == "share_knowledge":
-            card_name = action.get("card_name")
-            player_name = action.get("player_name")
-            direction = action.get("direction", "give")  # "give" or "take"
-            
-            if not card_name:
-                return False, "No card specified for knowledge sharing"
-            
-            if not player_name:
-                return False, "No target player specified for knowledge sharing"
+        # Check if research station already exists
+        if city.has_research_station:
+            return False, f"{city.name} already has a research station"
+        
+        # Check if we've reached the maximum number of research stations
+        if state.placed_research_stations >= state.total_research_stations:
+            return False, f"Maximum number of research stations ({state.total_research_stations}) already built"
+        
+        # Operations Expert can build without a card
+        if use_ops_expert and current_player.role is PlayerRole.OPERATIONS_EXPERT:
+            state.add_research_station(city)
+            return True, f"Operations Expert {current_player.name} built a research station in {city.name}"
+        
+        # Regular build requires the matching city card
+        if not current_player.has_city_card(city.name):
+            return False, f"{current_player.name} doesn't have the {city.name} card to build a research station"
+        
+        # Discard the card and build
+        state.discard_from_hand(current_player, city.name)
+        
+        state.add_research_station(city)
+        
+        return True, f"{current_player.name} built a research station in {city.name}"
+    
+    def _handle_share_knowledge(self, current_player: Player, action: dict) -> Tuple[bool, str]:
+        """Give or take a city card with another player in the same city"""
+        card_name = action.get("card_name")
+        player_name = action.get("player_name")
+        direction = action.get("direction", "give")  # "give" or "take"
+        
+        if not card_name:
+            return False, "No card specified for knowledge sharing"
+        
+        if not player_name:
+            return False, "No target player specified for knowledge sharing"
+        
+        # Find target player
+        target_player = self.state.players_by_name.get(player_name)
+        if not target_player:
+            return False, f"Player {player_name} not found"
+        
+        # Check if players are in same location
+        if current_player.location != target_player.location:
+            return False, f"{current_player.name} and {target_player.name} must be in the same city to share knowledge"
+        
+        # Handle Researcher's special ability
+        is_researcher = (current_player.role is PlayerRole.RESEARCHER and direction == "give") or \
+                         (target_player.role is PlayerRole.RESEARCHER and direction == "take")
+        
+        # Determine giver and receiver based on direction
+        if direction == "give":
+            giver, receiver = current_player, target_player
+        else:  # "take"
+            giver, receiver = target_player, current_player
+        
+        # Normal sharing requires card to match current location
+        if not is_researcher and card_name != giver.location:
+            return False, f"Can only share {giver.location} cards when not using Researcher ability"
+        
+        # Check if giver has the card
+        if not giver.has_city_card(card_name):
+            return False, f"{giver.name} doesn't have the {card_name} card to share"
+        
+        # Transfer the card
+        giver.remove_card(card_name)
+        receiver.add_card(card_name)
+        
+        if is_researcher:
+            return True, f"Researcher shared {card_name} card from {giver.name} to {receiver.name}"
+        else:
+            return True, f"{giver.name} shared {card_name} card with {receiver.name}"
+    
+    def _handle_discover_cure(self, current_player: Player, action: dict) -> Tuple[bool, str]:
+        """Discard city cards of one color at a research station to cure that disease"""
+        state = self.state
+        disease_color_str = action.get("disease_color")
+        card_names = action.get("card_names", [])
+        
+        if not disease_color_str:
+            return False, "No disease color specified for cure discovery"
+        
+        # Convert string to enum value
+        disease_color = _parse_disease_color(disease_color_str)
+        if disease_color is None:
+            return False, f"Invalid disease color: {disease_color_str}"
+        
+        # Check if disease is already cured
+        if state.disease_status[disease_color] is not DiseaseStatus.ACTIVE:
+            return False, f"The {disease_color.label} disease is already cured"
+        
+        # Check if at a research station
+        if not state.cities[current_player.location].has_research_station:
+            return False, f"{current_player.name} must be at a research station to discover a cure"
+        
+        # Determine required number of cards (Scientist needs only 4)
+        cards_required = 4 if current_player.role is PlayerRole.SCIENTIST else 5
+        
+        # Check if enough cards are provided
+        if len(card_names) < cards_required:
+            return False, f"Need {cards_required} cards of {disease_color.label} color to discover a cure (only {len(card_names)} provided)"
+        
+        # Check if player has all the specified cards (a card named twice needs two copies)
+        needed = Counter(card_names)
+        for card, copies in needed.items():
+            if current_player.hand.get(card, 0) < copies:
+                return False, f"{current_player.name} doesn't have the {card} card"
+        
+        # Check if all cards are city cards of the disease's color
+        wrong_cards = needed.keys() - self._city_names_by_color[disease_color]
+        if wrong_cards:
+            card = next(card for card in needed if card in wrong_cards)
+            return False, f"{card} is not a {disease_color.label} city card"
+        
+        # Discard the cards and cure the disease
+        for card in card_names:
+            state.discard_from_hand(current_player, card)
+        
+        state.set_disease_status(disease_color, DiseaseStatus.CURED)
+        
+        # If Medic is in play, automatically remove cubes of the cured disease
+        for player in state.players:
+            if player.role is PlayerRole.MEDIC:
+                medic_city = state.cities[player.location]
+                cubes_removed = medic_city.clear_disease_cubes(disease_color)
+                state.disease_cubes[disease_color] += cubes_removed
+                if cubes_removed > 0:
+                    state.note_cubes_changed(medic_city)
+                    if self.verbose:
+                        self._log(f"Medic automatically removed {cubes_removed} {disease_color.label} cubes from {player.location}")
+        
+        return True, f"{current_player.name} discovered a cure for the {disease_color.label} disease!"
+    
+    def _handle_play_event(self, current_player: Player, action: dict) -> Tuple[bool, str]:
+        """Play an event card from the player's hand"""
+        state = self.state
+        event_name = action.get("event_name")
+        target_player_name = action.get("target_player")  # Airlift
+        target_city = action.get("target_city")  # Airlift, Government Grant
+        if not event_name:
+            return False, "No event card specified"
+        
+        # Check if player has the event card
+        if event_name not in current_player.hand:
+            return False, f"{current_player.name} doesn't have the {event_name} event card"
+        
+        # Handle different event cards
+        if event_name == "Airlift":
+            if not target_player_name or not target_city:
+                return False, "Airlift requires target player and destination"
             
             # Find target player
-            target_player = None
-            for player in self.state.players:
-                if player.name == player_name:
-                    target_player = player
-                    break
-            
+            target_player = state.players_by_name.get(target_player_name)
             if not target_player:
-                return False, f"Player {player_name} not found"
-            
-            # Check if players are in same location
-            if current_player.location != target_player.location:
-                return False, f"{current_player.name} and {target_player.name} must be in the same city to share knowledge"
-            
-            # Handle Researcher's special ability
-            is_researcher = (current_player.role == PlayerRole.RESEARCHER and direction == "give") or \
-                             (target_player.role == PlayerRole.RESEARCHER and direction == "take")
-            
-            # Determine giver and receiver based on direction
-            if direction == "give":
-                giver, receiver = current_player, target_player
-            else:  # "take"
-                giver, receiver = target_player, current_player
+                return False, f"Player {target_player_name} not found"
             
-            # Normal sharing requires card to match current location
-            if not is_researcher and card_name != giver.location:
-                return False, f"Can only share {giver.location} cards when not using Researcher ability"
+            destination_city = state.cities.get(target_city)
+            if destination_city is None:
+                return False, f"City {target_city} not found"
             
-            # Check if giver has the card
-            if not giver.has_city_card(card_name):
-                return False, f"{giver.name} doesn't have the {card_name} card to share"
+            # Move the player directly to the destination
+            target_player.location = destination_city.name
             
-            # Transfer the card
-            giver.remove_card(card_name)
-            receiver.add_card(card_name)
+            # Remove the event card
+            state.discard_from_hand(current_player, event_name)
             
-            if is_researcher:
-                return True, f"Researcher shared {card_name} card from {giver.name} to {receiver.name}"
-            else:
-                return True, f"{giver.name} shared {card_name} card with {receiver.name}"
-        
-        # Discover cure
-        elif action_type == "discover_cure":
-            disease_color_str = action.get("disease_color")
-            card_names = action.get("card_names", [])
+            # Medic special ability for cured diseases
+            self._apply_medic_arrival(target_player, destination_city)
             
-            if not disease_color_str:
-                return False, "No disease color specified for cure discovery"
+            return True, f"{current_player.name} used Airlift to move {target_player.name} to {target_city}"
             
-            # Convert string to enum value
-            try:
-                disease_color = getattr(DiseaseColor, disease_color_str.upper())
-            except (AttributeError, ValueError):
-                return False, f"Invalid disease color: {disease_color_str}"
+        elif event_name == "Government Grant":
+            if not target_city:
+                return False, "Government Grant requires a target city"
             
-            # Check if disease is already cured
-            if self.state.disease_status[disease_color] != DiseaseStatus.ACTIVE:
-                return False, f"The {disease_color.value} disease is already cured"
+            if target_city not in state.cities:
+                return False, f"City {target_city} not found"
             
-            # Check if at a research station
-            if not self.state.cities[current_player.location].has_research_station:
-                return False, f"{current_player.name} must be at a research station to discover a cure"
+            city = state.cities[target_city]
             
-            # Determine required number of cards (Scientist needs only 4)
-            cards_required = 4 if current_player.role == PlayerRole.SCIENTIST else 5
+            # Check if research station already exists
+            if city.has_research_station:
+                return False, f"{target_city} already has a research station"
             
-            # Check if enough cards are provided
-            if len(card_names) < cards_required:
-                return False, f"Need {cards_required} cards of {disease_color.value} color to discover a cure (only {len(card_names)} provided)"
+            # Check if maximum research stations reached
+            if state.placed_research_stations >= state.total_research_stations:
+                return False, f"Maximum number of research stations ({state.total_research_stations}) already built"
             
-            # Check if player has all the specified cards
-            for card in card_names:
-                if not current_player.has_city_card(card):
-                    return False, f"{current_player.name} doesn't have the {card} card"
+            # Build a research station
+            state.add_research_station(city)
             
-            # Check if all cards are of the correct color (simplified - assuming city name corresponds to color)
-            for card in card_names:
-                if card in self.state.cities and self.state.cities[card].color != disease_color:
-                    return False, f"{card} is not a {disease_color.value} city card"
+            # Remove the event card
+            state.discard_from_hand(current_player, event_name)
             
-            # Discard the cards and cure the disease
-            for card in card_names:
-                current_player.remove_card(card)
-                self.state.player_discard.append(PlayerCard(card))
+            return True, f"{current_player.name} used Government Grant to build a research station in {target_city}"
             
-            self.state.disease_status[disease_color] = DiseaseStatus.CURED
+        elif event_name == "One Quiet Night":
+            # Skip the next infection phase
+            state.quiet_night_active = True
             
-            # If Medic is in play, automatically remove cubes of the cured disease
-            for player in self.state.players:
-                if player.role == PlayerRole.MEDIC:
-                    city = self.state.cities[player.location]
-                    cubes_removed = 0
-                    while city.disease_cubes[disease_color] > 0:
-                        city.remove_disease_cube(disease_color)
-                        self.state.disease_cubes[disease_color] += 1
-                        cubes_removed += 1
-                    if cubes_removed > 0:
-                        print(f"Medic automatically removed {cubes_removed} {disease_color.value} cubes from {player.location}")
+            # Remove the event card
+            state.discard_from_hand(current_player, event_name)
             
-            return True, f"{current_player.name} discovered a cure for the {disease_color.value} disease!"
-        
-        # Play event
-        elif action_type == "play_event":
-            event_name = action.get("event_name")
-            if not event_name:
-                return False, "No event card specified"
+            return True, f"{current_player.name} played One Quiet Night - next infection phase will be skipped"
             
-            # Check if player has the event card
-            if event_name not in current_player.hand:
-                return False, f"{current_player.name} doesn't have the {event_name} event card"
+        # TODO: Implement other event cards (Forecast, Resilient Population)
             
-            # Handle different event cards
-            if event_name == "Airlift":
-                target_player_name = action.get("target_player")
-                destination = action.get("target_city")
-                
-                if not target_player_name or not destination:
-                    return False, "Airlift requires target player and destination"
-                
-                # Find target player
-                target_player = None
-                for player in self.state.players:
-                    if player.name == target_player_name:
-                        target_player = player
-                        break
-                
-                if not target_player:
-                    return False, f"Player {target_player_name} not found"
-                
-                if destination not in self.state.cities:
-                    return False, f"City {destination} not found"
-                
-                # Move the player directly to the destination
-                target_player.location = destination
-                
-                # Remove the event card
-                current_player.remove_card(event_name)
-                self.state.player_discard.append(PlayerCard(event_name, is_event=True))
-                
-                # Medic special ability if applicable
-                if target_player.role == PlayerRole.MEDIC:
-                    for color, status in self.state.disease_status.items():
-                        if status == DiseaseStatus.CURED:
-                            city = self.state.cities[destination]
-                            cubes_removed = 0
-                            while city.disease_cubes[color] > 0:
-                                city.remove_disease_cube(color)
-                                self.state.disease_cubes[color] += 1
-                                cubes_removed += 1
-                            if cubes_removed > 0:
-                                print(f"Medic automatically removed {cubes_removed} {color.value} cubes from {destination}")
-                
-                return True, f"{current_player.name} used Airlift to move {target_player.name} to {destination}"
-                
-            elif event_name == "Government Grant":
-                city_name = action.get("target_city")
-                
-                if not city_name:
-                    return False, "Government Grant requires a target city"
-                
-                if city_name not in self.state.cities:
-                    return False, f"City {city_name} not found"
-                
-                city = self.state.cities[city_name]
-                
-                # Check if research station already exists
-                if city.has_research_station:
-                    return False, f"{city_name} already has a research station"
-                
-                # Check if maximum research stations reached
-                if self.state.placed_research_stations >= self.state.total_research_stations:
-                    return False, f"Maximum number of research stations ({self.state.total_research_stations}) already built"
-                
-                # Build a research station
-                city.has_research_station = True
-                self.state.placed_research_stations += 1
-                
-                # Remove the event card
-                current_player.remove_card(event_name)
-                self.state.player_discard.append(PlayerCard(event_name, is_event=True))
-                
-                return True, f"{current_player.name} used Government Grant to build a research station in {city_name}"
-                
-            elif event_name == "One Quiet Night":
-                # Skip the next infection phase
-                self.state.quiet_night_active = True
-                
-                # Remove the event card
-                current_player.remove_card(event_name)
-                self.state.player_discard.append(PlayerCard(event_name, is_event=True))
-                
-                return True, f"{current_player.name} played One Quiet Night - next infection phase will be skipped"
-                
-            # TODO: Implement other event cards (Forecast, Resilient Population)
-                
-            return False, f"Event card {event_name} not fully implemented yet"
-        
-        # Communicate with other players
-        elif action_type == "communicate":
-            message = action.get("message")
-            target_player = action.get("target_player")
+        return False, f"Event card {event_name} not fully implemented yet"
+    
+    def _handle_communicate(self, current_player: Player, action: dict) -> Tuple[bool, str]:
+        """Send a message to one player or to everyone in the same city"""
+        message = action.get("message")
+        target_player = action.get("target_player")
+        
+        if not message:
+            return False, "No message provided for communication"
+        
+        if not target_player:
+            return False, "No target player specified for communication"
+        
+        if target_player == "all":
+            # Send to all players in the same location
+            recipients = self.state.broadcast_message(current_player, message)
+            if not recipients:
+                return False, "No other players in your location to communicate with"
             
-            if not message:
-                return False, "No message provided for communication"
+            recipient_names = [p.name for p in recipients]
+            return True, f"{current_player.name} sent a message to all players in {current_player.location}: {', '.join(recipient_names)}"
+        else:
+            # Send to a specific player
+            target = self.state.players_by_name.get(target_player)
+            if not target:
+                return False, f"Player {target_player} not found"
             
-            if not target_player:
-                return False, "No target player specified for communication"
+            success = self.state.send_message(current_player, target, message)
+            if not success:
+                return False, f"Cannot communicate with {target.name} - must be in the same location"
             
-            if target_player == "all":
-                # Send to all players in the same location
-                recipients = self.state.broadcast_message(current_player, message)
-                if not recipients:
-                    return False, "No other players in your location to communicate with"
-                
-                recipient_names = [p.name for p in recipients]
-                return True, f"{current_player.name} sent a message to all players in {current_player.location}: {', '.join(recipient_names)}"
-            else:
-                # Send to a specific player
-                target = None
-                for player in self.state.players:
-                    if player.name == target_player:
-                        target = player
-                        break
-                
-                if not target:
-                    return False, f"Player {target_player} not found"
-                
-                success = self.state.send_message(current_player, target, message)
-                if not success:
-                    return False, f"Cannot communicate with {target.name} - must be in the same location"
-                
-                return True, f"{current_player.name} sent a message to {target.name}"
-        
-        else:
-            return False, f"Unknown action type: {action_type}"
+            return True, f"{current_player.name} sent a message to {target.name}"
     
     def _infect_cities(self):
         """Draw infection cards and add disease cubes"""
         infection_rate = self.state.infection_rates[self.state.infection_rate_index]
-        print(f"\n🦠 Infecting {infection_rate} cities...")
+        if self.verbose:
+            self._log(f"\n🦠 Infecting {infection_rate} cities...")
         
         for _ in range(infection_rate):
             if not self.state.infection_deck:
                 # Shuffle discard if needed
                 if self.state.infection_discard:
-                    print("Reshuffling infection discard pile...")
-                    self.state.infection_deck = self.state.infection_discard
-                    self.state.infection_discard = []
-                    random.shuffle(self.state.infection_deck)
+                    self._log("Reshuffling infection discard pile...")
+                    self.rng.shuffle(self.state.infection_discard)
+                    self.state.infection_deck = deque(self.state.infection_discard)
+                    self.state.infection_discard.clear()
                 else:
-                    print("No more infection cards!")
+                    self._log("No more infection cards!")
                     break
             
             # Draw an infection card
             infection_card = self.state.infection_deck.pop()
             city = self.state.cities[infection_card.city_name]
             
-            print(f"Infecting {city.name} with {city.color.value} disease")
+            if self.verbose:
+                self._log(f"Infecting {city.name} with {city.color.label} disease")
             
             # Add a disease cube of the city's color
-            self._add_disease_cube(city, city.color)
+            self._add_disease_cubes(city, city.color)
             
             # Add card to discard pile
             self.state.infection_discard.append(infection_card)
     
     def run_game(self, max_turns=10):
-        """Run the game for a maximum number of turns, or until game ends"""
-        print(f"{Colors.BOLD}🌍 Starting Pandemic game with {self.num_players} players at {self.difficulty} difficulty{Colors.ENDC}")
-        print(f"Epidemic cards: {self.num_epidemic_cards}")
+        """Run the game for a maximum number of turns, or until game ends. Returns (game_over, reason, turns played)"""
+        if self.verbose:
+            self._log(f"{Colors.BOLD}🌍 Starting Pandemic game with {self.num_players} players at {self.difficulty} difficulty{Colors.ENDC}")
+            self._log(f"Epidemic cards: {self.num_epidemic_cards}")
         
         turn_counter = 0
         game_over = False
@@ -1078,19 +1133,27 @@ class Game:
         
         while not game_over and turn_counter < max_turns:
             turn_counter += 1
-            print(f"\n{Colors.BOLD}===== TURN {turn_counter} ====={Colors.ENDC}")
+            if self.verbose:
+                self._log(f"\n{Colors.BOLD}===== TURN {turn_counter} ====={Colors.ENDC}")
             
             game_over, reason = self.play_turn()
         
+        self._flush_log()
+        
+        # The result is printed even when the game's progress is not
         if game_over:
             print(f"\n{Colors.BOLD}Game over after {turn_counter} turns: {reason}{Colors.ENDC}")
         else:
             print(f"\n{Colors.BOLD}Maximum turn limit ({max_turns}) reached.{Colors.ENDC}")
             
             # Check the current state to see if victory was achieved
-            all_cured = all(status != DiseaseStatus.ACTIVE for status in self.state.disease_status.values())
+            all_cured = not self.state.active_diseases
             if all_cured:
                 print(f"{Colors.GREEN}Victory! All diseases have been cured.{Colors.ENDC}")
-            else:
+            elif self.verbose:
                 print(f"{Colors.YELLOW}The game did not reach a conclusion. Current state:{Colors.ENDC}")
-                print(self.state.game_state_description()) 
\ No newline at end of file
+                print(self.state.game_state_description())
+            else:
+                print(f"{Colors.YELLOW}The game did not reach a conclusion.{Colors.ENDC}")
+        
+        return game_over, reason, turn_counter
\ No newline at end of file
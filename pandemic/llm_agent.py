@@ -1,233 +1,344 @@
 import os
+import re
+from collections import deque
+from typing import Optional
 from openai import OpenAI
 from game_state import GameState
 from models import DiseaseColor, DiseaseStatus, PlayerRole, City, Player, EventCard
+from response_cache import ResponseCache
 import json
-import time
 import random
 
 # Initialize OpenAI client using Gemini API (adapter mode)
 client = OpenAI(
     api_key=os.getenv("GEMINI_API_KEY"),
-    base_url="https://generativelanguage.googleapis.com/v1beta/openai/"
+    base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
+    max_retries=3,  # Exponential backoff with jitter on rate limits / server errors, honoring Retry-After
+    timeout=20.0  # Fail a stuck request quickly rather than after the SDK's 10 minute default
 )
 
+# Tools for every Pandemic action; the schema never changes, so it is built once
+_PANDEMIC_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "move",
+            "description": "Move your pawn to an adjacent city or use special movement",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "destination": {
+                        "type": "string",
+                        "description": "Name of the city to move to"
+                    },
+                    "movement_type": {
+                        "type": "string",
+                        "enum": ["regular", "direct_flight", "charter_flight", "shuttle_flight", "operations_expert"],
+                        "description": "Type of movement to use"
+                    }
+                },
+                "required": ["destination", "movement_type"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "treat_disease",
+            "description": "Remove disease cubes from your current city",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "disease_color": {
+                        "type": "string",
+                        "enum": ["Blue", "Yellow", "Black", "Red"],
+                        "description": "Color of the disease to treat"
+                    }
+                },
+                "required": ["disease_color"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "build_research_station",
+            "description": "Build a research station in your current city",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "use_operations_expert": {
+                        "type": "boolean",
+                        "description": "Whether to use the Operations Expert ability (no card needed)"
+                    }
+                },
+                "required": ["use_operations_expert"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "share_knowledge",
+            "description": "Give or take a city card to/from another player in the same city",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "card_name": {
+                        "type": "string",
+                        "description": "Name of the city card to share"
+                    },
+                    "player_name": {
+                        "type": "string",
+                        "description": "Name of the player to share with"
+                    },
+                    "direction": {
+                        "type": "string",
+                        "enum": ["give", "take"],
+                        "description": "Whether to give or take the card"
+                    }
+                },
+                "required": ["card_name", "player_name", "direction"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "discover_cure",
+            "description": "Discover a cure for a disease at a research station",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "disease_color": {
+                        "type": "string",
+                        "enum": ["Blue", "Yellow", "Black", "Red"],
+                        "description": "Color of the disease to cure"
+                    },
+                    "card_names": {
+                        "type": "array",
+                        "items": {
+                            "type": "string"
+                        },
+                        "description": "List of city card names to use (5 cards, or 4 if Scientist)"
+                    }
+                },
+                "required": ["disease_color", "card_names"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "play_event",
+            "description": "Play an event card from your hand",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "event_name": {
+                        "type": "string",
+                        "enum": ["Airlift", "Government Grant", "Forecast", "Resilient Population", "One Quiet Night"],
+                        "description": "Name of the event card to play"
+                    },
+                    "target_city": {
+                        "type": "string",
+                        "description": "City name for events that require a target city"
+                    },
+                    "target_player": {
+                        "type": "string",
+                        "description": "Player name for events that require a target player"
+                    },
+                    "additional_args": {
+                        "type": "string",
+                        "description": "Additional arguments as a string for event-specific parameters"
+                    }
+                },
+                "required": ["event_name"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "pass_turn",
+            "description": "Pass your turn without taking any action",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "reason": {
+                        "type": "string",
+                        "description": "Reason for passing"
+                    }
+                },
+                "required": ["reason"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "communicate",
+            "description": "Send a message to other players in your city",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "message": {
+                        "type": "string",
+                        "description": "Message to send"
+                    },
+                    "target_player": {
+                        "type": "string",
+                        "description": "Name of the player to send the message to, or 'all' for all players in the same city"
+                    }
+                },
+                "required": ["message", "target_player"]
+            }
+        }
+    }
+]
+
+# The tool schemas as sent, for response cache keys
+_PANDEMIC_TOOLS_JSON = json.dumps(_PANDEMIC_TOOLS)
+
+# Response cache shared by all agents, opened on first use
+_response_cache = None
+
+def _get_response_cache() -> ResponseCache:
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
+
+# Keywords that identify each action in a text reply, in priority order: the first action
+# with any keyword in the text is chosen. Each action's keywords are one compiled pattern.
+_TEXT_ACTION_KEYWORDS = {
+    "move": ["move", "travel", "go to", "drive", "direct flight", "charter flight", "shuttle flight"],
+    "treat_disease": ["treat", "cure", "remove cube", "treat disease"],
+    "build_research_station": ["build", "research station", "construct"],
+    "share_knowledge": ["share", "give card", "take card", "exchange"],
+    "discover_cure": ["discover cure", "find cure", "develop cure", "cure disease"],
+    "play_event": ["play event", "use event", "event card"],
+    "communicate": ["communicate", "tell", "inform", "message", "chat"],
+    "pass_turn": ["pass", "skip", "end turn"]
+}
+_TEXT_ACTION_PATTERNS = [
+    (action, re.compile("|".join(map(re.escape, keywords)))) for action, keywords in _TEXT_ACTION_KEYWORDS.items()
+]
+
+# Action fields that explain a choice rather than describe it; left out of the recent actions list
+_ACTION_NOTE_FIELDS = ("action_type", "explanation", "reason")
+
+def _action_summary(action: dict) -> str:
+    """One line describing an action, e.g. move(destination=Chicago, movement_type=regular)"""
+    args = ", ".join(f"{key}={value}" for key, value in action.items() if key not in _ACTION_NOTE_FIELDS)
+    return f"{action.get('action_type')}({args})"
+
+# Special abilities of each role, as shown to the agent playing it
+_ROLE_ABILITIES = {
+    PlayerRole.MEDIC: "Medic Special Abilities:\n- Remove ALL cubes of a single color when treating a disease (not just 1)\n- If a disease is cured, automatically remove cubes of that color from your city (free action)\n- These automatic removals also happen when you enter a city or when the cure is discovered",
+
+    PlayerRole.SCIENTIST: "Scientist Special Abilities:\n- You only need 4 city cards of the matching color to discover a cure (instead of 5)",
+
+    PlayerRole.RESEARCHER: "Researcher Special Abilities:\n- You can give ANY city card from your hand to another player in the same city as a single action\n- Normal rules apply when receiving cards from other players",
+
+    PlayerRole.OPERATIONS_EXPERT: "Operations Expert Special Abilities:\n- You can build a research station in your current city without discarding a city card\n- Once per turn, you can move from a research station to any city by discarding any city card",
+
+    PlayerRole.DISPATCHER: "Dispatcher Special Abilities:\n- You can move another player's pawn as if it were your own\n- You can dispatch any pawn to a city containing another pawn\n- When moving another player's pawn, use their cards for Direct and Charter flights",
+
+    PlayerRole.QUARANTINE_SPECIALIST: "Quarantine Specialist Special Abilities:\n- Prevent disease cube placement and outbreaks in your current city and all connected cities",
+
+    PlayerRole.CONTINGENCY_PLANNER: "Contingency Planner Special Abilities:\n- As an action, take an Event card from the discard pile and store it on your role card\n- When you play the stored Event card, remove it from the game\n- Only 1 Event card can be on your role card at a time"
+}
+
 class LLMAgent:
-    def __init__(self, player, model: str = "gemini-2.0-flash-lite"):
+    def __init__(self, player, model: str = "gemini-2.0-flash-lite", cache: bool = False, fast_path: bool = False):
         self.player = player
         self.model = model
-        self.conversation_history = []
-        self.retry_count = 0
-        self.max_retries = 3
+        # Take actions that are clearly right (see _obvious_action) without asking the model.
+        # Off by default so evaluations measure the model's own choices.
+        self.fast_path = fast_path
+        # Optional on-disk cache of chosen actions. Sampling is made greedy when caching so a
+        # cached answer is the one the model would give again.
+        self.cache = _get_response_cache() if cache else None
+        self.temperature = 0 if cache else 0.2
+        # One-line summaries of the actions this agent chose most recently, oldest first. Sent
+        # instead of earlier prompts and replies, which repeated the whole game state each time.
+        self.recent_actions = deque(maxlen=6)
+        # The part of the system prompt that never changes for this player. It is sent first
+        # so the prompt prefix stays byte-identical across turns. Built on the first request,
+        # once the board exists.
+        self._static_system_prompt = None
     
     def get_action(self, game_state: GameState) -> dict:
         """Use LLM to determine the next action for this player using tools API"""
         if self.player != game_state.get_current_player():
             return {"action_type": "skip", "reason": "Not my turn"}
         
-        # Reset retry count for each new action request
-        self.retry_count = 0
+        if self.fast_path:
+            action = self._obvious_action(game_state)
+            if action is not None:
+                self.recent_actions.append(_action_summary(action))
+                return action
         
         # Check for unread messages
         unread_messages = self.player.messages
         message_summary = ""
         if unread_messages:
-            message_summary = "\n\n📬 You have received the following messages:\n"
-            for i, msg in enumerate(unread_messages):
-                message_summary += f"{i+1}. From {msg['sender']}: \"{msg['content']}\"\n"
+            message_summary = "\n\n📬 You have received the following messages:\n" + "".join(
+                f"{i+1}. From {msg.sender}: \"{msg.content}\"\n" for i, msg in enumerate(unread_messages)
+            )
             
             # Clear messages after reading
             self.player.messages = []
         
+        if self._static_system_prompt is None:
+            self._static_system_prompt = self._build_static_system_prompt(game_state)
+        
         # Try using the tool-based approach (more structured)
-        tools = self._get_pandemic_tools()
-        return self._try_tool_based_approach(tools, game_state, message_summary)
+        action = self._try_tool_based_approach(_PANDEMIC_TOOLS, game_state, message_summary)
+        self.recent_actions.append(_action_summary(action))
+        return action
     
-    def _get_pandemic_tools(self):
-        """Define the tools available to the LLM for Pandemic game actions"""
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": "move",
-                    "description": "Move your pawn to an adjacent city or use special movement",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "destination": {
-                                "type": "string",
-                                "description": "Name of the city to move to"
-                            },
-                            "movement_type": {
-                                "type": "string",
-                                "enum": ["regular", "direct_flight", "charter_flight", "shuttle_flight", "operations_expert"],
-                                "description": "Type of movement to use"
-                            }
-                        },
-                        "required": ["destination", "movement_type"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "treat_disease",
-                    "description": "Remove disease cubes from your current city",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "disease_color": {
-                                "type": "string",
-                                "enum": ["Blue", "Yellow", "Black", "Red"],
-                                "description": "Color of the disease to treat"
-                            }
-                        },
-                        "required": ["disease_color"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "build_research_station",
-                    "description": "Build a research station in your current city",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "use_operations_expert": {
-                                "type": "boolean",
-                                "description": "Whether to use the Operations Expert ability (no card needed)"
-                            }
-                        },
-                        "required": ["use_operations_expert"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "share_knowledge",
-                    "description": "Give or take a city card to/from another player in the same city",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "card_name": {
-                                "type": "string",
-                                "description": "Name of the city card to share"
-                            },
-                            "player_name": {
-                                "type": "string",
-                                "description": "Name of the player to share with"
-                            },
-                            "direction": {
-                                "type": "string",
-                                "enum": ["give", "take"],
-                                "description": "Whether to give or take the card"
-                            }
-                        },
-                        "required": ["card_name", "player_name", "direction"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "discover_cure",
-                    "description": "Discover a cure for a disease at a research station",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "disease_color": {
-                                "type": "string",
-                                "enum": ["Blue", "Yellow", "Black", "Red"],
-                                "description": "Color of the disease to cure"
-                            },
-                            "card_names": {
-                                "type": "array",
-                                "items": {
-                                    "type": "string"
-                                },
-                                "description": "List of city card names to use (5 cards, or 4 if Scientist)"
-                            }
-                        },
-                        "required": ["disease_color", "card_names"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "play_event",
-                    "description": "Play an event card from your hand",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "event_name": {
-                                "type": "string",
-                                "enum": ["Airlift", "Government Grant", "Forecast", "Resilient Population", "One Quiet Night"],
-                                "description": "Name of the event card to play"
-                            },
-                            "target_city": {
-                                "type": "string",
-                                "description": "City name for events that require a target city"
-                            },
-                            "target_player": {
-                                "type": "string",
-                                "description": "Player name for events that require a target player"
-                            },
-                            "additional_args": {
-                                "type": "string",
-                                "description": "Additional arguments as a string for event-specific parameters"
-                            }
-                        },
-                        "required": ["event_name"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "pass_turn",
-                    "description": "Pass your turn without taking any action",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "reason": {
-                                "type": "string",
-                                "description": "Reason for passing"
-                            }
-                        },
-                        "required": ["reason"]
-                    }
-                }
-            },
-            {
-                "type": "function",
-                "function": {
-                    "name": "communicate",
-                    "description": "Send a message to other players in your city",
-                    "parameters": {
-                        "type": "object",
-                        "properties": {
-                            "message": {
-                                "type": "string",
-                                "description": "Message to send"
-                            },
-                            "target_player": {
-                                "type": "string",
-                                "description": "Name of the player to send the message to, or 'all' for all players in the same city"
-                            }
-                        },
-                        "required": ["message", "target_player"]
-                    }
-                }
-            }
-        ]
+    def _obvious_action(self, game_state: GameState) -> Optional[dict]:
+        """An action that is clearly right in the current state, or None if the model should decide"""
+        player = self.player
+        city = game_state.cities[player.location]
+        
+        # Discover a cure as soon as it is possible: at a research station with enough
+        # city cards of an uncured disease
+        if city.has_research_station:
+            needed = 4 if player.role is PlayerRole.SCIENTIST else 5
+            cards_by_color = [[] for _ in DiseaseColor]
+            for card in player.hand:
+                card_city = game_state.cities.get(card)
+                if card_city is not None:
+                    cards_by_color[card_city.color].append(card)
+            for color, cards in zip(DiseaseColor, cards_by_color):
+                if len(cards) >= needed and game_state.disease_status[color] is DiseaseStatus.ACTIVE:
+                    return {"disease_color": color.label, "card_names": cards[:needed], "action_type": "discover_cure",
+                            "explanation": f"Fast path: {needed} {color.label} cards at a research station"}
+        
+        # Treat a city holding 2 or more cubes of one color, the most common color first
+        count, color = max(zip(city.disease_cubes, DiseaseColor), key=lambda pair: pair[0])
+        if count >= 2:
+            return {"disease_color": color.label, "action_type": "treat_disease",
+                    "explanation": f"Fast path: {count} {color.label} cubes in {city.name}"}
+        
+        return None
     
-    def _try_tool_based_approach(self, tools, game_state, message_summary=""):
-        """Use the LLM with defined tools to generate an action"""
-        # Create prompt with game state
-        system_prompt = f"""You are an AI agent playing the Pandemic board game as {self.player.name} with the role {self.player.role.value}.
+    def _build_static_system_prompt(self, game_state: GameState) -> str:
+        """Instructions, this player's role abilities and the city connections map, none of which change"""
+        # Group cities by color for better organization
+        cities_by_color = [[] for _ in DiseaseColor]
+        for city_name, city in game_state.cities.items():
+            cities_by_color[city.color].append(f"{city_name}: {', '.join(city.connections)}")
+        city_connections_desc = "CITY CONNECTIONS MAP (grouped by color):\n" + "\n\n".join(
+            f"{color.name} CITIES:\n" + "\n".join(cities_by_color[color]) for color in DiseaseColor
+        )
+        
+        role_abilities = _ROLE_ABILITIES.get(self.player.role, "No special abilities")
+        
+        return f"""You are an AI agent playing the Pandemic board game as {self.player.name} with the role {self.player.role.value}.
 
 YOU MUST analyze the game state carefully and make the best strategic decision. Focus on:
 1. Treating diseases in highly infected areas
@@ -240,87 +351,47 @@ YOU MUST analyze the game state carefully and make the best strategic decision.
 Only take actions that are legal in the Pandemic board game.
 Do not fabricate actions or invent new mechanics.
 Use an action that costs 1 action point (out of your 4 per turn).
-"""
 
+{role_abilities}
+
+{city_connections_desc}
+"""
+    
+    def _try_tool_based_approach(self, tools, game_state, message_summary=""):
+        """Use the LLM with defined tools to generate an action"""
         # Create detailed game state description
         game_state_description = game_state.game_state_description()
         
-        # Get current player's role and special abilities
-        role_abilities = self._get_role_abilities(self.player.role)
-        
-        # Get description of cities connected to the player's location
+        # Get description of cities connected to the player's location. Only neighbors on the
+        # board are listed; some connections name cities this simplified board leaves out.
         current_city = game_state.cities[self.player.location]
-        connected_cities = []
-        for city_name in current_city.connections:
-            city = game_state.cities[city_name]
-            disease_counts = [f"{color.value}: {count}" for color, count in city.disease_cubes.items() if count > 0]
-            disease_info = ", ".join(disease_counts) if disease_counts else "No diseases"
-            station_info = "Has research station" if city.has_research_station else "No research station"
-            connected_cities.append(f"{city_name} ({city.color.value}) - {disease_info} - {station_info}")
-        
-        connected_cities_desc = "\n".join(connected_cities)
-        
-        # Create a compact view of all city connections
-        city_connections_map = {}
-        for city_name, city in game_state.cities.items():
-            # Format: City (Color): Connected City 1, Connected City 2, ...
-            connections_str = ", ".join(city.connections)
-            city_connections_map[f"{city_name} ({city.color.value})"] = connections_str
-        
-        # Group cities by color for better organization
-        blue_cities = []
-        yellow_cities = []
-        black_cities = []
-        red_cities = []
-        
-        for city_name, city in game_state.cities.items():
-            entry = f"{city_name}: {', '.join(city.connections)}"
-            if city.color == DiseaseColor.BLUE:
-                blue_cities.append(entry)
-            elif city.color == DiseaseColor.YELLOW:
-                yellow_cities.append(entry)
-            elif city.color == DiseaseColor.BLACK:
-                black_cities.append(entry)
-            elif city.color == DiseaseColor.RED:
-                red_cities.append(entry)
-        
-        # Create a compact city connections description
-        city_connections_desc = "CITY CONNECTIONS MAP (grouped by color):\n"
-        city_connections_desc += "BLUE CITIES:\n" + "\n".join(blue_cities) + "\n\n"
-        city_connections_desc += "YELLOW CITIES:\n" + "\n".join(yellow_cities) + "\n\n"
-        city_connections_desc += "BLACK CITIES:\n" + "\n".join(black_cities) + "\n\n"
-        city_connections_desc += "RED CITIES:\n" + "\n".join(red_cities)
+        connected_cities_desc = "\n".join(
+            f"{city.name} ({city.color.label}) - "
+            f"{', '.join(f'{color.label}: {count}' for color, count in zip(DiseaseColor, city.disease_cubes) if count) or 'No diseases'} - "
+            f"{'Has research station' if city.has_research_station else 'No research station'}"
+            for city in current_city.neighbors
+        )
         
         # Create a list of players in the same city
         players_in_same_city = [p for p in game_state.players if p.location == self.player.location and p != self.player]
         players_desc = ""
         if players_in_same_city:
-            players_desc = "Players in your city:\n"
-            for p in players_in_same_city:
-                players_desc += f"- {p.name} ({p.role.value})\n"
-        
-        # Create color-coded disease status
-        disease_statuses = []
-        for color, status in game_state.disease_status.items():
-            cubes_remaining = game_state.disease_cubes[color]
-            disease_statuses.append(f"{color.value}: {status.value} (Cubes in supply: {cubes_remaining}/24)")
+            players_desc = "Players in your city:\n" + "".join(f"- {p.display_label}\n" for p in players_in_same_city)
         
-        disease_status_desc = "\n".join(disease_statuses)
+        recent_actions_desc = ""
+        if self.recent_actions:
+            recent_actions_desc = "Your recent actions (oldest first):\n" + "\n".join(f"- {summary}" for summary in self.recent_actions) + "\n"
         
-        # Describe cities with research stations
-        research_stations = [city for city in game_state.cities.values() if city.has_research_station]
-        stations_desc = "Research Stations:\n"
-        for city in research_stations:
-            stations_desc += f"- {city.name}\n"
+        # Cubes left in supply. The game state description already lists each disease's
+        # status and the research stations, so they are not repeated here.
+        supply_desc = ", ".join(f"{color.label}: {count}/24" for color, count in zip(DiseaseColor, game_state.disease_cubes))
         
         # Create message with all this information
         user_message = f"""Current Game State:
 {game_state_description}
 
-{role_abilities}
-
-Your current city: {current_city.name} ({current_city.color.value})
-Disease cubes here: {', '.join([f"{color.value}: {count}" for color, count in current_city.disease_cubes.items() if count > 0]) or "None"}
+Your current city: {current_city.name} ({current_city.color.label})
+Disease cubes here: {', '.join([f"{color.label}: {count}" for color, count in zip(DiseaseColor, current_city.disease_cubes) if count > 0]) or "None"}
 Research station here: {"Yes" if current_city.has_research_station else "No"}
 
 Connected cities:
@@ -328,10 +399,7 @@ Connected cities:
 
 {players_desc}
 
-Disease Status:
-{disease_status_desc}
-
-{stations_desc}
+Disease cubes in supply: {supply_desc}
 
 Cards in your hand:
 {', '.join(self.player.hand) or "No cards"}
@@ -339,111 +407,110 @@ Cards in your hand:
 You have {self.player.action_points} action points remaining.
 {message_summary}
 
-{city_connections_desc}
-
+{recent_actions_desc}
 What action would you like to take now? Choose the single best action.
 """
 
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": self._static_system_prompt},
             {"role": "user", "content": user_message}
         ]
         
-        # Add conversation history for context (limited to last few exchanges)
-        if len(self.conversation_history) > 0:
-            # Insert conversation history before the current query
-            valid_history = []
-            for history_item in self.conversation_history[-6:]:  # Last 3 exchanges (6 messages)
-                # Ensure content is not empty
-                if history_item.get("content") and len(history_item["content"].strip()) > 0:
-                    valid_history.append(history_item)
-            
-            # Insert valid history items
-            for i, history_item in enumerate(valid_history):
-                messages.insert(i + 1, history_item)
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ResponseCache.make_key(self.model, self._static_system_prompt, user_message, _PANDEMIC_TOOLS_JSON)
+            action = self.cache.get(cache_key)
+            if action is not None:
+                return action
         
         try:
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                tools=tools,
-                temperature=0.2,
-                max_tokens=800,
-                tool_choice="auto"
-            )
-            
-            # Save the interaction in history
-            self.conversation_history.append({"role": "user", "content": user_message})
-            response_message = response.choices[0].message
-            
-            # Ensure content is not None before adding to history
-            content_to_save = response_message.content or ""
-            self.conversation_history.append({"role": "assistant", "content": content_to_save})
+            # Stream the response so we can stop as soon as the tool call is complete
+            content, function_name, function_args = self._stream_tool_call(messages, tools)
             
             # Check for tool calls
-            if response_message.tool_calls:
-                tool_call = response_message.tool_calls[0]
-                action_info = json.loads(tool_call.function.arguments)
-                action_info["action_type"] = tool_call.function.name
-                action_info["explanation"] = response_message.content or "No explanation provided"
-                return action_info
+            if function_name:
+                action_info = function_args
+                action_info["action_type"] = function_name
+                action_info["explanation"] = content or "No explanation provided"
             else:
                 # No tool was called, manually extract action from text
-                return self._get_default_action(response_message.content or "")
+                action_info = self._get_default_action(content or "")
+            
+            if cache_key is not None:
+                self.cache.put(cache_key, action_info)
+            return action_info
                 
         except Exception as e:
-            self.retry_count += 1
-            if self.retry_count < self.max_retries:
-                print(f"Error: {e}. Retrying... ({self.retry_count}/{self.max_retries})")
-                time.sleep(1)
-                return self._try_tool_based_approach(tools, game_state, message_summary)
-            else:
-                print(f"Failed after {self.max_retries} attempts. Error: {e}")
-                return {"action_type": "pass_turn", "reason": f"Error: {str(e)}"}
+            # Transient API errors were already retried by the client
+            print(f"LLM request failed for {self.player.name}: {e}")
+            return {"action_type": "pass_turn", "reason": f"Error: {str(e)}"}
+    
+    def _stream_tool_call(self, messages, tools):
+        """
+        Request a tool call with streaming and return (content, function_name, parsed arguments).
+        
+        Reading stops as soon as the first tool call's arguments form complete JSON; only
+        one tool call is used, so the rest of the generation is not waited for.
+        """
+        stream = client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            tools=tools,
+            temperature=self.temperature,
+            max_tokens=250,  # A tool call with its arguments fits easily; longer replies only add decode time
+            tool_choice="required",  # Always answer with a tool call
+            stream=True
+        )
+        
+        content_parts = []
+        function_name = None
+        arguments = ""
+        function_args = None
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta.content:
+                    content_parts.append(delta.content)
+                if not delta.tool_calls:
+                    continue
+                
+                tool_call = delta.tool_calls[0]
+                if tool_call.index:  # A second tool call started, the first one is done
+                    break
+                if tool_call.function:
+                    if tool_call.function.name:
+                        function_name = tool_call.function.name
+                    if tool_call.function.arguments:
+                        arguments += tool_call.function.arguments
+                
+                # Stop once the arguments are a complete JSON object
+                if function_name and arguments.rstrip().endswith("}"):
+                    try:
+                        function_args = json.loads(arguments)
+                        break
+                    except json.JSONDecodeError:
+                        pass
+        finally:
+            stream.close()
+        
+        if function_name and function_args is None:
+            function_args = json.loads(arguments or "{}")
+        return "".join(content_parts) or None, function_name, function_args
     
     def _get_default_action(self, content):
         """Extract a default action from the LLM's text response"""
-        action_mapping = {
-            "move": ["move", "travel", "go to", "drive", "direct flight", "charter flight", "shuttle flight"],
-            "treat_disease": ["treat", "cure", "remove cube", "treat disease"],
-            "build_research_station": ["build", "research station", "construct"],
-            "share_knowledge": ["share", "give card", "take card", "exchange"],
-            "discover_cure": ["discover cure", "find cure", "develop cure", "cure disease"],
-            "play_event": ["play event", "use event", "event card"],
-            "communicate": ["communicate", "tell", "inform", "message", "chat"],
-            "pass_turn": ["pass", "skip", "end turn"]
-        }
-        
         # Default to pass action if we can't determine anything
         action_type = "pass_turn"
         reason = "Unable to determine action from response"
         
         # Try to identify the action from the content
         content_lower = content.lower()
-        for action, keywords in action_mapping.items():
-            if any(keyword in content_lower for keyword in keywords):
+        for action, pattern in _TEXT_ACTION_PATTERNS:
+            if pattern.search(content_lower):
                 action_type = action
                 reason = content
                 break
         
         return {"action_type": action_type, "reason": reason}
-    
-    def _get_role_abilities(self, role: PlayerRole) -> str:
-        """Get a description of the player's role abilities"""
-        abilities = {
-            PlayerRole.MEDIC: "Medic Special Abilities:\n- Remove ALL cubes of a single color when treating a disease (not just 1)\n- If a disease is cured, automatically remove cubes of that color from your city (free action)\n- These automatic removals also happen when you enter a city or when the cure is discovered",
-            
-            PlayerRole.SCIENTIST: "Scientist Special Abilities:\n- You only need 4 city cards of the matching color to discover a cure (instead of 5)",
-            
-            PlayerRole.RESEARCHER: "Researcher Special Abilities:\n- You can give ANY city card from your hand to another player in the same city as a single action\n- Normal rules apply when receiving cards from other players",
-            
-            PlayerRole.OPERATIONS_EXPERT: "Operations Expert Special Abilities:\n- You can build a research station in your current city without discarding a city card\n- Once per turn, you can move from a research station to any city by discarding any city card",
-            
-            PlayerRole.DISPATCHER: "Dispatcher Special Abilities:\n- You can move another player's pawn as if it were your own\n- You can dispatch any pawn to a city containing another pawn\n- When moving another player's pawn, use their cards for Direct and Charter flights",
-            
-            PlayerRole.QUARANTINE_SPECIALIST: "Quarantine Specialist Special Abilities:\n- Prevent disease cube placement and outbreaks in your current city and all connected cities",
-            
-            PlayerRole.CONTINGENCY_PLANNER: "Contingency Planner Special Abilities:\n- As an action, take an Event card from the discard pile and store it on your role card\n- When you play the stored Event card, remove it from the game\n- Only 1 Event card can be on your role card at a time"
-        }
-        
-        return abilities.get(role, "No special abilities") 
\ No newline at end of file
@@ -10,6 +10,9 @@ if __name__ == "__main__":
     parser.add_argument('--turns', type=int, default=2, help='Maximum number of turns')
     parser.add_argument('--seed', type=int, default=None, help='Random seed for deterministic behavior (default: random)')
     parser.add_argument('--deterministic', action='store_true', help='Use deterministic mode with default seed 42')
+    parser.add_argument('--quiet', action='store_true', help='Do not print the game\'s progress (turns, states, actions); the final result is still printed')
+    parser.add_argument('--cache', action='store_true', help='Reuse LLM answers for identical prompts from an on-disk cache (llm_response_cache.sqlite)')
+    parser.add_argument('--fast-path', action='store_true', help='Take clearly right actions (cures, treating 2+ cubes) without asking the LLM')
     
     args = parser.parse_args()
     
@@ -21,7 +24,10 @@ if __name__ == "__main__":
     game = Game(
         num_players=args.players,
         difficulty=args.difficulty,
-        seed=args.seed
+        seed=args.seed,
+        verbose=not args.quiet,
+        cache=args.cache,
+        fast_path=args.fast_path
     )
     
     # Run the game with the specified number of turns
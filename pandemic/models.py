@@ -1,6 +1,6 @@
 import os
 import random
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import List, Dict, Tuple, Optional, Set
 
 class DiseaseStatus(Enum):
@@ -8,11 +8,18 @@ class DiseaseStatus(Enum):
     CURED = "Cured"
     ERADICATED = "Eradicated"
 
-class DiseaseColor(Enum):
-    BLUE = "Blue"
-    YELLOW = "Yellow"
-    BLACK = "Black"
-    RED = "Red"
+class DiseaseColor(IntEnum):
+    # Dense 0..3 values so per-color counts can be plain lists indexed by color; .label is the display name
+    BLUE = 0, "Blue"
+    YELLOW = 1, "Yellow"
+    BLACK = 2, "Black"
+    RED = 3, "Red"
+    
+    def __new__(cls, value: int, label: str):
+        obj = int.__new__(cls, value)
+        obj._value_ = value
+        obj.label = label
+        return obj
 
 class EventCard(Enum):
     AIRLIFT = "Airlift"
@@ -31,64 +38,110 @@ class PlayerRole(Enum):
     CONTINGENCY_PLANNER = "Contingency Planner"
 
 class City:
+    __slots__ = ("name", "color", "connections", "connections_set", "neighbors", "disease_cubes",
+                 "has_research_station", "total_cubes", "board_index")
+    
     def __init__(self, name: str, color: DiseaseColor, connections: List[str] = None):
         self.name = name
         self.color = color
         self.connections = connections or []
-        self.disease_cubes = {
-            DiseaseColor.BLUE: 0,
-            DiseaseColor.YELLOW: 0,
-            DiseaseColor.BLACK: 0,
-            DiseaseColor.RED: 0
-        }
+        self.connections_set = frozenset(self.connections)  # For O(1) "is this adjacent?" checks
+        self.neighbors: List["City"] = []  # Connected City objects, resolved once the board is built
+        self.disease_cubes = [0] * len(DiseaseColor)  # Cube counts indexed by DiseaseColor
         self.has_research_station = False
+        self.total_cubes = 0  # Sum of disease_cubes, kept in step by add/remove_disease_cube
+        self.board_index = 0  # Position in the board's city order, set once the board is built
     
     def add_disease_cube(self, color: DiseaseColor) -> bool:
         """Adds a disease cube to the city. Returns False if outbreak occurs (4th cube)"""
         if self.disease_cubes[color] >= 3:
             return False  # Outbreak
         self.disease_cubes[color] += 1
+        self.total_cubes += 1
         return True
     
+    def add_disease_cubes(self, color: DiseaseColor, count: int) -> int:
+        """Adds up to count cubes without going past 3. Returns how many were added."""
+        added = min(count, 3 - self.disease_cubes[color])
+        self.disease_cubes[color] += added
+        self.total_cubes += added
+        return added
+    
     def remove_disease_cube(self, color: DiseaseColor) -> bool:
         """Removes a disease cube from the city. Returns False if no cubes to remove."""
         if self.disease_cubes[color] <= 0:
             return False
         self.disease_cubes[color] -= 1
+        self.total_cubes -= 1
         return True
     
+    def clear_disease_cubes(self, color: DiseaseColor) -> int:
+        """Removes all cubes of a color from the city. Returns how many were removed."""
+        removed = self.disease_cubes[color]
+        self.disease_cubes[color] = 0
+        self.total_cubes -= removed
+        return removed
+    
     def get_total_disease_cubes(self) -> int:
         """Returns the total number of disease cubes in the city"""
-        return sum(self.disease_cubes.values())
+        return self.total_cubes
     
     def __str__(self):
-        return f"{self.name} ({self.color.value})"
+        return f"{self.name} ({self.color.label})"
 
 class Player:
+    __slots__ = ("name", "role", "location", "hand", "action_points", "messages", "display_label", "agent")
+    
     def __init__(self, name: str, role: PlayerRole, location: str):
         self.name = name
         self.role = role
         self.location = location  # City name
-        self.hand: List[str] = []  # List of city cards and event cards
+        # City and event cards in the order they were received: card name -> copies held
+        self.hand: Dict[str, int] = {}
         self.action_points = 4  # Each player gets 4 actions per turn
         self.messages = []  # Store messages received from other players
+        self.display_label = f"{name} ({role.value})"  # "Player 1 (Medic)", used in messages and prompts
+        self.agent = None  # LLMAgent choosing this player's actions, set when the game creates its players
     
     def add_card(self, card: str):
-        self.hand.append(card)
+        self.hand[card] = self.hand.get(card, 0) + 1
     
     def remove_card(self, card: str) -> bool:
-        if card in self.hand:
-            self.hand.remove(card)
-            return True
-        return False
+        count = self.hand.get(card, 0)
+        if count == 0:
+            return False
+        if count == 1:
+            del self.hand[card]
+        else:
+            self.hand[card] = count - 1
+        return True
     
     def has_city_card(self, city_name: str) -> bool:
         return city_name in self.hand
     
+    def hand_size(self) -> int:
+        return sum(self.hand.values())
+    
+    def first_card(self) -> str:
+        """The card held longest"""
+        return next(iter(self.hand))
+    
     def __str__(self):
-        return f"{self.name} ({self.role.value}) at {self.location}"
+        return f"{self.display_label} at {self.location}"
+
+class Message:
+    """A message between two players, shared by the receiver's queue and the game's history"""
+    __slots__ = ("sender", "receiver", "content", "timestamp")
+    
+    def __init__(self, sender: str, receiver: str, content: str, timestamp: float):
+        self.sender = sender  # Display labels, e.g. "Player 1 (Medic)"
+        self.receiver = receiver
+        self.content = content
+        self.timestamp = timestamp
 
 class InfectionCard:
+    __slots__ = ("city_name",)
+    
     def __init__(self, city_name: str):
         self.city_name = city_name
     
@@ -96,6 +149,8 @@ class InfectionCard:
         return f"Infection: {self.city_name}"
 
 class PlayerCard:
+    __slots__ = ("name", "is_epidemic", "is_event")
+    
     def __init__(self, name: str, is_epidemic: bool = False, is_event: bool = False):
         self.name = name
         self.is_epidemic = is_epidemic
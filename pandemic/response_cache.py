@@ -0,0 +1,36 @@
+import hashlib
+import json
+import sqlite3
+from typing import Optional
+
+class ResponseCache:
+    """
+    On-disk cache of the actions agents chose, keyed by a hash of everything sent to the model.
+
+    Replaying the same game (same seed) produces the same prompts, so repeated runs can
+    skip the API calls entirely. Entries are stored as JSON text.
+    """
+
+    def __init__(self, path: str = "llm_response_cache.sqlite"):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT)")
+        self.connection.commit()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the request parts (prompts, model, tools) into a cache key"""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(part.encode())
+            digest.update(b"\0")  # Separator, so moving text between parts changes the key
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        row = self.connection.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, action: dict):
+        self.connection.execute("INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                                (key, json.dumps(action)))
+        self.connection.commit()